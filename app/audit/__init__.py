@@ -0,0 +1,3 @@
+from app.audit.log import AuditLog, audit_log
+
+__all__ = ["AuditLog", "audit_log"]
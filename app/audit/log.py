@@ -0,0 +1,312 @@
+import asyncio
+import base64
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Deque, Dict, Any, Iterator, List, Optional, Tuple
+
+from bson import ObjectId, json_util
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError, CollectionInvalid, DuplicateKeyError, PyMongoError
+
+from app.config import settings
+from app.database import DatabaseManager, db_manager
+from app.monitoring.metrics import audit_buffer_depth, audit_events_total, audit_flush_duration_seconds
+
+
+STORAGE_MODES = ("collection", "timeseries", "capped")
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "spill")
+DUPLICATE_KEY = 11000
+
+
+class AuditLog:
+    def __init__(
+        self,
+        db: DatabaseManager,
+        collection_name: str = settings.AUDIT_COLLECTION,
+        storage: str = settings.AUDIT_STORAGE,
+        batch_size: int = settings.AUDIT_BATCH_SIZE,
+        flush_interval: float = settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+        max_buffer: int = settings.AUDIT_MAX_BUFFER,
+        overflow_policy: str = settings.AUDIT_OVERFLOW_POLICY,
+        spill_path: str = settings.AUDIT_SPILL_PATH,
+        enabled: bool = settings.AUDIT_ENABLED
+    ):
+        if storage not in STORAGE_MODES:
+            raise ValueError(f"Unknown audit storage '{storage}'. Expected one of {', '.join(STORAGE_MODES)}")
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown audit overflow policy '{overflow_policy}'. Expected one of {', '.join(OVERFLOW_POLICIES)}")
+        self.db = db
+        self.collection_name = collection_name
+        self.storage = storage
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.overflow_policy = overflow_policy
+        self.spill_path = spill_path
+        self.enabled = enabled
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._collection: Optional[Collection] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @property
+    def collection(self) -> Collection:
+        if self._collection is None:
+            self._collection = self.ensure_collection()
+        return self._collection
+    
+    def ensure_collection(self) -> Collection:
+        db = self.db.get_master_db()
+        if not db.list_collection_names(filter={"name": self.collection_name}):
+            options: Dict[str, Any] = {}
+            if self.storage == "timeseries":
+                options["timeseries"] = {"timeField": "timestamp", "metaField": "meta", "granularity": "seconds"}
+                if settings.AUDIT_TTL_SECONDS:
+                    options["expireAfterSeconds"] = int(settings.AUDIT_TTL_SECONDS)
+            elif self.storage == "capped":
+                options.update(capped=True, size=settings.AUDIT_CAPPED_SIZE_BYTES)
+            try:
+                db.create_collection(self.collection_name, **options)
+            except CollectionInvalid:
+                pass
+            except NotImplementedError:
+                db.create_collection(self.collection_name)
+        
+        collection = db[self.collection_name]
+        collection.create_index([("meta.organization_name", 1), ("timestamp", -1), ("_id", -1)])
+        collection.create_index([("timestamp", -1), ("_id", -1)])
+        if self.storage == "collection" and settings.AUDIT_TTL_SECONDS:
+            collection.create_index("timestamp", expireAfterSeconds=int(settings.AUDIT_TTL_SECONDS))
+        return collection
+    
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._loop = None
+        await asyncio.to_thread(self.flush_all)
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await asyncio.to_thread(self.flush_all)
+    
+    def _notify(self) -> None:
+        if self._loop is not None and self._wakeup is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+    
+    def record(
+        self,
+        action: str,
+        outcome: str = "success",
+        organization_name: Optional[str] = None,
+        actor: Optional[Dict[str, Any]] = None,
+        **details: Any
+    ) -> None:
+        if not self.enabled:
+            return
+        event = {
+            "_id": ObjectId(),
+            "timestamp": datetime.utcnow(),
+            "meta": {"action": action, "organization_name": organization_name},
+            "outcome": outcome,
+            "actor": actor or {},
+            "details": details
+        }
+        overflow: List[Dict[str, Any]] = []
+        with self._lock:
+            self._buffer.append(event)
+            while len(self._buffer) > self.max_buffer:
+                overflow.append(self._buffer.pop() if self.overflow_policy == "drop_newest" else self._buffer.popleft())
+            depth = len(self._buffer)
+        audit_events_total.inc(outcome="buffered")
+        audit_buffer_depth.set(depth)
+        if overflow:
+            self._overflow(overflow)
+        if depth >= self.batch_size:
+            self._notify()
+    
+    @contextmanager
+    def track(self, action: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+        event = dict(fields)
+        try:
+            yield event
+        except Exception as e:
+            status_code = getattr(e, "status_code", 500)
+            self.record(action, outcome="failure", status_code=status_code, error=str(getattr(e, "detail", e)), **event)
+            raise
+        self.record(action, **event)
+    
+    def _overflow(self, events: List[Dict[str, Any]]) -> None:
+        if self.overflow_policy != "spill":
+            audit_events_total.inc(len(events), outcome="dropped")
+            return
+        try:
+            with self._spill_lock, open(self.spill_path, "a") as spill:
+                for event in events:
+                    spill.write(json_util.dumps(event) + "\n")
+            audit_events_total.inc(len(events), outcome="spilled")
+        except OSError:
+            audit_events_total.inc(len(events), outcome="dropped")
+    
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        started = time.perf_counter()
+        try:
+            self.collection.insert_many(batch, ordered=False)
+        except BulkWriteError as e:
+            if any(error.get("code") != DUPLICATE_KEY for error in e.details.get("writeErrors", [])):
+                raise
+        except DuplicateKeyError:
+            pass
+        audit_flush_duration_seconds.observe(time.perf_counter() - started)
+    
+    def flush(self) -> int:
+        with self._lock:
+            batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+        if not batch:
+            return 0
+        
+        try:
+            self._write(batch)
+        except PyMongoError:
+            overflow: List[Dict[str, Any]] = []
+            with self._lock:
+                self._buffer.extendleft(reversed(batch))
+                while len(self._buffer) > self.max_buffer:
+                    overflow.append(self._buffer.pop() if self.overflow_policy == "drop_newest" else self._buffer.popleft())
+                depth = len(self._buffer)
+            audit_buffer_depth.set(depth)
+            if overflow:
+                self._overflow(overflow)
+            raise
+        
+        with self._lock:
+            depth = len(self._buffer)
+        audit_events_total.inc(len(batch), outcome="written")
+        audit_buffer_depth.set(depth)
+        return len(batch)
+    
+    def replay_spill(self) -> int:
+        replay_path = f"{self.spill_path}.replay"
+        with self._spill_lock:
+            if not os.path.exists(self.spill_path):
+                return 0
+            os.replace(self.spill_path, replay_path)
+        
+        with open(replay_path) as spill:
+            events = [json_util.loads(line) for line in spill if line.strip()]
+        replayed = 0
+        try:
+            for start in range(0, len(events), self.batch_size):
+                self._write(events[start:start + self.batch_size])
+                replayed += len(events[start:start + self.batch_size])
+        except PyMongoError:
+            self._overflow(events[replayed:])
+            raise
+        finally:
+            os.remove(replay_path)
+            audit_events_total.inc(replayed, outcome="replayed")
+        return replayed
+    
+    def flush_all(self) -> int:
+        if not self._flush_lock.acquire(blocking=False):
+            return 0
+        written = 0
+        try:
+            while True:
+                count = self.flush()
+                if not count:
+                    break
+                written += count
+            if self.overflow_policy == "spill":
+                written += self.replay_spill()
+        except PyMongoError:
+            pass
+        finally:
+            self._flush_lock.release()
+        return written
+    
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+    
+    def query(
+        self,
+        organization_name: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        action: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        conditions: List[Dict[str, Any]] = [{"meta.organization_name": organization_name}]
+        if action:
+            conditions.append({"meta.action": action})
+        if start is not None:
+            conditions.append({"timestamp": {"$gte": start}})
+        if end is not None:
+            conditions.append({"timestamp": {"$lt": end}})
+        if cursor:
+            timestamp, event_id = decode_cursor(cursor)
+            conditions.append({"$or": [
+                {"timestamp": {"$lt": timestamp}},
+                {"timestamp": timestamp, "_id": {"$lt": event_id}}
+            ]})
+        
+        docs = list(
+            self.collection.find({"$and": conditions})
+            .sort([("timestamp", -1), ("_id", -1)])
+            .limit(limit + 1)
+        )
+        next_cursor = encode_cursor(docs[limit - 1]) if len(docs) > limit else None
+        events = []
+        for doc in docs[:limit]:
+            meta = doc.get("meta", {})
+            events.append({
+                "id": str(doc["_id"]),
+                "timestamp": doc["timestamp"],
+                "action": meta.get("action"),
+                "organization_name": meta.get("organization_name"),
+                "outcome": doc.get("outcome"),
+                "actor": doc.get("actor", {}),
+                "details": doc.get("details", {})
+            })
+        return {"events": events, "next_cursor": next_cursor}
+
+
+def encode_cursor(doc: Dict[str, Any]) -> str:
+    raw = f"{doc['timestamp'].isoformat()}|{doc['_id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    try:
+        timestamp, event_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(timestamp), ObjectId(event_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+audit_log = AuditLog(db_manager)
@@ -1,17 +1,157 @@
+from typing import Dict, Any, List
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     MONGODB_URL: str = "mongodb://localhost:27017/"
     MASTER_DB_NAME: str = "master_org_db"
+    STORAGE_BACKEND: str = "mongo"
+    
+    TENANT_ISOLATION: str = "collection"
+    DEFAULT_CLUSTER: str = "primary"
+    TENANT_CLUSTERS: Dict[str, str] = {}
+    TENANT_CLUSTER_WEIGHTS: Dict[str, float] = {}
+    CLUSTER_WEIGHTS_COLLECTION: str = "cluster_weights"
+    CLUSTER_WEIGHTS_MAX_AGE_SECONDS: float = 5.0
+    COLLECTION_REGISTRY_MAX_AGE_SECONDS: float = 30.0
+    
+    OPERATION_PROFILES: Dict[str, Dict[str, Any]] = {
+        "fast_read": {
+            "read_preference": "secondaryPreferred",
+            "read_concern": "local",
+            "max_staleness_seconds": 90
+        },
+        "consistent_read": {
+            "read_preference": "primary",
+            "read_concern": "majority"
+        },
+        "durable_write": {
+            "write_concern": "majority",
+            "journal": True,
+            "wtimeout_ms": 5000
+        }
+    }
     
     SECRET_KEY: str = "your-secret-key-change-in-production"
-    ALGORITHM: str = "HS256"
+    ALGORITHM: str = "ES256"
+    SIGNING_KEY_ROTATION_SECONDS: int = 86400
+    SIGNING_KEY_CACHE_SECONDS: float = 60.0
+    JWKS_MAX_AGE_SECONDS: int = 300
+    TOKEN_CACHE_ENABLED: bool = True
+    TOKEN_CACHE_SIZE: int = 10000
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    BCRYPT_ROUNDS: int = 12
+    REFRESH_TOKEN_EXPIRE_MINUTES: int = 10080
+    
+    REVOCATION_ENABLED: bool = True
+    REVOCATION_SYNC_INTERVAL_SECONDS: float = 2.0
+    REVOCATION_FILTER_CAPACITY: int = 100000
+    REVOCATION_FILTER_ERROR_RATE: float = 0.001
     
     APP_NAME: str = "Organization Management Service"
     DEBUG: bool = True
     
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 5.0
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 2.0
+    HEALTH_MAX_STALENESS_SECONDS: float = 15.0
+    
+    METRICS_ENABLED: bool = True
+    METRICS_MULTIPROC_DIR: str = ""
+    METRICS_EXPORT_INTERVAL_SECONDS: float = 10.0
+    
+    SERVER_TIMING_ENABLED: bool = True
+    SERVER_TIMING_SAMPLE_RATE: float = 0.1
+    SLOW_REQUEST_THRESHOLD_MS: float = 500.0
+    
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_STORE: str = "local"
+    RATE_LIMIT_RATE: float = 20.0
+    RATE_LIMIT_BURST: float = 40.0
+    RATE_LIMIT_ROUTES: Dict[str, Dict[str, float]] = {
+        "POST /admin/login": {"rate": 0.5, "burst": 10},
+        "POST /admin/refresh": {"rate": 2.0, "burst": 20},
+        "POST /org/create": {"rate": 0.2, "burst": 5}
+    }
+    RATE_LIMIT_EXEMPT_PATHS: List[str] = ["/health", "/metrics", "/docs", "/redoc", "/openapi.json", "/.well-known"]
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = False
+    RATE_LIMIT_MAX_KEYS: int = 100000
+    
+    IDEMPOTENCY_ENABLED: bool = True
+    IDEMPOTENCY_ROUTES: List[str] = ["POST /org/create", "PUT /org/update", "DELETE /org/delete"]
+    IDEMPOTENCY_TTL_SECONDS: float = 86400.0
+    IDEMPOTENCY_LOCK_SECONDS: float = 60.0
+    IDEMPOTENCY_CACHE_SIZE: int = 10000
+    IDEMPOTENCY_MAX_BODY_BYTES: int = 65536
+    
+    CONCURRENCY_LIMIT_ENABLED: bool = True
+    CONCURRENCY_INITIAL_LIMIT: int = 32
+    CONCURRENCY_MIN_LIMIT: int = 4
+    CONCURRENCY_MAX_LIMIT: int = 256
+    CONCURRENCY_LATENCY_TOLERANCE: float = 2.0
+    CONCURRENCY_BACKOFF_RATIO: float = 0.9
+    CONCURRENCY_MAX_QUEUE: int = 128
+    CONCURRENCY_QUEUE_TIMEOUTS_MS: Dict[str, float] = {"high": 500.0, "normal": 200.0, "low": 50.0}
+    
+    PROVISIONING_MODE: str = "async"
+    PROVISIONING_QUEUE: str = "local"
+    PROVISIONING_POLL_INTERVAL_SECONDS: float = 2.0
+    PROVISIONING_LEASE_SECONDS: float = 60.0
+    PROVISIONING_MAX_ATTEMPTS: int = 5
+    PROVISIONING_RETRY_BACKOFF_SECONDS: float = 2.0
+    PROVISIONING_JOB_TTL_SECONDS: float = 604800.0
+    
+    AUDIT_ENABLED: bool = True
+    AUDIT_COLLECTION: str = "audit_log"
+    AUDIT_STORAGE: str = "collection"
+    AUDIT_CAPPED_SIZE_BYTES: int = 536870912
+    AUDIT_TTL_SECONDS: float = 0.0
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_MAX_BUFFER: int = 50000
+    AUDIT_OVERFLOW_POLICY: str = "drop_oldest"
+    AUDIT_SPILL_PATH: str = "audit_spill.jsonl"
+    AUDIT_QUERY_MAX_LIMIT: int = 500
+    
+    STATS_ENABLED: bool = True
+    STATS_COLLECTION: str = "organization_stats"
+    STATS_RECONCILE_INTERVAL_SECONDS: float = 900.0
+    STATS_DAILY_RETENTION_DAYS: int = 90
+    
+    USAGE_ENABLED: bool = True
+    USAGE_COLLECTION: str = "tenant_usage"
+    USAGE_REQUESTS_COLLECTION: str = "tenant_requests"
+    USAGE_SAMPLE_INTERVAL_SECONDS: float = 300.0
+    USAGE_SAMPLER_TICK_SECONDS: float = 5.0
+    USAGE_SAMPLE_BATCH_SIZE: int = 50
+    USAGE_FLUSH_INTERVAL_SECONDS: float = 5.0
+    USAGE_CACHE_SECONDS: float = 30.0
+    QUOTA_MAX_DOCUMENTS: int = 0
+    QUOTA_MAX_BYTES: int = 0
+    QUOTA_MAX_REQUESTS_PER_MINUTE: int = 0
+    QUOTA_OVERRIDES: Dict[str, Dict[str, int]] = {}
+    
+    CAPTURE_ENABLED: bool = False
+    CAPTURE_PATH: str = "traffic-{pid}.jsonl.gz"
+    CAPTURE_SAMPLE_RATE: float = 1.0
+    CAPTURE_SALT: str = ""
+    CAPTURE_MAX_BYTES: int = 268435456
+    CAPTURE_MAX_BUFFER: int = 10000
+    CAPTURE_FLUSH_INTERVAL_SECONDS: float = 2.0
+    CAPTURE_EXEMPT_PATHS: List[str] = ["/metrics", "/docs", "/redoc", "/openapi.json"]
+    
+    MIGRATION_BATCH_SIZE: int = 500
+    MIGRATION_MIN_BATCH_SIZE: int = 50
+    MIGRATION_MAX_BATCH_SIZE: int = 5000
+    MIGRATION_TARGET_LATENCY_MS: float = 100.0
+    MIGRATION_MAX_PAUSE_SECONDS: float = 5.0
+    MIGRATION_WRITE_BACK_ON_READ: bool = True
+    
+    DIAGNOSTICS_ENABLED: bool = False
+    DIAGNOSTICS_OPERATOR_IDS: List[str] = []
+    DIAGNOSTICS_MAX_SECONDS: float = 60.0
+    PROFILER_INTERVAL_MS: float = 5.0
+    TRACEMALLOC_FRAMES: int = 10
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,72 +1,456 @@
-from pymongo import MongoClient
+import hashlib
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pymongo import MongoClient, ReplaceOne
+from pymongo.client_session import ClientSession
+from pymongo.collection import Collection
 from pymongo.database import Database
-from pymongo.server_api import ServerApi
-from typing import Optional
+from pymongo.errors import CollectionInvalid
+from typing import Dict, Iterator, List, Optional, Tuple
 from app.config import settings
+from app.schemas.validators import org_collection_schema
+from app.storage import (
+    StorageBackend,
+    MongoBackend,
+    CollectionRegistry,
+    create_backend,
+    create_backend_for_url,
+    profile_options,
+    register_event_listener
+)
+
+
+MASTER_INDEXES = {
+    "organizations": [
+        ("organization_name", {"unique": True}),
+        ("admin_id", {}),
+        ("collection_name", {}),
+        ("cluster", {})
+    ],
+    "admins": [
+        ("email", {"unique": True})
+    ]
+}
+
+ORG_COLLECTION_INDEXES = [
+    ("_type", {})
+]
+
+COPY_INDEX_OPTIONS = ("unique", "sparse", "expireAfterSeconds")
+
+MAX_DATABASE_NAME_LENGTH = 63
+
+TENANT_COLLECTION_PREFIX = "org_"
 
 
 class DatabaseManager:
     _instance: Optional['DatabaseManager'] = None
-    _client: Optional[MongoClient] = None
+    _backend: Optional[StorageBackend] = None
+    _clusters: Optional[Dict[str, StorageBackend]] = None
+    _cluster_weights: Optional[Dict[str, float]] = None
+    _stored_weights: Optional[Dict[str, float]] = None
+    _stored_weights_loaded_at: float = 0.0
+    _registry: Optional[CollectionRegistry] = None
+    _profiled_collections: Dict[Tuple[str, str], Collection] = {}
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
     
-    def __init__(self):
-        if self._client is None:
-            self._client = MongoClient(settings.MONGODB_URL, server_api=ServerApi('1'))
+    @property
+    def backend(self) -> StorageBackend:
+        if self._backend is None:
+            self.set_backend(create_backend(settings.STORAGE_BACKEND))
+        return self._backend
+    
+    def set_backend(self, backend: StorageBackend) -> None:
+        if self._backend is not None and self._backend is not backend:
+            self._backend.close()
+        self._backend = backend
+        self._profiled_collections = {}
+        self._stored_weights = None
+        if self._registry is not None:
+            self._registry.invalidate()
+        if not isinstance(backend, MongoBackend):
+            self.ensure_master_indexes()
+    
+    def ensure_master_indexes(self) -> None:
+        db = self.get_master_db()
+        for collection_name, indexes in MASTER_INDEXES.items():
+            for field, options in indexes:
+                db[collection_name].create_index(field, **options)
     
     @property
     def client(self) -> MongoClient:
-        if self._client is None:
-            self._client = MongoClient(settings.MONGODB_URL, server_api=ServerApi('1'))
-        return self._client
+        if not isinstance(self.backend, MongoBackend):
+            raise RuntimeError(f"The '{self.backend.name}' storage backend has no MongoClient")
+        return self.backend.client
+    
+    @property
+    def registry(self) -> CollectionRegistry:
+        if self._registry is None:
+            self._registry = CollectionRegistry(
+                self._registered_collection_names,
+                settings.COLLECTION_REGISTRY_MAX_AGE_SECONDS
+            )
+        return self._registry
+    
+    def _registered_collection_names(self) -> List[str]:
+        organizations = self.get_master_db()["organizations"]
+        return [
+            org.get("collection_name")
+            for org in organizations.find({}, {"collection_name": 1, "_id": 0})
+        ]
+    
+    @property
+    def clusters(self) -> Dict[str, StorageBackend]:
+        if self._clusters is None:
+            self._clusters = {
+                name: create_backend_for_url(url)
+                for name, url in settings.TENANT_CLUSTERS.items()
+                if name != settings.DEFAULT_CLUSTER
+            }
+            self._cluster_weights = {
+                name: float(settings.TENANT_CLUSTER_WEIGHTS.get(name, 1.0))
+                for name in self.cluster_names()
+            }
+        return self._clusters
+    
+    def cluster_names(self) -> List[str]:
+        return [settings.DEFAULT_CLUSTER] + sorted(self.clusters)
+    
+    def register_cluster(self, name: str, backend: StorageBackend, weight: float = 1.0) -> None:
+        clusters = self.clusters
+        if name == settings.DEFAULT_CLUSTER:
+            self.set_backend(backend)
+        else:
+            previous = clusters.get(name)
+            if previous is not None and previous is not backend:
+                previous.close()
+            clusters[name] = backend
+        self._cluster_weights[name] = weight
+    
+    def unregister_cluster(self, name: str) -> None:
+        backend = self.clusters.pop(name, None)
+        self._cluster_weights.pop(name, None)
+        if backend is not None:
+            backend.close()
+    
+    def cluster_weights(self) -> Dict[str, float]:
+        configured = {name: self._cluster_weights.get(name, 1.0) for name in self.cluster_names()}
+        now = time.monotonic()
+        if (
+            self._stored_weights is None
+            or now - self._stored_weights_loaded_at >= settings.CLUSTER_WEIGHTS_MAX_AGE_SECONDS
+        ):
+            weights = self.get_master_db()[settings.CLUSTER_WEIGHTS_COLLECTION].find({}, {"weight": 1})
+            self._stored_weights = {doc["_id"]: float(doc["weight"]) for doc in weights}
+            self._stored_weights_loaded_at = now
+        return {**configured, **self._stored_weights}
+    
+    def set_cluster_weight(self, name: str, weight: float) -> None:
+        if name not in self.cluster_names():
+            raise ValueError(f"Unknown tenant cluster '{name}'")
+        self.get_master_db()[settings.CLUSTER_WEIGHTS_COLLECTION].update_one(
+            {"_id": name},
+            {"$set": {"weight": float(weight), "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+        self._stored_weights = None
+    
+    def clear_cluster_weight(self, name: str) -> bool:
+        result = self.get_master_db()[settings.CLUSTER_WEIGHTS_COLLECTION].delete_one({"_id": name})
+        self._stored_weights = None
+        return result.deleted_count > 0
+    
+    def get_cluster(self, name: Optional[str] = None) -> StorageBackend:
+        if not name or name == settings.DEFAULT_CLUSTER:
+            return self.backend
+        backend = self.clusters.get(name)
+        if backend is None:
+            raise ValueError(f"Unknown tenant cluster '{name}'")
+        return backend
+    
+    def choose_cluster(self) -> str:
+        names = self.cluster_names()
+        cluster_weights = self.cluster_weights()
+        weights = [max(cluster_weights.get(name, 1.0), 0.0) for name in names]
+        if not any(weights):
+            return settings.DEFAULT_CLUSTER
+        return random.choices(names, weights=weights)[0]
     
     def get_master_db(self) -> Database:
-        return self.client[settings.MASTER_DB_NAME]
+        return self.backend.get_database(settings.MASTER_DB_NAME)
+    
+    def get_master_collection(self, name: str, profile: Optional[str] = None) -> Collection:
+        if profile is None:
+            return self.get_master_db()[name]
+        collection = self._profiled_collections.get((name, profile))
+        if collection is None:
+            collection = self.get_master_db()[name].with_options(**profile_options(profile))
+            self._profiled_collections[(name, profile)] = collection
+        return collection
+    
+    @contextmanager
+    def causal_session(self) -> Iterator[Optional[ClientSession]]:
+        session = self.backend.start_session(causal_consistency=True)
+        if session is None:
+            yield None
+            return
+        with session:
+            yield session
+    
+    def get_tenant_db(self, cluster: Optional[str] = None, database_name: Optional[str] = None) -> Database:
+        return self.get_cluster(cluster).get_database(database_name or settings.MASTER_DB_NAME)
+    
+    def tenant_database_name(self, collection_name: str, isolation: Optional[str] = None) -> str:
+        isolation = isolation or settings.TENANT_ISOLATION
+        if isolation == "collection":
+            return settings.MASTER_DB_NAME
+        if isolation != "database":
+            raise ValueError(f"Unknown tenant isolation '{isolation}'. Expected 'collection' or 'database'")
+        if len(collection_name) <= MAX_DATABASE_NAME_LENGTH:
+            return collection_name
+        digest = hashlib.sha1(collection_name.encode()).hexdigest()[:8]
+        return f"{collection_name[:MAX_DATABASE_NAME_LENGTH - 9]}_{digest}"
+    
+    def organization_placement(self, collection_name: str) -> Tuple[str, str]:
+        org = self.get_master_db()["organizations"].find_one(
+            {"collection_name": collection_name},
+            {"cluster": 1, "database_name": 1}
+        ) or {}
+        return (
+            org.get("cluster") or settings.DEFAULT_CLUSTER,
+            org.get("database_name") or settings.MASTER_DB_NAME
+        )
+    
+    def cluster_for_collection(self, collection_name: str) -> str:
+        return self.organization_placement(collection_name)[0]
     
     def get_organization_db(self, collection_name: str) -> Database:
-        return self.client[settings.MASTER_DB_NAME]
+        return self.get_tenant_db(*self.organization_placement(collection_name))
     
-    def create_organization_collection(self, org_name: str) -> str:
-        collection_name = f"org_{org_name.lower().replace(' ', '_').replace('-', '_')}"
-        db = self.get_master_db()
+    def organization_collection_name(self, org_name: str) -> str:
+        return f"{TENANT_COLLECTION_PREFIX}{org_name.lower().replace(' ', '_').replace('-', '_')}"
+    
+    def provision_organization_collection(
+        self,
+        collection_name: str,
+        cluster: Optional[str] = None,
+        database_name: Optional[str] = None
+    ) -> None:
+        db = self.get_tenant_db(cluster, database_name or self.tenant_database_name(collection_name))
+        options = {
+            "validator": org_collection_schema(),
+            "validationLevel": "strict",
+            "validationAction": "error"
+        }
+        try:
+            try:
+                db.create_collection(collection_name, **options)
+            except CollectionInvalid:
+                db.command({"collMod": collection_name, **options})
+        except NotImplementedError:
+            if not db.list_collection_names(filter={"name": collection_name}):
+                db.create_collection(collection_name)
+        
         collection = db[collection_name]
-        dummy_id = collection.insert_one({"_type": "init"}).inserted_id
-        collection.delete_one({"_id": dummy_id})
+        for keys, options in ORG_COLLECTION_INDEXES:
+            collection.create_index(keys, **options)
+        self.registry.add(collection_name)
+    
+    def create_organization_collection(self, org_name: str, cluster: Optional[str] = None) -> str:
+        collection_name = self.organization_collection_name(org_name)
+        self.provision_organization_collection(collection_name, cluster)
         return collection_name
     
-    def delete_organization_collection(self, collection_name: str) -> bool:
-        db = self.get_master_db()
-        db[collection_name].drop()
+    def drop_tenant_storage(self, collection_name: str, cluster: Optional[str], database_name: Optional[str]) -> None:
+        if database_name and database_name != settings.MASTER_DB_NAME:
+            self.get_cluster(cluster).drop_database(database_name)
+        else:
+            self.get_tenant_db(cluster)[collection_name].drop()
+    
+    def delete_organization_collection(
+        self,
+        collection_name: str,
+        cluster: Optional[str] = None,
+        database_name: Optional[str] = None
+    ) -> bool:
+        if cluster is None and database_name is None:
+            cluster, database_name = self.organization_placement(collection_name)
+        self.drop_tenant_storage(collection_name, cluster, database_name)
+        self.registry.discard(collection_name)
         return True
     
     def collection_exists(self, collection_name: str) -> bool:
-        db = self.get_master_db()
-        return collection_name in db.list_collection_names()
+        if collection_name in self.registry:
+            return True
+        cluster, database_name = self.organization_placement(collection_name)
+        return self.get_cluster(cluster).has_collection(database_name, collection_name)
     
     def migrate_collection(self, old_collection_name: str, new_collection_name: str) -> bool:
-        db = self.get_master_db()
-        
         if not self.collection_exists(old_collection_name):
             return False
         
-        old_collection = db[old_collection_name]
-        new_collection = db[new_collection_name]
+        cluster, database_name = self.organization_placement(old_collection_name)
+        old_collection = self.get_tenant_db(cluster, database_name)[old_collection_name]
+        new_database_name = database_name
+        if database_name != settings.MASTER_DB_NAME:
+            new_database_name = self.tenant_database_name(new_collection_name, "database")
+        new_collection = self.get_tenant_db(cluster, new_database_name)[new_collection_name]
         
         documents = list(old_collection.find())
         if documents:
             new_collection.insert_many(documents)
         
-        old_collection.drop()
+        self.drop_tenant_storage(old_collection_name, cluster, database_name)
+        self.get_master_db()["organizations"].update_many(
+            {"collection_name": old_collection_name},
+            {"$set": {"collection_name": new_collection_name, "database_name": new_database_name}}
+        )
+        self.registry.discard(old_collection_name)
+        self.registry.add(new_collection_name)
         return True
     
+    def copy_collection(self, source: Collection, target: Collection, batch_size: int = 1000) -> int:
+        copied = 0
+        batch = []
+        for document in source.find().batch_size(batch_size):
+            batch.append(document)
+            if len(batch) >= batch_size:
+                target.insert_many(batch, ordered=False)
+                copied += len(batch)
+                batch = []
+        if batch:
+            target.insert_many(batch, ordered=False)
+            copied += len(batch)
+        
+        for name, info in source.index_information().items():
+            if name == "_id_":
+                continue
+            options = {key: info[key] for key in COPY_INDEX_OPTIONS if key in info}
+            target.create_index(list(info["key"]), name=name, **options)
+        return copied
+    
+    def sync_collection_delta(self, source: Collection, target: Collection, batch_size: int = 1000) -> int:
+        changed = 0
+        last_id = None
+        while True:
+            query = {} if last_id is None else {"_id": {"$gt": last_id}}
+            docs = list(source.find(query).sort("_id", 1).limit(batch_size))
+            if not docs:
+                break
+            existing = {doc["_id"]: doc for doc in target.find({"_id": {"$in": [doc["_id"] for doc in docs]}})}
+            requests = [
+                ReplaceOne({"_id": doc["_id"]}, doc, upsert=True)
+                for doc in docs if existing.get(doc["_id"]) != doc
+            ]
+            if requests:
+                target.bulk_write(requests, ordered=False)
+                changed += len(requests)
+            last_id = docs[-1]["_id"]
+        
+        last_id = None
+        while True:
+            query = {} if last_id is None else {"_id": {"$gt": last_id}}
+            ids = [doc["_id"] for doc in target.find(query, {"_id": 1}).sort("_id", 1).limit(batch_size)]
+            if not ids:
+                break
+            present = {doc["_id"] for doc in source.find({"_id": {"$in": ids}}, {"_id": 1})}
+            stale = [doc_id for doc_id in ids if doc_id not in present]
+            if stale:
+                changed += target.delete_many({"_id": {"$in": stale}}).deleted_count
+            last_id = ids[-1]
+        return changed
+    
+    def placement_in_use(self, collection_name: str, cluster: str, database_name: str) -> bool:
+        query = {
+            "collection_name": collection_name,
+            "cluster": {"$in": [cluster, None]} if cluster == settings.DEFAULT_CLUSTER else cluster,
+            "database_name": {"$in": [database_name, None]} if database_name == settings.MASTER_DB_NAME else database_name
+        }
+        return self.get_master_db()["organizations"].find_one(query, {"_id": 1}) is not None
+    
+    def move_organization(
+        self,
+        organization_name: str,
+        target_cluster: Optional[str] = None,
+        batch_size: int = 1000,
+        isolation: Optional[str] = None
+    ) -> int:
+        org_collection = self.get_master_db()["organizations"]
+        org = org_collection.find_one({"organization_name": organization_name})
+        if org is None:
+            raise ValueError(f"Organization '{organization_name}' not found")
+        
+        collection_name = org["collection_name"]
+        source_cluster = org.get("cluster") or settings.DEFAULT_CLUSTER
+        source_database = org.get("database_name") or settings.MASTER_DB_NAME
+        target_cluster = target_cluster or source_cluster
+        self.get_cluster(target_cluster)
+        target_database = source_database
+        if isolation is not None:
+            target_database = self.tenant_database_name(collection_name, isolation)
+        if (source_cluster, source_database) == (target_cluster, target_database):
+            return 0
+        if self.placement_in_use(collection_name, target_cluster, target_database):
+            raise ValueError(f"Target collection '{collection_name}' on '{target_cluster}/{target_database}' is live")
+        
+        fenced = org_collection.find_one_and_update(
+            {"_id": org["_id"], "moving_since": None},
+            {"$set": {"moving_since": datetime.utcnow()}}
+        )
+        if fenced is None:
+            raise ValueError(f"Organization '{organization_name}' is already being moved")
+        
+        source = self.get_tenant_db(source_cluster, source_database)[collection_name]
+        target = self.get_tenant_db(target_cluster, target_database)[collection_name]
+        moved = False
+        try:
+            target.drop()
+            copied = self.copy_collection(source, target, batch_size)
+            self.sync_collection_delta(source, target, batch_size)
+            
+            org_collection.update_one(
+                {"_id": org["_id"]},
+                {
+                    "$set": {
+                        "cluster": target_cluster,
+                        "database_name": target_database,
+                        "updated_at": datetime.utcnow()
+                    },
+                    "$unset": {"moving_since": ""}
+                }
+            )
+            moved = True
+        finally:
+            if not moved:
+                org_collection.update_one({"_id": org["_id"]}, {"$unset": {"moving_since": ""}})
+        self.drop_tenant_storage(collection_name, source_cluster, source_database)
+        return copied
+    
+    def placement_counts(self) -> Dict[str, int]:
+        counts = {name: 0 for name in self.cluster_names()}
+        for org in self.get_master_db()["organizations"].find({}, {"cluster": 1}):
+            cluster = org.get("cluster") or settings.DEFAULT_CLUSTER
+            counts[cluster] = counts.get(cluster, 0) + 1
+        return counts
+    
     def close(self):
-        if self._client:
-            self._client.close()
-            self._client = None
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
+        if self._clusters is not None:
+            for backend in self._clusters.values():
+                backend.close()
+            self._clusters = None
+            self._cluster_weights = None
+        self._stored_weights = None
+        self._profiled_collections = {}
+        self._registry = None
 
 
 db_manager = DatabaseManager()
@@ -4,8 +4,34 @@ from fastapi.responses import RedirectResponse
 from contextlib import asynccontextmanager
 
 from app.config import settings
-from app.routes import organization_router, admin_router
+from app.routes import (
+    organization_router,
+    admin_router,
+    health_router,
+    metrics_router,
+    diagnostics_router,
+    audit_router,
+    jwks_router
+)
+from app.audit import audit_log
 from app.database import db_manager
+from app.middleware import (
+    CaptureMiddleware,
+    ConcurrencyLimitMiddleware,
+    IdempotencyMiddleware,
+    MetricsMiddleware,
+    RateLimitMiddleware,
+    ServerTimingMiddleware,
+    UsageMiddleware
+)
+from app.monitoring.capture import traffic_recorder
+from app.monitoring.health import health_monitor
+from app.monitoring.metrics import registry
+from app.monitoring.timing import TimedJSONResponse
+from app.services.provisioning_service import provisioning_worker
+from app.services.revocation_service import revocation_service
+from app.stats import organization_stats
+from app.usage import usage_accountant
 
 
 @asynccontextmanager
@@ -13,10 +39,27 @@ async def lifespan(app: FastAPI):
     print(f"Starting {settings.APP_NAME}")
     print(f"Master Database: {settings.MASTER_DB_NAME}")
     print(f"JWT Expiration: {settings.ACCESS_TOKEN_EXPIRE_MINUTES} minutes")
+    await health_monitor.start()
+    await registry.start_export()
+    await audit_log.start()
+    await revocation_service.start()
+    await organization_stats.start()
+    await usage_accountant.start()
+    await traffic_recorder.start()
+    if settings.PROVISIONING_MODE == "async":
+        await provisioning_worker.start()
     
     yield
     
     print("Shutting down application")
+    await provisioning_worker.stop()
+    await traffic_recorder.stop()
+    await usage_accountant.stop()
+    await organization_stats.stop()
+    await revocation_service.stop()
+    await audit_log.stop()
+    await registry.stop_export()
+    await health_monitor.stop()
     db_manager.close()
 
 
@@ -25,20 +68,50 @@ app = FastAPI(
     description="Multi-tenant backend service for managing organizations with dynamic collections.",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=TimedJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
 
+if settings.IDEMPOTENCY_ENABLED:
+    app.add_middleware(IdempotencyMiddleware)
+
+if settings.CONCURRENCY_LIMIT_ENABLED:
+    app.add_middleware(ConcurrencyLimitMiddleware)
+
+if settings.USAGE_ENABLED:
+    app.add_middleware(UsageMiddleware)
+
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+if settings.CAPTURE_ENABLED:
+    app.add_middleware(CaptureMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Idempotent-Replayed", "Retry-After"],
 )
 
 app.include_router(organization_router)
 app.include_router(admin_router)
+app.include_router(health_router)
+app.include_router(audit_router)
+app.include_router(jwks_router)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
+if settings.DIAGNOSTICS_ENABLED:
+    app.include_router(diagnostics_router)
 
 
 @app.get("/", tags=["Health"])
@@ -46,21 +119,6 @@ async def root():
     return RedirectResponse(url="/docs")
 
 
-@app.get("/health", tags=["Health"])
-async def health_check():
-    try:
-        db_manager.get_master_db().command('ping')
-        db_status = "connected"
-    except Exception as e:
-        db_status = f"error: {str(e)}"
-    
-    return {
-        "status": "healthy",
-        "database": db_status,
-        "app": settings.APP_NAME
-    }
-
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -0,0 +1,18 @@
+from app.middleware.capture import CaptureMiddleware
+from app.middleware.concurrency import AdaptiveConcurrencyLimiter, ConcurrencyLimitMiddleware
+from app.middleware.idempotency import IdempotencyMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.timing import ServerTimingMiddleware
+from app.middleware.usage import UsageMiddleware
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "CaptureMiddleware",
+    "ConcurrencyLimitMiddleware",
+    "IdempotencyMiddleware",
+    "MetricsMiddleware",
+    "RateLimitMiddleware",
+    "ServerTimingMiddleware",
+    "UsageMiddleware"
+]
@@ -0,0 +1,88 @@
+import time
+from typing import Dict, Any, Optional, Sequence
+from urllib.parse import parse_qs
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.middleware.routing import is_exempt, resolve_route
+from app.monitoring.capture import TrafficRecorder, traffic_recorder
+from app.utils.security import request_claims
+
+
+class CaptureMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        recorder: Optional[TrafficRecorder] = None,
+        exempt_paths: Sequence[str] = tuple(settings.CAPTURE_EXEMPT_PATHS)
+    ):
+        self.app = app
+        self.recorder = recorder or traffic_recorder
+        self.exempt_paths = tuple(exempt_paths)
+    
+    def identities(self, scope: Scope) -> Dict[str, Any]:
+        fields: Dict[str, Any] = {}
+        for name, value in scope.get("headers", ()):
+            if name == b"authorization":
+                fields["a"] = 1
+            elif name == b"idempotency-key":
+                fields["k"] = self.recorder.pseudonym(value.decode("latin-1"))
+        
+        payload = request_claims(scope)
+        if payload and payload.get("organization_name"):
+            fields["o"] = self.recorder.pseudonym(payload["organization_name"])
+        if payload and payload.get("sub"):
+            fields["u"] = self.recorder.pseudonym(str(payload["sub"]))
+        
+        if "o" not in fields and scope.get("query_string"):
+            names = parse_qs(scope["query_string"].decode("latin-1")).get("organization_name")
+            if names:
+                fields["o"] = self.recorder.pseudonym(names[0])
+        return fields
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or is_exempt(scope["path"], self.exempt_paths)
+            or not self.recorder.sampled()
+        ):
+            await self.app(scope, receive, send)
+            return
+        
+        entry: Dict[str, Any] = {
+            "t": round(time.time(), 3),
+            "m": scope["method"],
+            "r": resolve_route(scope),
+            **self.identities(scope)
+        }
+        request_bytes = 0
+        response_bytes = 0
+        status_code = 500
+        
+        async def receive_wrapper() -> Message:
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                request_bytes += len(message.get("body", b""))
+            return message
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_bytes, status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+        
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            entry.update(
+                s=status_code,
+                d=round((time.perf_counter() - started) * 1000, 2),
+                qb=request_bytes,
+                rb=response_bytes
+            )
+            self.recorder.record(entry)
@@ -0,0 +1,207 @@
+import asyncio
+import heapq
+import itertools
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+from app.middleware.routing import is_exempt, resolve_route
+from app.monitoring.metrics import (
+    concurrency_in_flight,
+    concurrency_limit,
+    concurrency_queue_depth,
+    concurrency_queue_wait_seconds,
+    requests_shed_total
+)
+from app.utils.security import request_claims
+
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+PRIORITY_NAMES = {PRIORITY_HIGH: "high", PRIORITY_NORMAL: "normal", PRIORITY_LOW: "low"}
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+SHED_BODY = json.dumps({"detail": "Server is overloaded, retry shortly"}).encode()
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        initial_limit: float = settings.CONCURRENCY_INITIAL_LIMIT,
+        min_limit: float = settings.CONCURRENCY_MIN_LIMIT,
+        max_limit: float = settings.CONCURRENCY_MAX_LIMIT,
+        latency_tolerance: float = settings.CONCURRENCY_LATENCY_TOLERANCE,
+        backoff_ratio: float = settings.CONCURRENCY_BACKOFF_RATIO,
+        max_queue: int = settings.CONCURRENCY_MAX_QUEUE
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = float(min_limit)
+        self.max_limit = float(max_limit)
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.queued = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._baselines: Dict[str, float] = {}
+        self._last_decrease = 0.0
+        self._publish()
+    
+    def _publish(self) -> None:
+        concurrency_limit.set(self.limit)
+        concurrency_in_flight.set(self.in_flight)
+        concurrency_queue_depth.set(self.queued)
+    
+    def _evict_lowest(self, priority: int) -> bool:
+        live = [entry for entry in self._waiters if not entry[2].done()]
+        if not live:
+            return True
+        lowest = max(live)
+        if lowest[0] <= priority:
+            return False
+        lowest[2].set_result(False)
+        self.queued -= 1
+        requests_shed_total.inc(priority=PRIORITY_NAMES[lowest[0]], reason="evicted")
+        return True
+    
+    def _expire(self, future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(False)
+            self.queued -= 1
+            self._publish()
+    
+    async def acquire(self, priority: int, timeout: float) -> bool:
+        if self.in_flight < self.limit and not self.queued:
+            self.in_flight += 1
+            self._publish()
+            return True
+        if timeout <= 0:
+            return False
+        if self.queued >= self.max_queue and not self._evict_lowest(priority):
+            return False
+        
+        if len(self._waiters) > 2 * self.max_queue:
+            self._waiters = [entry for entry in self._waiters if not entry[2].done()]
+            heapq.heapify(self._waiters)
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self.queued += 1
+        self._publish()
+        timer = loop.call_later(timeout, self._expire, future)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.result():
+                self._release_slot()
+            elif not future.done():
+                future.cancel()
+                self.queued -= 1
+            raise
+        finally:
+            timer.cancel()
+            self._publish()
+    
+    def _admit_waiters(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self.in_flight += 1
+            self.queued -= 1
+            future.set_result(True)
+    
+    def _release_slot(self) -> None:
+        self.in_flight -= 1
+        self._admit_waiters()
+        self._publish()
+    
+    def observe(self, route: str, latency: float) -> None:
+        baseline = self._baselines.get(route)
+        if baseline is None:
+            self._baselines[route] = latency
+        elif latency > baseline * self.latency_tolerance:
+            now = time.monotonic()
+            if now - self._last_decrease > latency:
+                self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+                self._last_decrease = now
+            self._baselines[route] = baseline + 0.01 * (latency - baseline)
+        else:
+            self._baselines[route] = baseline + 0.1 * (latency - baseline)
+            if self.in_flight * 2 >= self.limit:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+    
+    def release(self, route: str, latency: float) -> None:
+        self.observe(route, latency)
+        self._release_slot()
+    
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "queued": self.queued
+        }
+
+
+def is_authenticated(scope: Scope) -> bool:
+    return request_claims(scope) is not None
+
+
+def request_priority(scope: Scope) -> int:
+    authenticated = is_authenticated(scope)
+    if scope["method"] not in READ_METHODS:
+        return PRIORITY_HIGH if authenticated else PRIORITY_NORMAL
+    return PRIORITY_NORMAL if authenticated else PRIORITY_LOW
+
+
+class ConcurrencyLimitMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        queue_timeouts_ms: Optional[Dict[str, float]] = None,
+        exempt_paths: Tuple[str, ...] = ("/health", "/metrics")
+    ):
+        self.app = app
+        self.limiter = limiter or AdaptiveConcurrencyLimiter()
+        timeouts = queue_timeouts_ms if queue_timeouts_ms is not None else settings.CONCURRENCY_QUEUE_TIMEOUTS_MS
+        self.queue_timeouts = {
+            priority: timeouts.get(name, 0.0) / 1000
+            for priority, name in PRIORITY_NAMES.items()
+        }
+        self.exempt_paths = exempt_paths
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or is_exempt(scope["path"], self.exempt_paths):
+            await self.app(scope, receive, send)
+            return
+        
+        priority = request_priority(scope)
+        waited = time.perf_counter()
+        admitted = await self.limiter.acquire(priority, self.queue_timeouts[priority])
+        started = time.perf_counter()
+        concurrency_queue_wait_seconds.observe(started - waited, priority=PRIORITY_NAMES[priority])
+        
+        if not admitted:
+            requests_shed_total.inc(priority=PRIORITY_NAMES[priority], reason="overloaded")
+            await send({
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(SHED_BODY)).encode()),
+                    (b"retry-after", b"1")
+                ]
+            })
+            await send({"type": "http.response.body", "body": SHED_BODY})
+            return
+        
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.limiter.release(resolve_route(scope), time.perf_counter() - started)
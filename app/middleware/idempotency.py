@@ -0,0 +1,174 @@
+import asyncio
+import hashlib
+import json
+from typing import Dict, Any, List, Optional, Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.middleware.routing import resolve_route
+from app.storage.idempotency import STATUS_ACQUIRED, STATUS_COMPLETED, IdempotencyStore
+from app.utils.security import request_claims
+
+
+HEADER_NAME = b"idempotency-key"
+MAX_KEY_LENGTH = 255
+
+
+def create_idempotency_store() -> IdempotencyStore:
+    from app.database import db_manager
+    return IdempotencyStore(
+        db_manager.get_master_db()["idempotency_keys"],
+        ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS,
+        lock_seconds=settings.IDEMPOTENCY_LOCK_SECONDS,
+        cache_size=settings.IDEMPOTENCY_CACHE_SIZE
+    )
+
+
+def json_response(status: int, detail: str, extra_headers: Sequence = ()) -> List[Message]:
+    body = json.dumps({"detail": detail}).encode()
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+        *extra_headers
+    ]
+    return [
+        {"type": "http.response.start", "status": status, "headers": headers},
+        {"type": "http.response.body", "body": body}
+    ]
+
+
+class IdempotencyMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: Optional[IdempotencyStore] = None,
+        routes: Sequence[str] = tuple(settings.IDEMPOTENCY_ROUTES),
+        max_body_bytes: int = settings.IDEMPOTENCY_MAX_BODY_BYTES
+    ):
+        self.app = app
+        self._store = store
+        self.routes = frozenset(routes)
+        self.max_body_bytes = max_body_bytes
+    
+    @property
+    def store(self) -> IdempotencyStore:
+        if self._store is None:
+            self._store = create_idempotency_store()
+        return self._store
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        idempotency_key = None
+        authorized = False
+        for name, value in scope.get("headers", ()):
+            if name == HEADER_NAME:
+                idempotency_key = value.decode("latin-1").strip()
+            elif name == b"authorization":
+                authorized = True
+        
+        route = resolve_route(scope)
+        if not idempotency_key or f"{scope['method']} {route}" not in self.routes:
+            await self.app(scope, receive, send)
+            return
+        
+        claims = request_claims(scope) if authorized else None
+        if authorized and claims is None:
+            await self.app(scope, receive, send)
+            return
+        principal = f"{claims.get('organization_id')}:{claims.get('sub')}" if claims else ""
+        
+        if len(idempotency_key) > MAX_KEY_LENGTH:
+            for message in json_response(400, f"Idempotency-Key must be at most {MAX_KEY_LENGTH} characters"):
+                await send(message)
+            return
+        
+        chunks = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            size += len(chunks[-1])
+            if size > self.max_body_bytes:
+                for message in json_response(413, f"Requests with an Idempotency-Key must be at most {self.max_body_bytes} bytes"):
+                    await send(message)
+                return
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+        
+        key = hashlib.sha256(
+            b"|".join([scope["method"].encode(), route.encode(), principal.encode(), idempotency_key.encode()])
+        ).hexdigest()
+        fingerprint = hashlib.sha256(scope.get("query_string", b"") + b"|" + body).hexdigest()
+        
+        store = self.store
+        status, record = await asyncio.to_thread(store.begin, key, fingerprint)
+        if status != STATUS_ACQUIRED:
+            await self.replay(status, record, fingerprint, send)
+            return
+        
+        response: Dict[str, Any] = {"status": 500, "headers": [], "body": b""}
+        
+        async def replay_receive() -> Message:
+            nonlocal body
+            if body is None:
+                return await receive()
+            message = {"type": "http.request", "body": body, "more_body": False}
+            body = None
+            return message
+        
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["headers"] = [
+                    [name.decode("latin-1"), value.decode("latin-1")]
+                    for name, value in message.get("headers", ())
+                    if name.lower() != b"content-length"
+                ]
+            elif message["type"] == "http.response.body":
+                response["body"] += message.get("body", b"")
+            await send(message)
+        
+        completed = False
+        try:
+            await self.app(scope, replay_receive, send_wrapper)
+            if response["status"] < 500:
+                await asyncio.to_thread(
+                    store.complete,
+                    key,
+                    fingerprint,
+                    response["status"],
+                    response["headers"],
+                    response["body"]
+                )
+                completed = True
+        finally:
+            if not completed:
+                await asyncio.to_thread(store.abandon, key)
+    
+    async def replay(self, status: str, record: Optional[Dict[str, Any]], fingerprint: str, send: Send) -> None:
+        if status != STATUS_COMPLETED or record is None:
+            messages = json_response(
+                409,
+                "A request with this Idempotency-Key is still being processed",
+                [(b"retry-after", b"1")]
+            )
+        elif record["fingerprint"] != fingerprint:
+            messages = json_response(422, "Idempotency-Key was already used with a different request")
+        else:
+            body = bytes(record["response_body"])
+            headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in record["response_headers"]]
+            headers.append((b"content-length", str(len(body)).encode()))
+            headers.append((b"idempotent-replayed", b"true"))
+            messages = [
+                {"type": "http.response.start", "status": record["response_status"], "headers": headers},
+                {"type": "http.response.body", "body": body}
+            ]
+        for message in messages:
+            await send(message)
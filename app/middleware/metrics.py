@@ -0,0 +1,43 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.routing import resolve_route
+from app.monitoring.metrics import (
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_requests_total
+)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        route = resolve_route(scope)
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        http_requests_in_flight.inc(method=method, route=route)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec(method=method, route=route)
+            http_request_duration_seconds.observe(
+                time.perf_counter() - started,
+                method=method,
+                route=route
+            )
+            http_requests_total.inc(method=method, route=route, status=str(status_code))
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import math
+from typing import Dict, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+from app.middleware.routing import is_exempt, resolve_route
+from app.monitoring.metrics import http_requests_throttled_total
+from app.storage.buckets import BucketStore, LocalBucketStore, SharedBucketStore
+from app.utils.security import request_claims
+
+
+DEFAULT_RULE = "default"
+THROTTLED_BODY = json.dumps({"detail": "Too many requests"}).encode()
+
+
+def create_bucket_store(name: str) -> BucketStore:
+    if name == "local":
+        return LocalBucketStore(settings.RATE_LIMIT_MAX_KEYS)
+    if name == "shared":
+        from app.database import db_manager
+        return SharedBucketStore(db_manager.get_master_db()["rate_limits"])
+    raise ValueError(f"Unknown rate limit store '{name}'. Expected 'local' or 'shared'")
+
+
+class RateLimitMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: Optional[BucketStore] = None,
+        rate: float = settings.RATE_LIMIT_RATE,
+        burst: float = settings.RATE_LIMIT_BURST,
+        routes: Optional[Dict[str, Dict[str, float]]] = None,
+        exempt_paths: Sequence[str] = tuple(settings.RATE_LIMIT_EXEMPT_PATHS),
+        trust_forwarded_for: bool = settings.RATE_LIMIT_TRUST_FORWARDED_FOR
+    ):
+        self.app = app
+        self._store = store
+        self.default = (rate, burst)
+        self.routes = {
+            rule: (limits["rate"], limits.get("burst", limits["rate"]))
+            for rule, limits in (routes if routes is not None else settings.RATE_LIMIT_ROUTES).items()
+        }
+        self.exempt_paths = tuple(exempt_paths)
+        self.trust_forwarded_for = trust_forwarded_for
+    
+    @property
+    def store(self) -> BucketStore:
+        if self._store is None:
+            self._store = create_bucket_store(settings.RATE_LIMIT_STORE)
+        return self._store
+    
+    def identity(self, scope: Scope) -> Tuple[str, str]:
+        payload = request_claims(scope)
+        if payload and payload.get("organization_id"):
+            return "org", str(payload["organization_id"])
+        
+        forwarded_for = None
+        for name, value in scope.get("headers", ()):
+            if name == b"x-forwarded-for":
+                forwarded_for = value.decode("latin-1")
+        
+        if self.trust_forwarded_for and forwarded_for:
+            return "ip", forwarded_for.split(",")[0].strip()
+        client = scope.get("client")
+        return "ip", client[0] if client else "unknown"
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or is_exempt(scope["path"], self.exempt_paths):
+            await self.app(scope, receive, send)
+            return
+        
+        route = resolve_route(scope)
+        rule = f"{scope['method']} {route}"
+        rate, burst = self.routes.get(rule, self.default)
+        if rule not in self.routes:
+            rule = DEFAULT_RULE
+        
+        kind, identity = self.identity(scope)
+        key = f"{rule}|{kind}:{identity}"
+        store = self.store
+        if store.blocking:
+            allowed, retry_after = await asyncio.to_thread(store.acquire, key, rate, burst)
+        else:
+            allowed, retry_after = store.acquire(key, rate, burst)
+        
+        if allowed:
+            await self.app(scope, receive, send)
+            return
+        
+        http_requests_throttled_total.inc(route=route, scope=kind)
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(THROTTLED_BODY)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode())
+            ]
+        })
+        await send({"type": "http.response.body", "body": THROTTLED_BODY})
@@ -0,0 +1,53 @@
+import threading
+from collections import OrderedDict
+from typing import Sequence, Tuple
+
+from starlette.routing import Match
+from starlette.types import Scope
+
+
+UNMATCHED_ROUTE = "unmatched"
+ROUTE_CACHE_SIZE = 1024
+
+_route_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_route_cache_lock = threading.Lock()
+
+
+def resolve_route(scope: Scope) -> str:
+    key = (scope.get("method", ""), scope.get("path", ""))
+    with _route_cache_lock:
+        route = _route_cache.get(key)
+        if route is not None:
+            _route_cache.move_to_end(key)
+            return route
+    
+    route = UNMATCHED_ROUTE
+    app = scope.get("app")
+    router = getattr(app, "router", None)
+    if router is not None:
+        partial = None
+        for candidate in router.routes:
+            match, _ = candidate.matches(scope)
+            if match == Match.FULL:
+                route = getattr(candidate, "path", UNMATCHED_ROUTE)
+                partial = None
+                break
+            if match == Match.PARTIAL and partial is None:
+                partial = getattr(candidate, "path", UNMATCHED_ROUTE)
+        if partial is not None:
+            route = partial
+    
+    if route != UNMATCHED_ROUTE:
+        with _route_cache_lock:
+            _route_cache[key] = route
+            while len(_route_cache) > ROUTE_CACHE_SIZE:
+                _route_cache.popitem(last=False)
+    return route
+
+
+def is_exempt(path: str, exempt_paths: Sequence[str]) -> bool:
+    for prefix in exempt_paths:
+        prefix = prefix.rstrip("/")
+        if path == prefix or path.startswith(prefix + "/"):
+            return True
+    return False
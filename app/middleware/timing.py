@@ -0,0 +1,58 @@
+import random
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.middleware.routing import resolve_route
+from app.monitoring.timing import log_slow_operation, start_request_timing, stop_request_timing
+
+
+class ServerTimingMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = settings.SERVER_TIMING_SAMPLE_RATE,
+        slow_threshold_ms: float = settings.SLOW_REQUEST_THRESHOLD_MS
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold_ms / 1000
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        sampled = self.sample_rate >= 1 or random.random() < self.sample_rate
+        timing = start_request_timing() if sampled else None
+        started = time.perf_counter()
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if timing is not None:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", timing.server_timing_header())
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            if timing is not None:
+                stop_request_timing()
+            if elapsed >= self.slow_threshold:
+                log_slow_operation({
+                    "event": "slow_request",
+                    "method": scope["method"],
+                    "route": resolve_route(scope),
+                    "status": status_code,
+                    "duration_ms": round(elapsed * 1000, 3),
+                    "threshold_ms": round(self.slow_threshold * 1000, 3),
+                    "sampled": sampled,
+                    "phases": timing.breakdown() if timing is not None else None
+                })
@@ -0,0 +1,64 @@
+import asyncio
+import json
+import time
+from typing import Optional, Sequence
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+from app.middleware.routing import is_exempt
+from app.monitoring.metrics import quota_rejections_total
+from app.usage import UsageAccountant, usage_accountant
+from app.utils.security import request_claims
+
+
+QUOTA_EXCEEDED_BODY = json.dumps({"detail": "Organization request quota exceeded"}).encode()
+
+
+class UsageMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        accountant: Optional[UsageAccountant] = None,
+        exempt_paths: Sequence[str] = tuple(settings.RATE_LIMIT_EXEMPT_PATHS)
+    ):
+        self.app = app
+        self.accountant = accountant or usage_accountant
+        self.exempt_paths = tuple(exempt_paths)
+    
+    def organization(self, scope: Scope) -> Optional[str]:
+        payload = request_claims(scope)
+        return payload.get("organization_name") if payload else None
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or is_exempt(scope["path"], self.exempt_paths):
+            await self.app(scope, receive, send)
+            return
+        
+        organization_name = self.organization(scope)
+        if organization_name is None:
+            await self.app(scope, receive, send)
+            return
+        
+        self.accountant.record_request(organization_name)
+        limit = self.accountant.quotas(organization_name)["max_requests_per_minute"]
+        if limit:
+            if self.accountant.needs_refresh(organization_name):
+                count = await asyncio.to_thread(self.accountant.requests_this_minute, organization_name)
+            else:
+                count = self.accountant.requests_this_minute(organization_name)
+            if count > limit:
+                quota_rejections_total.inc(quota="requests_per_minute")
+                await send({
+                    "type": "http.response.start",
+                    "status": 429,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(QUOTA_EXCEEDED_BODY)).encode()),
+                        (b"retry-after", str(max(1, 60 - int(time.time()) % 60)).encode())
+                    ]
+                })
+                await send({"type": "http.response.body", "body": QUOTA_EXCEEDED_BODY})
+                return
+        
+        await self.app(scope, receive, send)
@@ -0,0 +1,23 @@
+from app.migrations.base import Migration, SCHEMA_VERSION_FIELD, TENANT_COLLECTIONS
+from app.migrations.versions import MIGRATIONS
+from app.migrations.upgrade import (
+    current_version,
+    document_changes,
+    migrations_for,
+    upgrade_document,
+    upgrade_on_read
+)
+from app.migrations.runner import MigrationRunner
+
+__all__ = [
+    "Migration",
+    "MIGRATIONS",
+    "SCHEMA_VERSION_FIELD",
+    "TENANT_COLLECTIONS",
+    "current_version",
+    "document_changes",
+    "migrations_for",
+    "upgrade_document",
+    "upgrade_on_read",
+    "MigrationRunner"
+]
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any
+
+
+SCHEMA_VERSION_FIELD = "schema_version"
+TENANT_COLLECTIONS = "tenant"
+
+
+class Migration(ABC):
+    collection: str = ""
+    version: int = 0
+    description: str = ""
+    
+    @abstractmethod
+    def upgrade(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        pass
+    
+    def __repr__(self) -> str:
+        return f"<Migration {self.collection} v{self.version}: {self.description}>"
@@ -0,0 +1,149 @@
+import time
+from datetime import datetime
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+
+from pymongo import UpdateOne
+from pymongo.collection import Collection
+
+from app.config import settings
+from app.database import DatabaseManager
+from app.migrations.base import SCHEMA_VERSION_FIELD, TENANT_COLLECTIONS
+from app.migrations.upgrade import (
+    current_version,
+    document_changes,
+    document_version,
+    outdated_filter,
+    upgrade_document,
+    version_filter
+)
+
+
+MASTER_COLLECTIONS = ("organizations", "admins")
+
+
+class MigrationRunner:
+    def __init__(
+        self,
+        db: DatabaseManager,
+        batch_size: int = settings.MIGRATION_BATCH_SIZE,
+        min_batch_size: int = settings.MIGRATION_MIN_BATCH_SIZE,
+        max_batch_size: int = settings.MIGRATION_MAX_BATCH_SIZE,
+        target_latency_ms: float = settings.MIGRATION_TARGET_LATENCY_MS,
+        max_pause_seconds: float = settings.MIGRATION_MAX_PAUSE_SECONDS,
+        sleep: Callable[[float], None] = time.sleep,
+        progress: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ):
+        self.db = db
+        self.batch_size = batch_size
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.target_latency = target_latency_ms / 1000
+        self.max_pause = max_pause_seconds
+        self.sleep = sleep
+        self.progress = progress
+        self.checkpoints = db.get_master_db()["schema_migrations"]
+    
+    def targets(self, kinds: Optional[List[str]] = None) -> Iterator[Tuple[str, str, Collection]]:
+        kinds = kinds or [*MASTER_COLLECTIONS, TENANT_COLLECTIONS]
+        for kind in kinds:
+            if not current_version(kind):
+                continue
+            if kind != TENANT_COLLECTIONS:
+                yield kind, kind, self.db.get_master_collection(kind, "durable_write")
+                continue
+            orgs = self.db.get_master_db()["organizations"].find(
+                {},
+                {"collection_name": 1, "cluster": 1, "database_name": 1}
+            )
+            for org in list(orgs):
+                database = self.db.get_tenant_db(org.get("cluster"), org.get("database_name"))
+                yield kind, org["collection_name"], database[org["collection_name"]]
+    
+    def pending(self, kinds: Optional[List[str]] = None) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for kind, _, collection in self.targets(kinds):
+            counts[kind] = counts.get(kind, 0) + collection.count_documents(outdated_filter(kind))
+        return counts
+    
+    def throttle(self, latency: float, batch_size: int) -> int:
+        if latency > self.target_latency:
+            self.sleep(min(self.max_pause, latency))
+            return max(self.min_batch_size, batch_size // 2)
+        return min(self.max_batch_size, batch_size + max(1, batch_size // 4))
+    
+    def migrate_collection(
+        self,
+        kind: str,
+        name: str,
+        collection: Collection,
+        dry_run: bool = False,
+        restart: bool = False
+    ) -> Dict[str, Any]:
+        version = current_version(kind)
+        checkpoint_id = f"{kind}:{name}"
+        checkpoint = None if restart else self.checkpoints.find_one({"_id": checkpoint_id, "version": version})
+        stats = {"scanned": 0, "migrated": 0, "batches": 0, "paused_seconds": 0.0}
+        if checkpoint is not None and checkpoint.get("done"):
+            return {**stats, "skipped": True}
+        
+        last_id = checkpoint.get("last_id") if checkpoint else None
+        batch_size = self.batch_size
+        while True:
+            started = time.perf_counter()
+            query = outdated_filter(kind)
+            if last_id is not None:
+                query["_id"] = {"$gt": last_id}
+            docs = list(collection.find(query).sort("_id", 1).limit(batch_size))
+            if not docs:
+                break
+            
+            requests = []
+            for doc in docs:
+                upgraded = upgrade_document(kind, doc)
+                if upgraded is None:
+                    continue
+                requests.append(UpdateOne(
+                    {"_id": doc["_id"], SCHEMA_VERSION_FIELD: version_filter(document_version(doc))},
+                    document_changes(doc, upgraded)
+                ))
+            
+            if requests and not dry_run:
+                result = collection.bulk_write(requests, ordered=False)
+                stats["migrated"] += result.modified_count
+            elif dry_run:
+                stats["migrated"] += len(requests)
+            latency = time.perf_counter() - started
+            
+            stats["scanned"] += len(docs)
+            stats["batches"] += 1
+            last_id = docs[-1]["_id"]
+            if not dry_run:
+                self.save_checkpoint(checkpoint_id, version, last_id, False)
+            if self.progress is not None:
+                self.progress(checkpoint_id, {**stats, "batch_size": batch_size, "latency_ms": round(latency * 1000, 2)})
+            
+            paused = time.perf_counter()
+            batch_size = self.throttle(latency, batch_size)
+            stats["paused_seconds"] += time.perf_counter() - paused
+        
+        if not dry_run:
+            self.save_checkpoint(checkpoint_id, version, None, True)
+        return stats
+    
+    def save_checkpoint(self, checkpoint_id: str, version: int, last_id: Any, done: bool) -> None:
+        self.checkpoints.update_one(
+            {"_id": checkpoint_id},
+            {"$set": {"version": version, "last_id": last_id, "done": done, "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+    
+    def run(
+        self,
+        kinds: Optional[List[str]] = None,
+        dry_run: bool = False,
+        restart: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        results: Dict[str, Dict[str, Any]] = {}
+        for kind, name, collection in self.targets(kinds):
+            results[f"{kind}:{name}"] = self.migrate_collection(kind, name, collection, dry_run, restart)
+        return results
@@ -0,0 +1,85 @@
+import copy
+from typing import Dict, Any, List, Optional
+
+from pymongo.collection import Collection
+from pymongo.errors import PyMongoError
+
+from app.migrations.base import SCHEMA_VERSION_FIELD, Migration
+from app.migrations.versions import MIGRATIONS
+
+
+_MISSING = object()
+
+
+def migrations_for(collection: str) -> List[Migration]:
+    return sorted(
+        (migration for migration in MIGRATIONS if migration.collection == collection),
+        key=lambda migration: migration.version
+    )
+
+
+def current_version(collection: str) -> int:
+    return max((migration.version for migration in migrations_for(collection)), default=0)
+
+
+def document_version(document: Dict[str, Any]) -> int:
+    return document.get(SCHEMA_VERSION_FIELD) or 0
+
+
+def version_filter(version: int) -> Any:
+    if version == 0:
+        return {"$in": [None, 0]}
+    return version
+
+
+def outdated_filter(collection: str) -> Dict[str, Any]:
+    return {SCHEMA_VERSION_FIELD: {"$not": {"$gte": current_version(collection)}}}
+
+
+def upgrade_document(collection: str, document: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    version = document_version(document)
+    pending = [migration for migration in migrations_for(collection) if migration.version > version]
+    if not pending:
+        return None
+    
+    upgraded = copy.deepcopy(document)
+    for migration in pending:
+        upgraded = migration.upgrade(upgraded)
+        upgraded[SCHEMA_VERSION_FIELD] = migration.version
+    return upgraded
+
+
+def document_changes(original: Dict[str, Any], upgraded: Dict[str, Any]) -> Dict[str, Any]:
+    changes: Dict[str, Any] = {}
+    changed = {
+        key: value for key, value in upgraded.items()
+        if key != "_id" and original.get(key, _MISSING) != value
+    }
+    removed = {key: "" for key in original if key not in upgraded}
+    if changed:
+        changes["$set"] = changed
+    if removed:
+        changes["$unset"] = removed
+    return changes
+
+
+def upgrade_on_read(
+    collection: str,
+    document: Optional[Dict[str, Any]],
+    writer: Optional[Collection] = None
+) -> Optional[Dict[str, Any]]:
+    if document is None:
+        return None
+    upgraded = upgrade_document(collection, document)
+    if upgraded is None:
+        return document
+    
+    if writer is not None and "_id" in document:
+        try:
+            writer.update_one(
+                {"_id": document["_id"], SCHEMA_VERSION_FIELD: version_filter(document_version(document))},
+                document_changes(document, upgraded)
+            )
+        except PyMongoError:
+            pass
+    return upgraded
@@ -0,0 +1,9 @@
+from app.migrations.versions.organizations_0001_status_and_placement import OrganizationStatusAndPlacement
+from app.migrations.versions.admins_0001_defaults import AdminDefaults
+
+MIGRATIONS = [
+    OrganizationStatusAndPlacement(),
+    AdminDefaults()
+]
+
+__all__ = ["MIGRATIONS"]
@@ -0,0 +1,15 @@
+from typing import Dict, Any
+
+from app.migrations.base import Migration
+
+
+class AdminDefaults(Migration):
+    collection = "admins"
+    version = 1
+    description = "Backfill is_active and updated_at on admins created before they existed"
+    
+    def upgrade(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        document.setdefault("is_active", True)
+        if document.get("updated_at") is None and document.get("created_at") is not None:
+            document["updated_at"] = document["created_at"]
+        return document
@@ -0,0 +1,19 @@
+from typing import Dict, Any
+
+from app.config import settings
+from app.migrations.base import Migration
+
+
+class OrganizationStatusAndPlacement(Migration):
+    collection = "organizations"
+    version = 1
+    description = "Backfill status, cluster and database_name on organizations created before they existed"
+    
+    def upgrade(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        document.setdefault("status", "active")
+        document.setdefault("is_active", True)
+        if not document.get("cluster"):
+            document["cluster"] = settings.DEFAULT_CLUSTER
+        if not document.get("database_name"):
+            document["database_name"] = settings.MASTER_DB_NAME
+        return document
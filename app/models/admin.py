@@ -3,6 +3,8 @@ from typing import Optional
 from pydantic import BaseModel, Field, EmailStr
 from bson import ObjectId
 
+from app.migrations.upgrade import current_version
+
 
 class PyObjectId(ObjectId):
     @classmethod
@@ -29,6 +31,7 @@ class Admin(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     is_active: bool = Field(default=True)
+    schema_version: int = Field(default=current_version("admins"), description="Document schema version")
     
     class Config:
         populate_by_name = True
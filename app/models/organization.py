@@ -3,6 +3,8 @@ from typing import Optional
 from pydantic import BaseModel, Field
 from bson import ObjectId
 
+from app.migrations.upgrade import current_version
+
 
 class PyObjectId(ObjectId):
     @classmethod
@@ -26,9 +28,13 @@ class Organization(BaseModel):
     collection_name: str = Field(..., description="MongoDB collection name for this org")
     admin_email: str = Field(..., description="Admin email address")
     admin_id: Optional[str] = Field(None, description="Reference to admin user ID")
+    cluster: str = Field(default="primary", description="Cluster holding the org collection")
+    database_name: Optional[str] = Field(None, description="Database holding the org collection")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     is_active: bool = Field(default=True)
+    schema_version: int = Field(default=current_version("organizations"), description="Document schema version")
+    status: str = Field(default="active", description="Provisioning state: provisioning, active or failed")
     
     class Config:
         populate_by_name = True
@@ -0,0 +1,4 @@
+from app.monitoring.health import HealthMonitor, health_monitor, pool_stats
+from app.monitoring.metrics import MetricsRegistry, registry
+
+__all__ = ["HealthMonitor", "health_monitor", "pool_stats", "MetricsRegistry", "registry"]
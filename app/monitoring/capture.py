@@ -0,0 +1,119 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional
+
+from app.config import settings
+from app.monitoring.metrics import capture_records_total
+
+
+CAPTURE_FORMAT_VERSION = 1
+
+
+class TrafficRecorder:
+    def __init__(
+        self,
+        path: str = settings.CAPTURE_PATH,
+        sample_rate: float = settings.CAPTURE_SAMPLE_RATE,
+        salt: str = settings.CAPTURE_SALT,
+        max_bytes: int = settings.CAPTURE_MAX_BYTES,
+        max_buffer: int = settings.CAPTURE_MAX_BUFFER,
+        flush_interval: float = settings.CAPTURE_FLUSH_INTERVAL_SECONDS,
+        enabled: bool = settings.CAPTURE_ENABLED
+    ):
+        self.path = path.format(pid=os.getpid())
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        self.max_buffer = max_buffer
+        self.flush_interval = flush_interval
+        self.enabled = enabled
+        self.started = time.time()
+        self._key = hashlib.sha256((salt or os.urandom(32).hex()).encode()).digest()
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._written = 0
+        self._full = False
+        self._task: Optional[asyncio.Task] = None
+    
+    def pseudonym(self, value: str) -> str:
+        return hashlib.blake2b(value.encode(), key=self._key, digest_size=6).hexdigest()
+    
+    def sampled(self) -> bool:
+        if not self.enabled or self._full:
+            return False
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+    
+    def record(self, entry: Dict[str, Any]) -> None:
+        dropped = 0
+        with self._lock:
+            self._buffer.append(entry)
+            while len(self._buffer) > self.max_buffer:
+                self._buffer.popleft()
+                dropped += 1
+        if dropped:
+            capture_records_total.inc(dropped, outcome="dropped")
+    
+    def header(self) -> Dict[str, Any]:
+        return {
+            "v": CAPTURE_FORMAT_VERSION,
+            "pid": os.getpid(),
+            "started": round(self.started, 3),
+            "sample_rate": self.sample_rate
+        }
+    
+    def flush(self) -> int:
+        with self._lock:
+            batch: List[Dict[str, Any]] = list(self._buffer)
+            self._buffer.clear()
+        if not batch:
+            return 0
+        
+        with self._write_lock:
+            if self._full:
+                capture_records_total.inc(len(batch), outcome="dropped")
+                return 0
+            lines = [json.dumps(entry, separators=(",", ":")) for entry in batch]
+            if not self._written:
+                lines.insert(0, json.dumps(self.header(), separators=(",", ":")))
+            data = "\n".join(lines) + "\n"
+            opener = gzip.open if self.path.endswith(".gz") else open
+            try:
+                with opener(self.path, "at") as capture:
+                    capture.write(data)
+            except OSError:
+                capture_records_total.inc(len(batch), outcome="dropped")
+                return 0
+            self._written += len(data)
+            if self.max_bytes and self._written >= self.max_bytes:
+                self._full = True
+        capture_records_total.inc(len(batch), outcome="written")
+        return len(batch)
+    
+    async def start(self) -> None:
+        if self.enabled and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.flush)
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await asyncio.to_thread(self.flush)
+
+
+traffic_recorder = TrafficRecorder()
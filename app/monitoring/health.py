@@ -0,0 +1,194 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from pymongo import monitoring
+
+from app.config import settings
+from app.database import DatabaseManager, db_manager, register_event_listener
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connections_open = 0
+        self.connections_in_use = 0
+        self.checkouts = 0
+        self.checkout_failures = 0
+        self.pool_clears = 0
+    
+    def _add(self, field: str, delta: int = 1) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + delta)
+    
+    def pool_created(self, event):
+        pass
+    
+    def pool_ready(self, event):
+        pass
+    
+    def pool_cleared(self, event):
+        self._add("pool_clears")
+    
+    def pool_closed(self, event):
+        pass
+    
+    def connection_created(self, event):
+        self._add("connections_open")
+    
+    def connection_ready(self, event):
+        pass
+    
+    def connection_closed(self, event):
+        self._add("connections_open", -1)
+    
+    def connection_check_out_started(self, event):
+        pass
+    
+    def connection_check_out_failed(self, event):
+        self._add("checkout_failures")
+    
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.checkouts += 1
+            self.connections_in_use += 1
+    
+    def connection_checked_in(self, event):
+        self._add("connections_in_use", -1)
+    
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "connections_open": self.connections_open,
+                "connections_in_use": self.connections_in_use,
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "pool_clears": self.pool_clears
+            }
+
+
+pool_stats = PoolStatsListener()
+register_event_listener(pool_stats)
+
+
+class HealthMonitor:
+    def __init__(
+        self,
+        db: DatabaseManager,
+        interval: float = settings.HEALTH_CHECK_INTERVAL_SECONDS,
+        timeout: float = settings.HEALTH_CHECK_TIMEOUT_SECONDS,
+        max_staleness: float = settings.HEALTH_MAX_STALENESS_SECONDS
+    ):
+        self.db = db
+        self.interval = interval
+        self.timeout = timeout
+        self.max_staleness = max_staleness
+        self.started_at = time.time()
+        self._task: Optional[asyncio.Task] = None
+        self._probe_lock: Optional[asyncio.Lock] = None
+        self._ok = False
+        self._error: Optional[str] = None
+        self._checked_at: Optional[float] = None
+        self._checked_monotonic: Optional[float] = None
+        self._latency_ms: Optional[float] = None
+        self._latency_ewma_ms: Optional[float] = None
+        self._consecutive_failures = 0
+    
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self) -> None:
+        while True:
+            await self.probe()
+            await asyncio.sleep(self.interval)
+    
+    async def probe(self) -> None:
+        if self._probe_lock is None:
+            self._probe_lock = asyncio.Lock()
+        if self._probe_lock.locked():
+            async with self._probe_lock:
+                return
+        
+        async with self._probe_lock:
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(
+                    asyncio.to_thread(self.db.get_master_db().command, 'ping'),
+                    timeout=self.timeout
+                )
+                self._record(True, None, started)
+            except asyncio.TimeoutError:
+                self._record(False, f"ping timed out after {self.timeout}s", started)
+            except Exception as e:
+                self._record(False, str(e), started)
+    
+    def _record(self, ok: bool, error: Optional[str], started: float) -> None:
+        latency_ms = (time.perf_counter() - started) * 1000
+        self._ok = ok
+        self._error = error
+        self._checked_at = time.time()
+        self._checked_monotonic = time.monotonic()
+        if ok:
+            self._latency_ms = latency_ms
+            if self._latency_ewma_ms is None:
+                self._latency_ewma_ms = latency_ms
+            else:
+                self._latency_ewma_ms = 0.8 * self._latency_ewma_ms + 0.2 * latency_ms
+            self._consecutive_failures = 0
+        else:
+            self._consecutive_failures += 1
+    
+    def age(self) -> Optional[float]:
+        if self._checked_monotonic is None:
+            return None
+        return time.monotonic() - self._checked_monotonic
+    
+    def is_stale(self) -> bool:
+        age = self.age()
+        return age is None or age > self.max_staleness
+    
+    def is_ready(self) -> bool:
+        return self._ok and not self.is_stale()
+    
+    def database_status(self) -> str:
+        if self._checked_monotonic is None:
+            return "unknown"
+        if self._ok:
+            return "connected"
+        return f"error: {self._error}"
+    
+    def liveness(self) -> Dict[str, Any]:
+        return {
+            "status": "alive",
+            "app": settings.APP_NAME,
+            "uptime_seconds": round(time.time() - self.started_at, 3)
+        }
+    
+    def readiness(self) -> Dict[str, Any]:
+        age = self.age()
+        return {
+            "status": "ready" if self.is_ready() else "not_ready",
+            "database": self.database_status(),
+            "checked_at": self._checked_at,
+            "age_seconds": round(age, 3) if age is not None else None,
+            "max_staleness_seconds": self.max_staleness,
+            "stale": self.is_stale(),
+            "latency_ms": round(self._latency_ms, 3) if self._latency_ms is not None else None,
+            "latency_ewma_ms": round(self._latency_ewma_ms, 3) if self._latency_ewma_ms is not None else None,
+            "consecutive_failures": self._consecutive_failures,
+            "pool": pool_stats.snapshot()
+        }
+
+
+health_monitor = HealthMonitor(db_manager)
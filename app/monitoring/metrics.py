@@ -0,0 +1,522 @@
+import asyncio
+import bisect
+import glob
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+
+from pymongo import monitoring
+
+from app.config import settings
+from app.database import TENANT_COLLECTION_PREFIX, register_event_listener
+
+
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+TENANT_COLLECTION_LABEL = "tenant"
+
+LabelKey = Tuple[str, ...]
+
+
+class _Metric:
+    kind = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._tls = threading.local()
+        self._shards: List[Dict[LabelKey, List[float]]] = []
+        self._shards_lock = threading.Lock()
+    
+    def _shard(self) -> Dict[LabelKey, List[float]]:
+        shard = getattr(self._tls, "values", None)
+        if shard is None:
+            shard = {}
+            self._tls.values = shard
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+    
+    def _key(self, labels: Dict[str, str]) -> LabelKey:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+    
+    def _width(self) -> int:
+        return 1
+    
+    def _slot(self, labels: Dict[str, str]) -> List[float]:
+        shard = self._shard()
+        key = self._key(labels)
+        values = shard.get(key)
+        if values is None:
+            values = shard[key] = [0.0] * self._width()
+        return values
+    
+    def collect(self) -> Dict[LabelKey, List[float]]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        merged: Dict[LabelKey, List[float]] = {}
+        for shard in shards:
+            for key, values in dict(shard).items():
+                values = list(values)
+                current = merged.get(key)
+                if current is None:
+                    merged[key] = values
+                else:
+                    for i, value in enumerate(values):
+                        current[i] += value
+        return merged
+    
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "type": self.kind,
+            "help": self.documentation,
+            "labelnames": list(self.labelnames)
+        }
+
+
+class Counter(_Metric):
+    kind = "counter"
+    
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        self._slot(labels)[0] += amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._set_values: Dict[LabelKey, float] = {}
+    
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        self._slot(labels)[0] += amount
+    
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self._slot(labels)[0] -= amount
+    
+    def set(self, value: float, **labels: str) -> None:
+        self._set_values[self._key(labels)] = float(value)
+    
+    def collect(self) -> Dict[LabelKey, List[float]]:
+        merged = super().collect()
+        for key, value in dict(self._set_values).items():
+            merged[key] = [merged.get(key, [0.0])[0] + value]
+        return merged
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+    
+    def _width(self) -> int:
+        return len(self.buckets) + 3
+    
+    def observe(self, value: float, **labels: str) -> None:
+        values = self._slot(labels)
+        values[bisect.bisect_left(self.buckets, value)] += 1
+        values[-2] += value
+        values[-1] += 1
+    
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+    
+    def describe(self) -> Dict[str, Any]:
+        description = super().describe()
+        description["buckets"] = list(self.buckets)
+        return description
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames: Sequence[str], key: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, key)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{_escape(extra[1])}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MetricsRegistry:
+    def __init__(self, multiproc_dir: str = ""):
+        self.multiproc_dir = multiproc_dir
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._export_task: Optional[asyncio.Task] = None
+    
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+    
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+    
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+    
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            metric.name: {
+                **metric.describe(),
+                "samples": [[list(key), values] for key, values in metric.collect().items()]
+            }
+            for metric in metrics
+        }
+    
+    def _snapshot_path(self, pid: int) -> str:
+        return os.path.join(self.multiproc_dir, f"metrics_{pid}.json")
+    
+    def write_snapshot(self) -> None:
+        if not self.multiproc_dir:
+            return
+        os.makedirs(self.multiproc_dir, exist_ok=True)
+        pid = os.getpid()
+        path = self._snapshot_path(pid)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"pid": pid, "written_at": time.time(), "metrics": self.snapshot()}, f)
+        os.replace(tmp_path, path)
+    
+    async def start_export(self, interval: float = settings.METRICS_EXPORT_INTERVAL_SECONDS) -> None:
+        if not self.multiproc_dir or self._export_task is not None:
+            return
+        
+        async def export_loop() -> None:
+            while True:
+                await asyncio.to_thread(self.write_snapshot)
+                await asyncio.sleep(interval)
+        
+        self._export_task = asyncio.create_task(export_loop())
+    
+    async def stop_export(self) -> None:
+        if self._export_task is None:
+            return
+        self._export_task.cancel()
+        try:
+            await self._export_task
+        except asyncio.CancelledError:
+            pass
+        self._export_task = None
+        self.write_snapshot()
+    
+    def _merged_snapshot(self) -> Dict[str, Any]:
+        if not self.multiproc_dir:
+            return self.snapshot()
+        
+        self.write_snapshot()
+        merged: Dict[str, Any] = {}
+        for path in sorted(glob.glob(os.path.join(self.multiproc_dir, "metrics_*.json"))):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            alive = _pid_alive(int(data.get("pid", 0)))
+            for name, metric in data.get("metrics", {}).items():
+                if metric["type"] == "gauge" and not alive:
+                    continue
+                target = merged.setdefault(name, {**metric, "samples": []})
+                index = {tuple(key): values for key, values in target["samples"]}
+                for key, values in metric["samples"]:
+                    current = index.get(tuple(key))
+                    if current is None:
+                        index[tuple(key)] = list(values)
+                    else:
+                        for i, value in enumerate(values):
+                            current[i] += value
+                target["samples"] = [[list(key), values] for key, values in index.items()]
+        return merged
+    
+    def render(self) -> str:
+        lines: List[str] = []
+        for name, metric in sorted(self._merged_snapshot().items()):
+            lines.append(f"# HELP {name} {metric['help']}")
+            lines.append(f"# TYPE {name} {metric['type']}")
+            labelnames = metric["labelnames"]
+            for key, values in sorted(metric["samples"]):
+                if metric["type"] == "histogram":
+                    cumulative = 0.0
+                    bounds = list(metric["buckets"]) + [float("inf")]
+                    for bound, count in zip(bounds, values[:-2]):
+                        cumulative += count
+                        labels = _format_labels(labelnames, key, ("le", _format_value(bound)))
+                        lines.append(f"{name}_bucket{labels} {_format_value(cumulative)}")
+                    labels = _format_labels(labelnames, key)
+                    lines.append(f"{name}_sum{labels} {_format_value(values[-2])}")
+                    lines.append(f"{name}_count{labels} {_format_value(values[-1])}")
+                else:
+                    lines.append(f"{name}{_format_labels(labelnames, key)} {_format_value(values[0])}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry(settings.METRICS_MULTIPROC_DIR)
+
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "Total HTTP requests by method, route and status code",
+    ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route",
+    ("method", "route")
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served by method and route",
+    ("method", "route")
+)
+http_requests_throttled_total = registry.counter(
+    "http_requests_throttled_total",
+    "HTTP requests rejected by the rate limiter by route and key scope",
+    ("route", "scope")
+)
+concurrency_limit = registry.gauge(
+    "concurrency_limit",
+    "Current adaptive in-flight request limit for this worker"
+)
+concurrency_in_flight = registry.gauge(
+    "concurrency_in_flight",
+    "Requests admitted by the concurrency limiter and still running"
+)
+concurrency_queue_depth = registry.gauge(
+    "concurrency_queue_depth",
+    "Requests waiting for a concurrency limiter slot"
+)
+concurrency_queue_wait_seconds = registry.histogram(
+    "concurrency_queue_wait_seconds",
+    "Time requests spent waiting for a concurrency limiter slot by priority",
+    ("priority",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+requests_shed_total = registry.counter(
+    "requests_shed_total",
+    "Requests rejected by the concurrency limiter by priority and reason",
+    ("priority", "reason")
+)
+provisioning_jobs_total = registry.counter(
+    "provisioning_jobs_total",
+    "Organization provisioning job attempts by outcome",
+    ("outcome",)
+)
+provisioning_duration_seconds = registry.histogram(
+    "provisioning_duration_seconds",
+    "Time spent provisioning an organization collection",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+audit_events_total = registry.counter(
+    "audit_events_total",
+    "Audit events by outcome: buffered, written, dropped, spilled or replayed",
+    ("outcome",)
+)
+audit_buffer_depth = registry.gauge(
+    "audit_buffer_depth",
+    "Audit events waiting in memory to be written"
+)
+audit_flush_duration_seconds = registry.histogram(
+    "audit_flush_duration_seconds",
+    "Time spent writing a batch of audit events"
+)
+org_stats_updates_total = registry.counter(
+    "org_stats_updates_total",
+    "Incremental organization statistics updates by outcome: applied or failed",
+    ("outcome",)
+)
+org_stats_drift = registry.gauge(
+    "org_stats_drift",
+    "Sum of counter corrections made by the last organization statistics reconciliation"
+)
+org_stats_reconcile_duration_seconds = registry.histogram(
+    "org_stats_reconcile_duration_seconds",
+    "Time spent reconciling organization statistics",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+)
+tenant_usage_samples_total = registry.counter(
+    "tenant_usage_samples_total",
+    "Tenant collection usage samples by outcome: sampled or failed",
+    ("outcome",)
+)
+quota_rejections_total = registry.counter(
+    "quota_rejections_total",
+    "Requests rejected for exceeding an organization quota",
+    ("quota",)
+)
+capture_records_total = registry.counter(
+    "capture_records_total",
+    "Captured request records by outcome: written or dropped",
+    ("outcome",)
+)
+token_cache_requests_total = registry.counter(
+    "token_cache_requests_total",
+    "Verified-claims cache lookups in decode_access_token by result: hit, miss or expired",
+    ("result",)
+)
+token_cache_entries = registry.gauge(
+    "token_cache_entries",
+    "Verified tokens currently held in this worker's claims cache"
+)
+refresh_tokens_total = registry.counter(
+    "refresh_tokens_total",
+    "Refresh token operations by outcome: issued, rotated, reused or invalid",
+    ("outcome",)
+)
+token_revocation_checks_total = registry.counter(
+    "token_revocation_checks_total",
+    "Revocation checks on authenticated requests by result: clear, filter_hit or revoked",
+    ("result",)
+)
+mongodb_command_duration_seconds = registry.histogram(
+    "mongodb_command_duration_seconds",
+    "MongoDB command latency by command name and collection (tenant collections share the label 'tenant')",
+    ("command", "collection")
+)
+mongodb_command_failures_total = registry.counter(
+    "mongodb_command_failures_total",
+    "Failed MongoDB commands by command name and collection (tenant collections share the label 'tenant')",
+    ("command", "collection")
+)
+mongodb_pool_checkout_wait_seconds = registry.histogram(
+    "mongodb_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the MongoDB pool"
+)
+bcrypt_duration_seconds = registry.histogram(
+    "bcrypt_duration_seconds",
+    "Time spent in bcrypt password hashing and verification",
+    ("operation",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0, 5.0)
+)
+
+
+def collection_label(collection: str) -> str:
+    if collection.startswith(TENANT_COLLECTION_PREFIX):
+        return TENANT_COLLECTION_LABEL
+    return collection
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    def __init__(self):
+        self._collections: Dict[Tuple[Any, int], str] = {}
+    
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        if not isinstance(collection, str):
+            collection = ""
+        self._collections[(event.connection_id, event.request_id)] = collection_label(collection)
+    
+    def succeeded(self, event):
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        mongodb_command_duration_seconds.observe(
+            event.duration_micros / 1_000_000,
+            command=event.command_name,
+            collection=collection
+        )
+    
+    def failed(self, event):
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        mongodb_command_duration_seconds.observe(
+            event.duration_micros / 1_000_000,
+            command=event.command_name,
+            collection=collection
+        )
+        mongodb_command_failures_total.inc(command=event.command_name, collection=collection)
+
+
+class PoolCheckoutListener(monitoring.ConnectionPoolListener):
+    def __init__(self):
+        self._tls = threading.local()
+    
+    def pool_created(self, event):
+        pass
+    
+    def pool_ready(self, event):
+        pass
+    
+    def pool_cleared(self, event):
+        pass
+    
+    def pool_closed(self, event):
+        pass
+    
+    def connection_created(self, event):
+        pass
+    
+    def connection_ready(self, event):
+        pass
+    
+    def connection_closed(self, event):
+        pass
+    
+    def connection_check_out_started(self, event):
+        self._tls.started = time.perf_counter()
+    
+    def connection_check_out_failed(self, event):
+        self._tls.started = None
+    
+    def connection_checked_out(self, event):
+        started = getattr(self._tls, "started", None)
+        if started is not None:
+            mongodb_pool_checkout_wait_seconds.observe(time.perf_counter() - started)
+            self._tls.started = None
+    
+    def connection_checked_in(self, event):
+        pass
+
+
+command_listener = CommandMetricsListener()
+checkout_listener = PoolCheckoutListener()
+register_event_listener(command_listener)
+register_event_listener(checkout_listener)
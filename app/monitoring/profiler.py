@@ -0,0 +1,127 @@
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Dict, Any, List, Optional
+
+from app.config import settings
+
+
+class DiagnosticsBusyError(RuntimeError):
+    pass
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    parts = filename.replace("\\", "/").split("/")
+    if "site-packages" in parts:
+        filename = "/".join(parts[parts.index("site-packages") + 1:])
+    elif "app" in parts:
+        filename = "/".join(parts[parts.index("app"):])
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ",")
+
+
+class SamplingProfiler:
+    def __init__(self):
+        self._lock = threading.Lock()
+    
+    def run(self, seconds: float, interval: float) -> Dict[str, Any]:
+        if not self._lock.acquire(blocking=False):
+            raise DiagnosticsBusyError("A profiling session is already running")
+        try:
+            return self._sample(seconds, interval)
+        finally:
+            self._lock.release()
+    
+    def _sample(self, seconds: float, interval: float) -> Dict[str, Any]:
+        own_thread = threading.get_ident()
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        stacks: Counter = Counter()
+        samples = 0
+        started = time.perf_counter()
+        deadline = started + seconds
+        
+        while time.perf_counter() < deadline:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                labels: List[str] = []
+                while frame is not None:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                labels.append(thread_names.get(thread_id, f"thread-{thread_id}"))
+                stacks[";".join(reversed(labels))] += 1
+            samples += 1
+            time.sleep(interval)
+        
+        return {
+            "duration_seconds": round(time.perf_counter() - started, 3),
+            "samples": samples,
+            "collapsed": "\n".join(f"{stack} {count}" for stack, count in stacks.most_common())
+        }
+
+
+class AllocationTracker:
+    def __init__(self, frames: int):
+        self.frames = frames
+        self._lock = threading.Lock()
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._started_tracing = False
+    
+    def begin(self) -> None:
+        if not self._lock.acquire(blocking=False):
+            raise DiagnosticsBusyError("An allocation capture is already running")
+        try:
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start(self.frames)
+            self._baseline = self._snapshot()
+        except Exception:
+            self._lock.release()
+            raise
+    
+    def finish(self, key_type: str, limit: int) -> Dict[str, Any]:
+        try:
+            current = self._snapshot()
+            traced, peak = tracemalloc.get_traced_memory()
+            stats = current.compare_to(self._baseline, key_type)
+            return {
+                "key_type": key_type,
+                "traced_bytes": traced,
+                "peak_bytes": peak,
+                "top": [
+                    {
+                        "location": [
+                            f"{frame.filename}:{frame.lineno}" for frame in stat.traceback
+                        ],
+                        "size_diff_bytes": stat.size_diff,
+                        "size_bytes": stat.size,
+                        "count_diff": stat.count_diff,
+                        "count": stat.count
+                    }
+                    for stat in stats[:limit]
+                ]
+            }
+        finally:
+            self._baseline = None
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+            self._lock.release()
+    
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>")
+        ))
+
+
+profiler = SamplingProfiler()
+allocation_tracker = AllocationTracker(settings.TRACEMALLOC_FRAMES)
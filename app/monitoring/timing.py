@@ -0,0 +1,107 @@
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, List, Optional
+
+from fastapi.responses import JSONResponse
+from pymongo import monitoring
+
+from app.database import register_event_listener
+
+
+slow_log = logging.getLogger("app.slow_operations")
+
+_current_timing: ContextVar[Optional["RequestTiming"]] = ContextVar("request_timing", default=None)
+
+
+class RequestTiming:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, List[float]] = {}
+    
+    def add(self, phase: str, seconds: float) -> None:
+        entry = self.phases.get(phase)
+        if entry is None:
+            self.phases[phase] = [seconds, 1]
+        else:
+            entry[0] += seconds
+            entry[1] += 1
+    
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+    
+    def server_timing_header(self) -> str:
+        parts = []
+        for phase, (seconds, count) in self.phases.items():
+            part = f"{phase};dur={seconds * 1000:.3f}"
+            if count > 1:
+                part += f';desc="{int(count)}x"'
+            parts.append(part)
+        parts.append(f"total;dur={self.elapsed() * 1000:.3f}")
+        return ", ".join(parts)
+    
+    def breakdown(self) -> Dict[str, Dict[str, float]]:
+        return {
+            phase: {"duration_ms": round(seconds * 1000, 3), "count": int(count)}
+            for phase, (seconds, count) in self.phases.items()
+        }
+
+
+def start_request_timing() -> RequestTiming:
+    timing = RequestTiming()
+    _current_timing.set(timing)
+    return timing
+
+
+def stop_request_timing() -> None:
+    _current_timing.set(None)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    return _current_timing.get()
+
+
+def record_phase(phase: str, seconds: float) -> None:
+    timing = _current_timing.get()
+    if timing is not None:
+        timing.add(phase, seconds)
+
+
+@contextmanager
+def timed_phase(phase: str) -> Iterator[None]:
+    timing = _current_timing.get()
+    if timing is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.add(phase, time.perf_counter() - started)
+
+
+def log_slow_operation(entry: Dict[str, Any]) -> None:
+    slow_log.warning(json.dumps(entry, default=str))
+
+
+class TimedJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        with timed_phase("encode"):
+            return super().render(content)
+
+
+class CommandTimingListener(monitoring.CommandListener):
+    def started(self, event):
+        pass
+    
+    def succeeded(self, event):
+        record_phase(f"mongo.{event.command_name}", event.duration_micros / 1_000_000)
+    
+    def failed(self, event):
+        record_phase(f"mongo.{event.command_name}", event.duration_micros / 1_000_000)
+
+
+command_timing_listener = CommandTimingListener()
+register_event_listener(command_timing_listener)
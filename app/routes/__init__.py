@@ -1,4 +1,17 @@
 from app.routes.organization import router as organization_router
 from app.routes.admin import router as admin_router
+from app.routes.health import router as health_router
+from app.routes.metrics import router as metrics_router
+from app.routes.diagnostics import router as diagnostics_router
+from app.routes.audit import router as audit_router
+from app.routes.jwks import router as jwks_router
 
-__all__ = ["organization_router", "admin_router"]
+__all__ = [
+    "organization_router",
+    "admin_router",
+    "health_router",
+    "metrics_router",
+    "diagnostics_router",
+    "audit_router",
+    "jwks_router"
+]
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from typing import Dict, Any
 
-from app.schemas.admin import AdminLogin, TokenResponse
-from app.services.auth_service import AuthService
+from app.schemas.admin import AdminLogin, RefreshRequest, TokenResponse
+from app.audit import audit_log
+from app.services.auth_service import AuthService, get_refresh_token_store
+from app.services.revocation_service import revocation_service
 from app.database import DatabaseManager, get_db
+from app.utils.dependencies import get_current_admin, request_actor
 
 
 router = APIRouter(prefix="/admin", tags=["Authentication"])
@@ -18,11 +21,84 @@ router = APIRouter(prefix="/admin", tags=["Authentication"])
 )
 async def admin_login(
     credentials: AdminLogin,
+    request: Request,
     db: DatabaseManager = Depends(get_db)
 ) -> Dict[str, Any]:
     service = AuthService(db)
-    result = service.authenticate_admin(
-        email=credentials.email,
-        password=credentials.password
-    )
+    with audit_log.track("admin.login", actor=request_actor(request, email=credentials.email)) as event:
+        result = service.authenticate_admin(
+            email=credentials.email,
+            password=credentials.password
+        )
+        event["organization_name"] = result["organization_name"]
+        event["actor"]["admin_id"] = result["admin_id"]
     return result
+
+
+@router.post(
+    "/refresh",
+    response_model=TokenResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Refresh access token",
+    description="Exchanges a single-use refresh token for a new access token and refresh token"
+)
+async def refresh_token(
+    body: RefreshRequest,
+    request: Request,
+    db: DatabaseManager = Depends(get_db)
+) -> Dict[str, Any]:
+    service = AuthService(db)
+    with audit_log.track("admin.refresh", actor=request_actor(request)) as event:
+        result = service.refresh_tokens(body.refresh_token)
+        event["organization_name"] = result["organization_name"]
+        event["actor"].update(admin_id=result["admin_id"], email=result["email"])
+    return result
+
+
+@router.post(
+    "/logout",
+    status_code=status.HTTP_200_OK,
+    summary="Admin logout",
+    description="Revokes the access token used for this request and its refresh token session (requires authentication)"
+)
+async def admin_logout(
+    request: Request,
+    db: DatabaseManager = Depends(get_db),
+    current_admin: Dict[str, Any] = Depends(get_current_admin)
+) -> Dict[str, str]:
+    with audit_log.track(
+        "admin.logout",
+        organization_name=current_admin["organization_name"],
+        actor=request_actor(request, current_admin)
+    ):
+        revoked = revocation_service.revoke_token({
+            "jti": current_admin["jti"],
+            "sub": current_admin["admin_id"],
+            "exp": current_admin["exp"]
+        })
+        if not revoked:
+            revocation_service.revoke_admin(current_admin["admin_id"])
+        if current_admin.get("sid"):
+            get_refresh_token_store(db).revoke_family(current_admin["sid"])
+    return {"message": "Token revoked"}
+
+
+@router.post(
+    "/revoke-all",
+    status_code=status.HTTP_200_OK,
+    summary="Revoke all admin tokens",
+    description="Revokes every access and refresh token issued to the authenticated admin before this request (requires authentication)"
+)
+async def revoke_all_tokens(
+    request: Request,
+    db: DatabaseManager = Depends(get_db),
+    current_admin: Dict[str, Any] = Depends(get_current_admin)
+) -> Dict[str, str]:
+    with audit_log.track(
+        "admin.revoke_all",
+        organization_name=current_admin["organization_name"],
+        actor=request_actor(request, current_admin)
+    ):
+        revocation_service.revoke_admin(current_admin["admin_id"])
+        get_refresh_token_store(db).revoke_admin(current_admin["admin_id"])
+    return {"message": "All tokens revoked"}
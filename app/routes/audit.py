@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from app.audit import audit_log
+from app.config import settings
+from app.schemas.audit import AuditEventPage
+from app.utils.dependencies import get_current_admin
+
+
+router = APIRouter(prefix="/audit", tags=["Audit"])
+
+
+@router.get(
+    "/events",
+    response_model=AuditEventPage,
+    status_code=status.HTTP_200_OK,
+    summary="List audit events",
+    description="Returns the caller's organization audit events, newest first, filtered by time range and action (requires authentication)"
+)
+async def list_audit_events(
+    start: Optional[datetime] = Query(None, description="Only events at or after this time (UTC)"),
+    end: Optional[datetime] = Query(None, description="Only events before this time (UTC)"),
+    action: Optional[str] = Query(None, description="Only events with this action, e.g. org.update"),
+    limit: int = Query(100, ge=1, le=settings.AUDIT_QUERY_MAX_LIMIT, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    current_admin: Dict[str, Any] = Depends(get_current_admin)
+) -> Dict[str, Any]:
+    try:
+        return audit_log.query(
+            current_admin["organization_name"],
+            start=start,
+            end=end,
+            action=action,
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
@@ -0,0 +1,61 @@
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+from typing import Dict, Any
+
+from app.config import settings
+from app.monitoring.profiler import DiagnosticsBusyError, allocation_tracker, profiler
+from app.utils.dependencies import require_operator
+
+
+router = APIRouter(prefix="/diagnostics", tags=["Diagnostics"])
+
+
+@router.post(
+    "/profile",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Sample all threads",
+    description="Samples every thread's stack for the given duration and returns flamegraph-ready collapsed stacks (operators only)"
+)
+async def profile(
+    seconds: float = Query(10.0, gt=0, le=settings.DIAGNOSTICS_MAX_SECONDS),
+    interval_ms: float = Query(settings.PROFILER_INTERVAL_MS, ge=1, le=1000),
+    current_admin: Dict[str, Any] = Depends(require_operator)
+) -> PlainTextResponse:
+    try:
+        result = await asyncio.to_thread(profiler.run, seconds, interval_ms / 1000)
+    except DiagnosticsBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    
+    return PlainTextResponse(
+        result["collapsed"] + "\n",
+        headers={
+            "X-Profile-Samples": str(result["samples"]),
+            "X-Profile-Duration": str(result["duration_seconds"])
+        }
+    )
+
+
+@router.post(
+    "/allocations",
+    status_code=status.HTTP_200_OK,
+    summary="Diff allocation snapshots",
+    description="Traces allocations for the given duration and returns the largest growth between the two tracemalloc snapshots (operators only)"
+)
+async def allocations(
+    seconds: float = Query(10.0, gt=0, le=settings.DIAGNOSTICS_MAX_SECONDS),
+    key_type: str = Query("lineno", pattern="^(lineno|filename|traceback)$"),
+    limit: int = Query(25, ge=1, le=500),
+    current_admin: Dict[str, Any] = Depends(require_operator)
+) -> Dict[str, Any]:
+    try:
+        await asyncio.to_thread(allocation_tracker.begin)
+    except DiagnosticsBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        result = await asyncio.to_thread(allocation_tracker.finish, key_type, limit)
+    return result
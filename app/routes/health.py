@@ -0,0 +1,53 @@
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+from typing import Dict, Any
+
+from app.config import settings
+from app.monitoring.health import health_monitor
+
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    summary="Service health",
+    description="Returns the cached database status, refreshing it only when the last probe is stale"
+)
+async def health_check() -> Dict[str, Any]:
+    if health_monitor.is_stale():
+        await health_monitor.probe()
+    
+    readiness = health_monitor.readiness()
+    return {
+        "status": "healthy",
+        "database": readiness["database"],
+        "app": settings.APP_NAME,
+        "checked_at": readiness["checked_at"],
+        "latency_ms": readiness["latency_ms"],
+        "pool": readiness["pool"]
+    }
+
+
+@router.get(
+    "/live",
+    status_code=status.HTTP_200_OK,
+    summary="Liveness probe",
+    description="Reports that the process is serving requests without touching the database"
+)
+async def liveness() -> Dict[str, Any]:
+    return health_monitor.liveness()
+
+
+@router.get(
+    "/ready",
+    status_code=status.HTTP_200_OK,
+    summary="Readiness probe",
+    description="Reports the last background database probe and fails once it is older than the staleness bound"
+)
+async def readiness() -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if health_monitor.is_ready() else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=health_monitor.readiness()
+    )
@@ -0,0 +1,29 @@
+import hashlib
+import json
+
+from fastapi import APIRouter, Request, Response, status
+
+from app.config import settings
+from app.utils.security import get_key_set, uses_key_set
+
+
+router = APIRouter(tags=["Authentication"])
+
+
+@router.get(
+    "/.well-known/jwks.json",
+    status_code=status.HTTP_200_OK,
+    summary="JSON Web Key Set",
+    description="Public keys for verifying access tokens, including the next key before it starts signing"
+)
+async def jwks(request: Request) -> Response:
+    keys = get_key_set().jwks() if uses_key_set() else {"keys": []}
+    body = json.dumps(keys, separators=(",", ":"), sort_keys=True).encode()
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    headers = {
+        "Cache-Control": f"public, max-age={settings.JWKS_MAX_AGE_SECONDS}",
+        "ETag": etag
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
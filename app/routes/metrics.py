@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.monitoring.metrics import registry
+
+
+router = APIRouter(tags=["Monitoring"])
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Prometheus metrics",
+    description="Exposes request, MongoDB and bcrypt metrics in the Prometheus text format, merged across workers"
+)
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        registry.render(),
+        media_type="text/plain; version=0.0.4"
+    )
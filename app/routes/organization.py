@@ -1,14 +1,21 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from typing import Dict, Any
 
 from app.schemas.organization import (
     OrganizationCreate,
     OrganizationUpdate,
-    OrganizationResponse
+    OrganizationResponse,
+    OrganizationCreateResponse,
+    OrganizationStatsResponse,
+    ProvisioningJobResponse
 )
+from app.audit import audit_log
+from app.config import settings
 from app.services.organization_service import OrganizationService
 from app.database import DatabaseManager, get_db
-from app.utils.dependencies import get_current_admin
+from app.schemas.usage import UsageResponse
+from app.usage import usage_accountant
+from app.utils.dependencies import get_current_admin, request_actor, require_operator
 
 
 router = APIRouter(prefix="/org", tags=["Organizations"])
@@ -16,21 +23,66 @@ router = APIRouter(prefix="/org", tags=["Organizations"])
 
 @router.post(
     "/create",
-    response_model=OrganizationResponse,
+    response_model=OrganizationCreateResponse,
     status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": OrganizationCreateResponse}},
     summary="Create a new organization",
-    description="Creates a new organization with a dedicated collection and an admin user"
+    description="Creates a new organization and an admin user. Returns 202 with a job ID when the collection is provisioned in the background"
 )
 async def create_organization(
     org_data: OrganizationCreate,
+    request: Request,
+    response: Response,
     db: DatabaseManager = Depends(get_db)
 ) -> Dict[str, Any]:
     service = OrganizationService(db)
-    result = service.create_organization(
+    with audit_log.track(
+        "org.create",
         organization_name=org_data.organization_name,
-        email=org_data.email,
-        password=org_data.password
-    )
+        actor=request_actor(request, email=org_data.email)
+    ) as event:
+        result = service.create_organization(
+            organization_name=org_data.organization_name,
+            email=org_data.email,
+            password=org_data.password
+        )
+        event["organization_id"] = result["id"]
+    if result.get("job_id"):
+        response.status_code = status.HTTP_202_ACCEPTED
+    return result
+
+
+@router.get(
+    "/provisioning/{job_id}",
+    response_model=ProvisioningJobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get provisioning job status",
+    description="Reports the progress of a background provisioning job for the caller's organization (requires authentication)"
+)
+async def get_provisioning_job(
+    job_id: str,
+    db: DatabaseManager = Depends(get_db),
+    current_admin: Dict[str, Any] = Depends(get_current_admin)
+) -> Dict[str, Any]:
+    service = OrganizationService(db)
+    result = service.get_provisioning_job(job_id, current_admin["organization_name"])
+    return result
+
+
+@router.get(
+    "/stats",
+    response_model=OrganizationStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Organization statistics",
+    description="Returns the precomputed organization summary: counts by state, creations per day and tenant collection sizes (restricted to operators)"
+)
+async def get_organization_stats(
+    days: int = Query(30, ge=1, le=settings.STATS_DAILY_RETENTION_DAYS, description="Days of creation history to return"),
+    db: DatabaseManager = Depends(get_db),
+    current_admin: Dict[str, Any] = Depends(require_operator)
+) -> Dict[str, Any]:
+    service = OrganizationService(db)
+    result = service.get_statistics(days)
     return result
 
 
@@ -50,6 +102,19 @@ async def get_organization(
     return result
 
 
+@router.get(
+    "/usage",
+    response_model=UsageResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Organization usage",
+    description="Returns the caller's organization storage usage, current request rate and quotas (requires authentication)"
+)
+async def get_organization_usage(
+    current_admin: Dict[str, Any] = Depends(get_current_admin)
+) -> Dict[str, Any]:
+    return usage_accountant.report(current_admin["organization_name"])
+
+
 @router.put(
     "/update",
     response_model=OrganizationResponse,
@@ -59,16 +124,23 @@ async def get_organization(
 )
 async def update_organization(
     org_data: OrganizationUpdate,
+    request: Request,
     db: DatabaseManager = Depends(get_db),
     current_admin: Dict[str, Any] = Depends(get_current_admin)
 ) -> Dict[str, Any]:
     service = OrganizationService(db)
-    result = service.update_organization(
+    with audit_log.track(
+        "org.update",
         organization_name=org_data.organization_name,
-        new_email=org_data.email,
-        new_password=org_data.password,
-        current_admin_id=current_admin["admin_id"]
-    )
+        actor=request_actor(request, current_admin),
+        new_email=org_data.email
+    ):
+        result = service.update_organization(
+            organization_name=org_data.organization_name,
+            new_email=org_data.email,
+            new_password=org_data.password,
+            current_admin_id=current_admin["admin_id"]
+        )
     return result
 
 
@@ -80,12 +152,18 @@ async def update_organization(
 )
 async def delete_organization(
     organization_name: str,
+    request: Request,
     db: DatabaseManager = Depends(get_db),
     current_admin: Dict[str, Any] = Depends(get_current_admin)
 ) -> Dict[str, str]:
     service = OrganizationService(db)
-    result = service.delete_organization(
+    with audit_log.track(
+        "org.delete",
         organization_name=organization_name,
-        current_admin_id=current_admin["admin_id"]
-    )
+        actor=request_actor(request, current_admin)
+    ):
+        result = service.delete_organization(
+            organization_name=organization_name,
+            current_admin_id=current_admin["admin_id"]
+        )
     return result
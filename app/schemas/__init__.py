@@ -2,11 +2,17 @@ from app.schemas.organization import (
     OrganizationCreate,
     OrganizationUpdate,
     OrganizationResponse,
-    OrganizationQuery
+    OrganizationCreateResponse,
+    OrganizationQuery,
+    OrganizationStatsResponse,
+    ProvisioningJobResponse
 )
+from app.schemas.audit import AuditEvent, AuditEventPage
+from app.schemas.usage import UsageQuotas, UsageResponse
 from app.schemas.admin import (
     AdminLogin,
     AdminResponse,
+    RefreshRequest,
     TokenResponse
 )
 
@@ -14,8 +20,16 @@ __all__ = [
     "OrganizationCreate",
     "OrganizationUpdate",
     "OrganizationResponse",
+    "OrganizationCreateResponse",
     "OrganizationQuery",
+    "OrganizationStatsResponse",
+    "ProvisioningJobResponse",
     "AdminLogin",
     "AdminResponse",
-    "TokenResponse"
+    "RefreshRequest",
+    "TokenResponse",
+    "AuditEvent",
+    "AuditEventPage",
+    "UsageQuotas",
+    "UsageResponse"
 ]
@@ -16,6 +16,17 @@ class AdminLogin(BaseModel):
         }
 
 
+class RefreshRequest(BaseModel):
+    refresh_token: str = Field(..., description="Refresh token returned by login or the previous refresh")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "refresh_token": "k3Jp0cV9nq2F1m8yXo4TzR7bLwE5sHdA6uGiYhNjQ0c"
+            }
+        }
+
+
 class AdminResponse(BaseModel):
     id: str = Field(..., description="Admin user ID")
     email: str = Field(..., description="Admin email address")
@@ -40,6 +51,7 @@ class AdminResponse(BaseModel):
 class TokenResponse(BaseModel):
     access_token: str = Field(..., description="JWT access token")
     token_type: str = Field(default="bearer", description="Token type")
+    refresh_token: Optional[str] = Field(None, description="Single-use refresh token for POST /admin/refresh")
     admin_id: str = Field(..., description="Admin user ID")
     organization_id: str = Field(..., description="Organization ID")
     organization_name: str = Field(..., description="Organization name")
@@ -50,6 +62,7 @@ class TokenResponse(BaseModel):
             "example": {
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                 "token_type": "bearer",
+                "refresh_token": "k3Jp0cV9nq2F1m8yXo4TzR7bLwE5sHdA6uGiYhNjQ0c",
                 "admin_id": "507f1f77bcf86cd799439012",
                 "organization_id": "507f1f77bcf86cd799439011",
                 "organization_name": "Test Organization",
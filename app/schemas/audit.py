@@ -0,0 +1,36 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+
+class AuditEvent(BaseModel):
+    id: str = Field(..., description="Audit event ID")
+    timestamp: datetime = Field(..., description="Time the action happened")
+    action: str = Field(..., description="Action name, e.g. org.update or admin.login")
+    organization_name: Optional[str] = Field(None, description="Organization the action applied to")
+    outcome: str = Field(..., description="success or failure")
+    actor: Dict[str, Any] = Field(default_factory=dict, description="Who performed the action")
+    details: Dict[str, Any] = Field(default_factory=dict, description="Action-specific fields")
+
+
+class AuditEventPage(BaseModel):
+    events: List[AuditEvent] = Field(..., description="Events, newest first")
+    next_cursor: Optional[str] = Field(None, description="Pass as cursor to fetch the next page")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "events": [
+                    {
+                        "id": "65a1f77bcf86cd7994390122",
+                        "timestamp": "2024-01-01T00:00:00",
+                        "action": "org.update",
+                        "organization_name": "Test Organization",
+                        "outcome": "success",
+                        "actor": {"admin_id": "507f1f77bcf86cd799439011", "email": "admin@testorg.com", "ip": "203.0.113.7"},
+                        "details": {}
+                    }
+                ],
+                "next_cursor": "MjAyNC0wMS0wMVQwMDowMDowMHw2NWExZjc3YmNmODZjZDc5OTQzOTAxMjI="
+            }
+        }
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field, validator
 from datetime import datetime
+from typing import Dict, List, Optional
 
 
 class OrganizationCreate(BaseModel):
@@ -73,6 +74,7 @@ class OrganizationResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     is_active: bool = Field(..., description="Whether the organization is active")
+    status: str = Field(default="active", description="Provisioning state: provisioning, active or failed")
     
     class Config:
         json_schema_extra = {
@@ -83,6 +85,103 @@ class OrganizationResponse(BaseModel):
                 "admin_email": "admin@testorg.com",
                 "created_at": "2024-01-01T00:00:00",
                 "updated_at": "2024-01-01T00:00:00",
-                "is_active": True
+                "is_active": True,
+                "status": "active"
+            }
+        }
+
+
+class OrganizationCreateResponse(OrganizationResponse):
+    job_id: Optional[str] = Field(None, description="Provisioning job ID when the collection is created in the background")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": "507f1f77bcf86cd799439011",
+                "organization_name": "Test Organization",
+                "collection_name": "org_test_organization",
+                "admin_email": "admin@testorg.com",
+                "created_at": "2024-01-01T00:00:00",
+                "updated_at": "2024-01-01T00:00:00",
+                "is_active": True,
+                "status": "provisioning",
+                "job_id": "65a1f77bcf86cd7994390122"
+            }
+        }
+
+
+class ProvisioningJobResponse(BaseModel):
+    id: str = Field(..., description="Provisioning job ID")
+    organization_name: str = Field(..., description="Organization being provisioned")
+    status: str = Field(..., description="Job state: queued, running, succeeded, failed or cancelled")
+    attempts: int = Field(..., description="Attempts made so far")
+    max_attempts: int = Field(..., description="Attempts allowed before the job fails")
+    error: Optional[str] = Field(None, description="Error from the latest failed attempt")
+    created_at: datetime = Field(..., description="Time the job was queued")
+    updated_at: datetime = Field(..., description="Last state change")
+    next_attempt_at: Optional[datetime] = Field(None, description="Earliest time of the next attempt")
+    finished_at: Optional[datetime] = Field(None, description="Time the job reached a final state")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": "65a1f77bcf86cd7994390122",
+                "organization_name": "Test Organization",
+                "status": "succeeded",
+                "attempts": 1,
+                "max_attempts": 5,
+                "error": None,
+                "created_at": "2024-01-01T00:00:00",
+                "updated_at": "2024-01-01T00:00:01",
+                "next_attempt_at": "2024-01-01T00:00:00",
+                "finished_at": "2024-01-01T00:00:01"
+            }
+        }
+
+
+class DailyCreatedCount(BaseModel):
+    date: str = Field(..., description="UTC day, YYYY-MM-DD")
+    created: int = Field(..., description="Organizations created that day")
+
+
+class TenantStorageStats(BaseModel):
+    collections: int = Field(0, description="Tenant collections measured")
+    documents: int = Field(0, description="Documents across all tenant collections")
+    size_bytes: int = Field(0, description="Uncompressed data size across all tenant collections")
+    storage_bytes: int = Field(0, description="Allocated storage including indexes")
+    p50_size_bytes: int = Field(0, description="Median tenant collection data size")
+    p95_size_bytes: int = Field(0, description="95th percentile tenant collection data size")
+    max_size_bytes: int = Field(0, description="Largest tenant collection data size")
+
+
+class OrganizationStatsResponse(BaseModel):
+    total: int = Field(..., description="Organizations in the master database")
+    active: int = Field(..., description="Organizations with is_active set")
+    inactive: int = Field(..., description="Organizations with is_active cleared")
+    by_status: Dict[str, int] = Field(..., description="Organizations per provisioning state")
+    created_per_day: List[DailyCreatedCount] = Field(..., description="Organizations created per day, oldest first")
+    tenant_storage: TenantStorageStats = Field(..., description="Tenant collection sizes as of the last reconciliation")
+    updated_at: Optional[datetime] = Field(None, description="Last incremental update")
+    reconciled_at: Optional[datetime] = Field(None, description="Last full reconciliation")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "total": 1200,
+                "active": 1180,
+                "inactive": 20,
+                "by_status": {"provisioning": 3, "active": 1190, "failed": 7},
+                "created_per_day": [{"date": "2024-01-01", "created": 14}],
+                "tenant_storage": {
+                    "collections": 1197,
+                    "documents": 5400000,
+                    "size_bytes": 2147483648,
+                    "storage_bytes": 1073741824,
+                    "p50_size_bytes": 524288,
+                    "p95_size_bytes": 8388608,
+                    "max_size_bytes": 268435456
+                },
+                "updated_at": "2024-01-01T12:00:00",
+                "reconciled_at": "2024-01-01T11:45:00"
             }
         }
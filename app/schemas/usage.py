@@ -0,0 +1,34 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Optional
+
+
+class UsageQuotas(BaseModel):
+    max_documents: int = Field(0, description="Document limit for the organization collection, 0 for unlimited")
+    max_bytes: int = Field(0, description="Data plus index size limit in bytes, 0 for unlimited")
+    max_requests_per_minute: int = Field(0, description="Authenticated request limit per minute, 0 for unlimited")
+
+
+class UsageResponse(BaseModel):
+    organization_name: str = Field(..., description="Organization name")
+    documents: int = Field(0, description="Documents in the organization collection at the last sample")
+    size_bytes: int = Field(0, description="Uncompressed data size at the last sample")
+    storage_bytes: int = Field(0, description="Allocated storage at the last sample")
+    index_bytes: int = Field(0, description="Index size at the last sample")
+    sampled_at: Optional[datetime] = Field(None, description="Time of the last sample")
+    requests_this_minute: int = Field(0, description="Authenticated requests counted in the current minute")
+    quotas: UsageQuotas = Field(..., description="Quotas that apply to the organization")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "organization_name": "Test Organization",
+                "documents": 120000,
+                "size_bytes": 52428800,
+                "storage_bytes": 20971520,
+                "index_bytes": 4194304,
+                "sampled_at": "2024-01-01T12:00:00",
+                "requests_this_minute": 42,
+                "quotas": {"max_documents": 1000000, "max_bytes": 1073741824, "max_requests_per_minute": 600}
+            }
+        }
@@ -0,0 +1,67 @@
+def organizations_schema():
+    return {
+        "$jsonSchema": {
+            "bsonType": "object",
+            "required": [
+                "organization_name",
+                "collection_name",
+                "admin_email",
+                "admin_id",
+                "created_at",
+                "updated_at",
+                "is_active"
+            ],
+            "properties": {
+                "organization_name": {"bsonType": "string", "minLength": 1},
+                "collection_name": {"bsonType": "string", "minLength": 1},
+                "admin_email": {"bsonType": "string"},
+                "admin_id": {"bsonType": ["string", "objectId"]},
+                "cluster": {"bsonType": "string"},
+                "database_name": {"bsonType": ["string", "null"]},
+                "status": {"enum": ["provisioning", "active", "failed"]},
+                "moving_since": {"bsonType": ["date", "null"]},
+                "created_at": {"bsonType": "date"},
+                "updated_at": {"bsonType": "date"},
+                "is_active": {"bsonType": "bool"},
+                "schema_version": {"bsonType": "int", "minimum": 0}
+            }
+        }
+    }
+
+
+def admins_schema():
+    return {
+        "$jsonSchema": {
+            "bsonType": "object",
+            "required": [
+                "email",
+                "hashed_password",
+                "organization_name",
+                "created_at",
+                "updated_at",
+                "is_active"
+            ],
+            "properties": {
+                "email": {"bsonType": "string"},
+                "hashed_password": {"bsonType": "string"},
+                "organization_name": {"bsonType": "string"},
+                "organization_id": {"bsonType": ["string", "objectId"]},
+                "created_at": {"bsonType": "date"},
+                "updated_at": {"bsonType": "date"},
+                "is_active": {"bsonType": "bool"},
+                "schema_version": {"bsonType": "int", "minimum": 0}
+            }
+        }
+    }
+
+
+def org_collection_schema():
+    return {
+        "$jsonSchema": {
+            "bsonType": "object",
+            "required": ["_type"],
+            "properties": {
+                "_type": {"bsonType": "string"}
+            }
+        }
+    }
@@ -1,4 +1,6 @@
 from app.services.organization_service import OrganizationService
 from app.services.auth_service import AuthService
+from app.services.provisioning_service import ProvisioningWorker, provisioning_worker
+from app.services.revocation_service import RevocationService, revocation_service
 
-__all__ = ["OrganizationService", "AuthService"]
+__all__ = ["OrganizationService", "AuthService", "ProvisioningWorker", "provisioning_worker", "RevocationService", "revocation_service"]
@@ -1,18 +1,36 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import timedelta
+from bson import ObjectId
+from bson.errors import InvalidId
 from fastapi import HTTPException, status
 
 from app.database import DatabaseManager
+from app.monitoring.metrics import refresh_tokens_total
+from app.services.revocation_service import revocation_service
+from app.storage.refresh_tokens import STATUS_REUSED, STATUS_ROTATED, RefreshTokenStore
 from app.utils.security import verify_password, create_access_token
 from app.config import settings
 
 
+_refresh_token_store: Optional[RefreshTokenStore] = None
+
+
+def get_refresh_token_store(db: DatabaseManager) -> RefreshTokenStore:
+    global _refresh_token_store
+    if _refresh_token_store is None:
+        _refresh_token_store = RefreshTokenStore(
+            db.get_master_db()["refresh_tokens"],
+            ttl_seconds=settings.REFRESH_TOKEN_EXPIRE_MINUTES * 60
+        )
+    return _refresh_token_store
+
+
 class AuthService:
     def __init__(self, db: DatabaseManager):
         self.db = db
         self.master_db = db.get_master_db()
-        self.admin_collection = self.master_db["admins"]
-        self.org_collection = self.master_db["organizations"]
+        self.admin_collection = db.get_master_collection("admins", "consistent_read")
+        self.org_collection = db.get_master_collection("organizations", "fast_read")
     
     def authenticate_admin(self, email: str, password: str) -> Dict[str, Any]:
         admin = self.admin_collection.find_one({"email": email})
@@ -37,15 +55,62 @@ class AuthService:
                 detail="Admin account is inactive"
             )
         
+        return self._issue_tokens(admin)
+    
+    def refresh_tokens(self, refresh_token: str) -> Dict[str, Any]:
+        store = get_refresh_token_store(self.db)
+        outcome, record, new_token = store.rotate(refresh_token)
+        refresh_tokens_total.inc(outcome=outcome)
+        if outcome == STATUS_REUSED:
+            revocation_service.revoke_session(record["family"], record.get("admin_id"))
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh token has already been used; all tokens in its session were revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        if outcome != STATUS_ROTATED:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired refresh token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        
+        try:
+            admin = self.admin_collection.find_one({"_id": ObjectId(record["admin_id"])})
+        except InvalidId:
+            admin = None
+        if not admin or not admin.get("is_active", True):
+            store.revoke_family(record["family"])
+            revocation_service.revoke_session(record["family"], record.get("admin_id"))
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Admin user not found or inactive",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        
+        return self._issue_tokens(admin, new_token, record["family"])
+    
+    def _issue_tokens(
+        self,
+        admin: Dict[str, Any],
+        refresh_token: Optional[str] = None,
+        family: Optional[str] = None
+    ) -> Dict[str, Any]:
         org_id = admin.get("organization_id")
         org_name = admin.get("organization_name")
-        
+        email = admin.get("email")
         admin_id = str(admin["_id"])
+        
+        if refresh_token is None:
+            refresh_token, family = get_refresh_token_store(self.db).issue(admin_id)
+            refresh_tokens_total.inc(outcome="issued")
+        
         token_data = {
             "sub": admin_id,
             "email": email,
             "organization_id": org_id,
-            "organization_name": org_name
+            "organization_name": org_name,
+            "sid": family
         }
         
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -57,6 +122,7 @@ class AuthService:
         return {
             "access_token": access_token,
             "token_type": "bearer",
+            "refresh_token": refresh_token,
             "admin_id": admin_id,
             "organization_id": org_id,
             "organization_name": org_name,
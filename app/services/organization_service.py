@@ -1,20 +1,32 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 from bson import ObjectId
 from fastapi import HTTPException, status
+from pymongo.collection import Collection
 
 from app.database import DatabaseManager
 from app.models.organization import Organization
 from app.models.admin import Admin
 from app.utils.security import hash_password
+from app.services.provisioning_service import ORG_ACTIVE, ORG_PROVISIONING, provisioning_worker
+from app.migrations import upgrade_on_read
+from app.stats import organization_stats
+from app.config import settings
 
 
 class OrganizationService:
     def __init__(self, db: DatabaseManager):
         self.db = db
         self.master_db = db.get_master_db()
-        self.org_collection = self.master_db["organizations"]
-        self.admin_collection = self.master_db["admins"]
+        self.org_collection = db.get_master_collection("organizations", "consistent_read")
+        self.admin_collection = db.get_master_collection("admins", "consistent_read")
+        self.org_reader = db.get_master_collection("organizations", "fast_read")
+        self.org_writer = db.get_master_collection("organizations", "durable_write")
+        self.admin_writer = db.get_master_collection("admins", "durable_write")
+    
+    def _read_organization(self, collection: Collection, query: Dict[str, Any], **kwargs: Any) -> Optional[Dict[str, Any]]:
+        writer = self.org_writer if settings.MIGRATION_WRITE_BACK_ON_READ else None
+        return upgrade_on_read("organizations", collection.find_one(query, **kwargs), writer)
     
     def create_organization(
         self,
@@ -39,8 +51,13 @@ class OrganizationService:
                 detail=f"Admin with email '{email}' already exists"
             )
         
+        background = settings.PROVISIONING_MODE == "async"
         try:
-            collection_name = self.db.create_organization_collection(organization_name)
+            cluster = self.db.choose_cluster()
+            collection_name = self.db.organization_collection_name(organization_name)
+            database_name = self.db.tenant_database_name(collection_name)
+            if not background:
+                self.db.provision_organization_collection(collection_name, cluster, database_name)
             
             hashed_pwd = hash_password(password)
             admin = Admin(
@@ -52,7 +69,7 @@ class OrganizationService:
                 is_active=True
             )
             
-            admin_result = self.admin_collection.insert_one(admin.to_dict())
+            admin_result = self.admin_writer.insert_one(admin.to_dict())
             admin_id = str(admin_result.inserted_id)
             
             organization = Organization(
@@ -60,19 +77,27 @@ class OrganizationService:
                 collection_name=collection_name,
                 admin_email=email,
                 admin_id=admin_id,
+                cluster=cluster,
+                database_name=database_name,
                 created_at=datetime.utcnow(),
                 updated_at=datetime.utcnow(),
-                is_active=True
+                is_active=True,
+                status=ORG_PROVISIONING if background else ORG_ACTIVE
             )
             
-            org_result = self.org_collection.insert_one(organization.to_dict())
+            org_result = self.org_writer.insert_one(organization.to_dict())
             org_id = str(org_result.inserted_id)
             
-            self.admin_collection.update_one(
+            self.admin_writer.update_one(
                 {"_id": ObjectId(admin_id)},
                 {"$set": {"organization_id": org_id}}
             )
             
+            job_id = None
+            if background:
+                job_id = provisioning_worker.enqueue(organization_name, collection_name, cluster, database_name)
+            organization_stats.record_created(organization.to_dict())
+            
             return {
                 "id": org_id,
                 "organization_name": organization_name,
@@ -81,22 +106,40 @@ class OrganizationService:
                 "admin_id": admin_id,
                 "created_at": organization.created_at,
                 "updated_at": organization.updated_at,
-                "is_active": organization.is_active
+                "is_active": organization.is_active,
+                "status": organization.status,
+                "job_id": job_id
             }
             
         except Exception as e:
-            if 'collection_name' in locals():
-                self.db.delete_organization_collection(collection_name)
+            if 'collection_name' in locals() and not background:
+                self.db.delete_organization_collection(collection_name, cluster, database_name)
+            if 'org_id' in locals():
+                self.org_writer.delete_one({"_id": ObjectId(org_id)})
             if 'admin_id' in locals():
-                self.admin_collection.delete_one({"_id": ObjectId(admin_id)})
+                self.admin_writer.delete_one({"_id": ObjectId(admin_id)})
             
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to create organization: {str(e)}"
             )
     
+    def get_provisioning_job(self, job_id: str, organization_name: str) -> Dict[str, Any]:
+        job = provisioning_worker.get_job(job_id)
+        if not job or job["organization_name"] != organization_name:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Provisioning job '{job_id}' not found"
+            )
+        
+        return job
+    
+    def get_statistics(self, days: int = 30) -> Dict[str, Any]:
+        return organization_stats.get(days)
+    
     def get_organization(self, organization_name: str) -> Dict[str, Any]:
-        org = self.org_collection.find_one(
+        org = self._read_organization(
+            self.org_reader,
             {"organization_name": organization_name}
         )
         
@@ -118,7 +161,8 @@ class OrganizationService:
         new_password: str,
         current_admin_id: str
     ) -> Dict[str, Any]:
-        org = self.org_collection.find_one(
+        org = self._read_organization(
+            self.org_collection,
             {"organization_name": organization_name}
         )
         
@@ -147,28 +191,32 @@ class OrganizationService:
                 )
             
             hashed_pwd = hash_password(new_password)
-            self.admin_collection.update_one(
-                {"_id": ObjectId(current_admin_id)},
-                {
-                    "$set": {
-                        "email": new_email,
-                        "hashed_password": hashed_pwd,
-                        "updated_at": datetime.utcnow()
-                    }
-                }
-            )
-            
-            self.org_collection.update_one(
-                {"_id": org["_id"]},
-                {
-                    "$set": {
-                        "admin_email": new_email,
-                        "updated_at": datetime.utcnow()
-                    }
-                }
-            )
-            
-            updated_org = self.org_collection.find_one({"_id": org["_id"]})
+            with self.db.causal_session() as session:
+                self.admin_writer.update_one(
+                    {"_id": ObjectId(current_admin_id)},
+                    {
+                        "$set": {
+                            "email": new_email,
+                            "hashed_password": hashed_pwd,
+                            "updated_at": datetime.utcnow()
+                        }
+                    },
+                    session=session
+                )
+                
+                self.org_writer.update_one(
+                    {"_id": org["_id"]},
+                    {
+                        "$set": {
+                            "admin_email": new_email,
+                            "updated_at": datetime.utcnow()
+                        }
+                    },
+                    session=session
+                )
+                
+                updated_org = self._read_organization(self.org_collection, {"_id": org["_id"]}, session=session)
+            organization_stats.record_updated(org, updated_org)
             updated_org["id"] = str(updated_org["_id"])
             del updated_org["_id"]
             
@@ -187,7 +235,8 @@ class OrganizationService:
         organization_name: str,
         current_admin_id: str
     ) -> Dict[str, str]:
-        org = self.org_collection.find_one(
+        org = self._read_organization(
+            self.org_collection,
             {"organization_name": organization_name}
         )
         
@@ -203,16 +252,31 @@ class OrganizationService:
                 detail="Not authorized to delete this organization"
             )
         
+        if org.get("moving_since"):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Organization '{organization_name}' is being moved, retry shortly"
+            )
+        
         try:
+            if org.get("status") == ORG_PROVISIONING:
+                provisioning_worker.cancel_pending(organization_name)
+            
             collection_name = org.get("collection_name")
             if collection_name:
-                self.db.delete_organization_collection(collection_name)
+                self.db.delete_organization_collection(
+                    collection_name,
+                    org.get("cluster") or settings.DEFAULT_CLUSTER,
+                    org.get("database_name")
+                )
             
             admin_id = org.get("admin_id")
             if admin_id:
-                self.admin_collection.delete_one({"_id": ObjectId(admin_id)})
+                self.admin_writer.delete_one({"_id": ObjectId(admin_id)})
             
-            self.org_collection.delete_one({"_id": org["_id"]})
+            result = self.org_writer.delete_one({"_id": org["_id"]})
+            if result.deleted_count:
+                organization_stats.record_deleted(org)
             
             return {
                 "message": f"Organization '{organization_name}' deleted successfully"
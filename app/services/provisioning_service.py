@@ -0,0 +1,180 @@
+import asyncio
+import os
+import socket
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from app.config import settings
+from app.database import DatabaseManager, db_manager
+from app.monitoring.metrics import provisioning_duration_seconds, provisioning_jobs_total
+from app.stats import organization_stats
+from app.storage.provisioning import ProvisioningJobStore
+
+
+ORG_PROVISIONING = "provisioning"
+ORG_ACTIVE = "active"
+ORG_FAILED = "failed"
+
+
+class ProvisioningWorker:
+    def __init__(
+        self,
+        db: DatabaseManager,
+        queue: str = settings.PROVISIONING_QUEUE,
+        poll_interval: float = settings.PROVISIONING_POLL_INTERVAL_SECONDS,
+        max_attempts: int = settings.PROVISIONING_MAX_ATTEMPTS,
+        retry_backoff: float = settings.PROVISIONING_RETRY_BACKOFF_SECONDS
+    ):
+        if queue not in ("local", "shared"):
+            raise ValueError(f"Unknown provisioning queue '{queue}'. Expected 'local' or 'shared'")
+        self.db = db
+        self.queue = queue
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._store: Optional[ProvisioningJobStore] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @property
+    def store(self) -> ProvisioningJobStore:
+        if self._store is None:
+            self._store = ProvisioningJobStore(
+                self.db.get_master_db()["provisioning_jobs"],
+                lease_seconds=settings.PROVISIONING_LEASE_SECONDS,
+                job_ttl_seconds=settings.PROVISIONING_JOB_TTL_SECONDS
+            )
+        return self._store
+    
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._loop = None
+    
+    def notify(self) -> None:
+        if self._loop is not None and self._wakeup is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+    
+    def enqueue(self, organization_name: str, collection_name: str, cluster: str, database_name: str) -> str:
+        job_id = self.store.enqueue(
+            organization_name,
+            collection_name,
+            cluster,
+            database_name,
+            owner=self.worker_id,
+            max_attempts=self.max_attempts
+        )
+        self.notify()
+        return job_id
+    
+    def cancel_pending(self, organization_name: str) -> int:
+        return self.store.cancel_pending(organization_name, "Organization was deleted")
+    
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self.store.get(job_id)
+        if job is None:
+            return None
+        job["id"] = str(job.pop("_id"))
+        return job
+    
+    async def _run(self) -> None:
+        while True:
+            processed = await self.run_pending()
+            if processed:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+    
+    async def run_pending(self) -> int:
+        processed = 0
+        while True:
+            try:
+                handled = await asyncio.to_thread(self.run_once)
+            except Exception:
+                return processed
+            if not handled:
+                return processed
+            processed += 1
+    
+    def run_once(self) -> bool:
+        owner = self.worker_id if self.queue == "local" else None
+        job = self.store.claim(self.worker_id, owner)
+        if job is None:
+            return False
+        self.process(job)
+        return True
+    
+    def process(self, job: Dict[str, Any]) -> None:
+        organizations = self.db.get_master_collection("organizations", "consistent_read")
+        org = organizations.find_one(
+            {"organization_name": job["organization_name"], "collection_name": job["collection_name"]},
+            {"_id": 1}
+        )
+        if org is None:
+            self.store.cancel(job["_id"], "Organization no longer exists", self.worker_id)
+            provisioning_jobs_total.inc(outcome="cancelled")
+            return
+        
+        started = time.perf_counter()
+        try:
+            self.db.provision_organization_collection(
+                job["collection_name"],
+                job["cluster"],
+                job["database_name"]
+            )
+        except Exception as e:
+            self._record_failure(job, org["_id"], str(e))
+            return
+        provisioning_duration_seconds.observe(time.perf_counter() - started)
+        
+        writer = self.db.get_master_collection("organizations", "durable_write")
+        previous = writer.find_one_and_update(
+            {"_id": org["_id"]},
+            {"$set": {"status": ORG_ACTIVE, "updated_at": datetime.utcnow()}},
+            {"status": 1}
+        )
+        if previous is None:
+            self.db.delete_organization_collection(job["collection_name"], job["cluster"], job["database_name"])
+            self.store.cancel(job["_id"], "Organization no longer exists", self.worker_id)
+            provisioning_jobs_total.inc(outcome="cancelled")
+            return
+        if previous.get("status") != ORG_ACTIVE:
+            organization_stats.record_updated({"status": previous.get("status")}, {"status": ORG_ACTIVE})
+        self.store.succeed(job["_id"], self.worker_id)
+        provisioning_jobs_total.inc(outcome="succeeded")
+    
+    def _record_failure(self, job: Dict[str, Any], org_id: Any, error: str) -> None:
+        if job["attempts"] < job["max_attempts"]:
+            delay = self.retry_backoff * 2 ** (job["attempts"] - 1)
+            self.store.retry(job["_id"], self.worker_id, error, delay)
+            provisioning_jobs_total.inc(outcome="retried")
+            return
+        self.store.fail(job["_id"], self.worker_id, error)
+        result = self.db.get_master_collection("organizations", "durable_write").update_one(
+            {"_id": org_id, "status": ORG_PROVISIONING},
+            {"$set": {"status": ORG_FAILED, "updated_at": datetime.utcnow()}}
+        )
+        if result.modified_count:
+            organization_stats.record_updated({"status": ORG_PROVISIONING}, {"status": ORG_FAILED})
+        provisioning_jobs_total.inc(outcome="failed")
+
+
+provisioning_worker = ProvisioningWorker(db_manager)
@@ -0,0 +1,79 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from app.config import settings
+from app.database import DatabaseManager, db_manager
+from app.monitoring.metrics import token_revocation_checks_total
+from app.storage.revocations import RevocationStore
+
+
+class RevocationService:
+    def __init__(
+        self,
+        db: DatabaseManager,
+        sync_interval: float = settings.REVOCATION_SYNC_INTERVAL_SECONDS,
+        enabled: bool = settings.REVOCATION_ENABLED
+    ):
+        self.db = db
+        self.sync_interval = sync_interval
+        self.enabled = enabled
+        self._store: Optional[RevocationStore] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def store(self) -> RevocationStore:
+        if self._store is None:
+            self._store = RevocationStore(
+                self.db.get_master_db()["token_revocations"],
+                token_ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+                capacity=settings.REVOCATION_FILTER_CAPACITY,
+                error_rate=settings.REVOCATION_FILTER_ERROR_RATE
+            )
+            self._store.rebuild()
+        return self._store
+    
+    async def start(self) -> None:
+        if self.enabled and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.store.sync)
+            except Exception:
+                pass
+            await asyncio.sleep(self.sync_interval)
+    
+    def is_revoked(self, payload: Dict[str, Any]) -> bool:
+        if not self.enabled:
+            return False
+        result = self.store.check(payload)
+        token_revocation_checks_total.inc(result=result)
+        return result == "revoked"
+    
+    def revoke_token(self, payload: Dict[str, Any]) -> bool:
+        jti = payload.get("jti")
+        if not jti:
+            return False
+        self.store.revoke_token(jti, payload.get("sub"), datetime.utcfromtimestamp(payload["exp"]))
+        return True
+    
+    def revoke_admin(self, admin_id: str) -> None:
+        self.store.revoke_admin(admin_id, time.time())
+    
+    def revoke_session(self, sid: str, admin_id: Optional[str] = None) -> None:
+        self.store.revoke_session(sid, admin_id, time.time())
+
+
+revocation_service = RevocationService(db_manager)
@@ -0,0 +1,3 @@
+from app.stats.organizations import OrganizationStats, organization_stats
+
+__all__ = ["OrganizationStats", "organization_stats"]
@@ -0,0 +1,293 @@
+import asyncio
+import os
+import socket
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+
+from pymongo import UpdateOne
+from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError, OperationFailure, PyMongoError
+
+from app.config import settings
+from app.database import DatabaseManager, db_manager
+from app.monitoring.metrics import org_stats_drift, org_stats_reconcile_duration_seconds, org_stats_updates_total
+
+
+SUMMARY_ID = "organizations"
+LEASE_ID = "reconcile_lease"
+DAILY_PREFIX = "created:"
+STATUSES = ("provisioning", "active", "failed")
+COUNTERS = ("total", "active", "inactive", *(f"by_status.{name}" for name in STATUSES))
+
+
+def organization_counters(org: Dict[str, Any]) -> Dict[str, int]:
+    counters = {"total": 1, "active" if org.get("is_active", True) else "inactive": 1}
+    counters[f"by_status.{org.get('status') or 'active'}"] = 1
+    return counters
+
+
+def percentile(values: List[int], fraction: float) -> int:
+    if not values:
+        return 0
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class OrganizationStats:
+    def __init__(
+        self,
+        db: DatabaseManager,
+        collection_name: str = settings.STATS_COLLECTION,
+        reconcile_interval: float = settings.STATS_RECONCILE_INTERVAL_SECONDS,
+        retention_days: int = settings.STATS_DAILY_RETENTION_DAYS,
+        enabled: bool = settings.STATS_ENABLED
+    ):
+        self.db = db
+        self.collection_name = collection_name
+        self.reconcile_interval = reconcile_interval
+        self.retention_days = retention_days
+        self.enabled = enabled
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @property
+    def collection(self) -> Collection:
+        return self.db.get_master_db()[self.collection_name]
+    
+    async def start(self) -> None:
+        if self.enabled and (self._task is None or self._task.done()):
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._loop = None
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                if await asyncio.to_thread(self.acquire_lease):
+                    await asyncio.to_thread(self.reconcile)
+            except Exception:
+                pass
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.reconcile_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+    
+    def request_reconcile(self) -> None:
+        if self._loop is not None and self._wakeup is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+    
+    def _apply(self, counters: Dict[str, int], created_at: Optional[datetime] = None) -> None:
+        if not self.enabled:
+            return
+        counters = {name: value for name, value in counters.items() if value}
+        requests = []
+        if counters:
+            requests.append(UpdateOne(
+                {"_id": SUMMARY_ID},
+                {"$inc": counters, "$set": {"updated_at": datetime.utcnow()}},
+                upsert=True
+            ))
+        if created_at is not None:
+            day = created_at.strftime("%Y-%m-%d")
+            requests.append(UpdateOne(
+                {"_id": f"{DAILY_PREFIX}{day}"},
+                {"$inc": {"created": 1}, "$set": {"kind": "daily", "date": day}},
+                upsert=True
+            ))
+        if not requests:
+            return
+        try:
+            self.collection.bulk_write(requests, ordered=False)
+            org_stats_updates_total.inc(outcome="applied")
+        except PyMongoError:
+            org_stats_updates_total.inc(outcome="failed")
+    
+    def record_created(self, org: Dict[str, Any]) -> None:
+        self._apply(organization_counters(org), org.get("created_at") or datetime.utcnow())
+    
+    def record_updated(self, before: Dict[str, Any], after: Dict[str, Any]) -> None:
+        counters = organization_counters(after)
+        for name, value in organization_counters(before).items():
+            counters[name] = counters.get(name, 0) - value
+        self._apply(counters)
+    
+    def record_deleted(self, org: Dict[str, Any]) -> None:
+        self._apply({name: -value for name, value in organization_counters(org).items()})
+    
+    def acquire_lease(self) -> bool:
+        now = datetime.utcnow()
+        try:
+            self.collection.update_one(
+                {"_id": LEASE_ID, "lease_until": {"$lte": now}},
+                {"$set": {"lease_until": now + timedelta(seconds=self.reconcile_interval / 2), "owner": self.worker_id}},
+                upsert=True
+            )
+        except DuplicateKeyError:
+            return False
+        return True
+    
+    def _counts_pipeline(self) -> List[Dict[str, Any]]:
+        by_status = {
+            name: {"$sum": {"$cond": [{"$eq": [{"$ifNull": ["$status", "active"]}, name]}, 1, 0]}}
+            for name in STATUSES
+        }
+        return [
+            {"$group": {
+                "_id": None,
+                "total": {"$sum": 1},
+                "active": {"$sum": {"$cond": [{"$eq": ["$is_active", False]}, 0, 1]}},
+                **by_status
+            }},
+            {"$project": {
+                "_id": {"$literal": SUMMARY_ID},
+                "total": 1,
+                "active": 1,
+                "inactive": {"$subtract": ["$total", "$active"]},
+                "by_status": {name: f"${name}" for name in STATUSES},
+                "reconciled_at": "$$NOW"
+            }},
+            {"$merge": {"into": self.collection_name, "on": "_id", "whenMatched": "merge", "whenNotMatched": "insert"}}
+        ]
+    
+    def _daily_pipeline(self, since: datetime) -> List[Dict[str, Any]]:
+        return [
+            {"$match": {"created_at": {"$gte": since}}},
+            {"$group": {"_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}}, "created": {"$sum": 1}}},
+            {"$project": {"_id": {"$concat": [DAILY_PREFIX, "$_id"]}, "kind": "daily", "date": "$_id", "created": 1}},
+            {"$merge": {
+                "into": self.collection_name,
+                "on": "_id",
+                "whenMatched": [{"$set": {"created": {"$max": ["$created", "$$new.created"]}}}],
+                "whenNotMatched": "insert"
+            }}
+        ]
+    
+    def _reconcile_locally(self, organizations: Collection, since: datetime) -> None:
+        summary: Dict[str, Any] = {name: 0 for name in COUNTERS}
+        daily: Dict[str, int] = {}
+        for org in organizations.find({}, {"status": 1, "is_active": 1, "created_at": 1}):
+            for name, value in organization_counters(org).items():
+                summary[name] = summary.get(name, 0) + value
+            created_at = org.get("created_at")
+            if isinstance(created_at, datetime) and created_at >= since:
+                day = created_at.strftime("%Y-%m-%d")
+                daily[day] = daily.get(day, 0) + 1
+        
+        requests = [UpdateOne(
+            {"_id": SUMMARY_ID},
+            {"$set": {
+                "total": summary["total"],
+                "active": summary["active"],
+                "inactive": summary["inactive"],
+                "by_status": {name: summary[f"by_status.{name}"] for name in STATUSES},
+                "reconciled_at": datetime.utcnow()
+            }},
+            upsert=True
+        )]
+        existing = {
+            doc["_id"]: doc.get("created", 0)
+            for doc in self.collection.find({"_id": {"$in": [f"{DAILY_PREFIX}{day}" for day in daily]}})
+        }
+        for day, created in daily.items():
+            doc_id = f"{DAILY_PREFIX}{day}"
+            requests.append(UpdateOne(
+                {"_id": doc_id},
+                {"$set": {"kind": "daily", "date": day, "created": max(created, existing.get(doc_id, 0))}},
+                upsert=True
+            ))
+        self.collection.bulk_write(requests, ordered=False)
+    
+    def tenant_storage(self, organizations: Collection) -> Dict[str, Any]:
+        sizes: List[int] = []
+        documents = storage_bytes = 0
+        for org in list(organizations.find({}, {"collection_name": 1, "cluster": 1, "database_name": 1})):
+            database = self.db.get_tenant_db(org.get("cluster"), org.get("database_name"))
+            try:
+                stats = database.command("collStats", org["collection_name"])
+            except (OperationFailure, KeyError):
+                continue
+            documents += stats.get("count", 0)
+            storage_bytes += stats.get("storageSize", 0) + stats.get("totalIndexSize", 0)
+            sizes.append(stats.get("size", 0))
+        sizes.sort()
+        return {
+            "collections": len(sizes),
+            "documents": documents,
+            "size_bytes": sum(sizes),
+            "storage_bytes": storage_bytes,
+            "p50_size_bytes": percentile(sizes, 0.5),
+            "p95_size_bytes": percentile(sizes, 0.95),
+            "max_size_bytes": sizes[-1] if sizes else 0
+        }
+    
+    def reconcile(self) -> Dict[str, Any]:
+        started = time.perf_counter()
+        organizations = self.db.get_master_collection("organizations", "fast_read")
+        since = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=self.retention_days)
+        before = self.collection.find_one({"_id": SUMMARY_ID}) or {}
+        
+        try:
+            list(organizations.aggregate(self._counts_pipeline()))
+            list(organizations.aggregate(self._daily_pipeline(since)))
+        except (NotImplementedError, AttributeError):
+            self._reconcile_locally(organizations, since)
+        
+        self.collection.update_one(
+            {"_id": SUMMARY_ID},
+            {"$set": {"tenant_storage": self.tenant_storage(organizations), "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+        self.collection.delete_many({"kind": "daily", "date": {"$lt": since.strftime("%Y-%m-%d")}})
+        
+        after = self.collection.find_one({"_id": SUMMARY_ID}) or {}
+        drift = sum(
+            abs(self._counter(after, name) - self._counter(before, name))
+            for name in COUNTERS
+        )
+        org_stats_drift.set(drift)
+        org_stats_reconcile_duration_seconds.observe(time.perf_counter() - started)
+        return {"drift": drift, "duration_seconds": round(time.perf_counter() - started, 3)}
+    
+    @staticmethod
+    def _counter(doc: Dict[str, Any], name: str) -> int:
+        value: Any = doc
+        for part in name.split("."):
+            value = value.get(part, 0) if isinstance(value, dict) else 0
+        return value or 0
+    
+    def get(self, days: int = 30) -> Dict[str, Any]:
+        summary = self.collection.find_one({"_id": SUMMARY_ID}) or {}
+        if "reconciled_at" not in summary:
+            self.request_reconcile()
+        
+        since = (datetime.utcnow() - timedelta(days=max(0, days - 1))).strftime("%Y-%m-%d")
+        daily = self.collection.find(
+            {"_id": {"$gte": f"{DAILY_PREFIX}{since}", "$lt": f"{DAILY_PREFIX}~"}},
+            {"date": 1, "created": 1}
+        ).sort("_id", 1)
+        return {
+            "total": self._counter(summary, "total"),
+            "active": self._counter(summary, "active"),
+            "inactive": self._counter(summary, "inactive"),
+            "by_status": {name: self._counter(summary, f"by_status.{name}") for name in STATUSES},
+            "created_per_day": [{"date": doc["date"], "created": doc.get("created", 0)} for doc in daily],
+            "tenant_storage": summary.get("tenant_storage", {}),
+            "updated_at": summary.get("updated_at"),
+            "reconciled_at": summary.get("reconciled_at")
+        }
+
+
+organization_stats = OrganizationStats(db_manager)
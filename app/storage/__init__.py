@@ -0,0 +1,48 @@
+from app.config import settings
+from app.storage.base import StorageBackend
+from app.storage.memory import MemoryBackend
+from app.storage.mongo import MongoBackend, register_event_listener
+from app.storage.registry import CollectionRegistry
+from app.storage.buckets import BucketStore, LocalBucketStore, SharedBucketStore
+from app.storage.idempotency import IdempotencyStore
+from app.storage.provisioning import ProvisioningJobStore
+from app.storage.refresh_tokens import RefreshTokenStore
+from app.storage.signing_keys import SigningKeyStore
+from app.storage.revocations import BloomFilter, RevocationStore
+from app.storage.profiles import profile_options, clear_profile_cache
+
+
+def create_backend(name: str) -> StorageBackend:
+    if name == "mongo":
+        return MongoBackend(settings.MONGODB_URL)
+    if name == "memory":
+        return MemoryBackend()
+    raise ValueError(f"Unknown storage backend '{name}'. Expected 'mongo' or 'memory'")
+
+
+def create_backend_for_url(url: str) -> StorageBackend:
+    if url.startswith("memory://"):
+        return MemoryBackend()
+    return MongoBackend(url)
+
+
+__all__ = [
+    "StorageBackend",
+    "MongoBackend",
+    "MemoryBackend",
+    "CollectionRegistry",
+    "BucketStore",
+    "LocalBucketStore",
+    "SharedBucketStore",
+    "IdempotencyStore",
+    "ProvisioningJobStore",
+    "RefreshTokenStore",
+    "SigningKeyStore",
+    "BloomFilter",
+    "RevocationStore",
+    "profile_options",
+    "clear_profile_cache",
+    "create_backend",
+    "create_backend_for_url",
+    "register_event_listener"
+]
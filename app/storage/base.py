@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional
+
+
+class StorageBackend(ABC):
+    name = "base"
+    
+    @abstractmethod
+    def get_database(self, name: str) -> Any:
+        pass
+    
+    def ping(self, db_name: str) -> bool:
+        self.get_database(db_name).command("ping")
+        return True
+    
+    def list_collection_names(self, db_name: str) -> List[str]:
+        return self.get_database(db_name).list_collection_names()
+    
+    def has_collection(self, db_name: str, collection_name: str) -> bool:
+        names = self.get_database(db_name).list_collection_names(filter={"name": collection_name})
+        return collection_name in names
+    
+    def start_session(self, causal_consistency: bool = True) -> Optional[Any]:
+        return None
+    
+    def drop_database(self, name: str) -> None:
+        pass
+    
+    def close(self) -> None:
+        pass
@@ -0,0 +1,89 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Tuple
+
+from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError, PyMongoError
+
+
+MAX_UPDATE_ATTEMPTS = 3
+
+
+def next_arrival(tat: float, now: float, rate: float, burst: float) -> Tuple[float, float]:
+    interval = 1.0 / rate
+    new_tat = max(tat, now) + interval
+    return new_tat, new_tat - now - burst * interval
+
+
+class BucketStore(ABC):
+    blocking = False
+    
+    @abstractmethod
+    def acquire(self, key: str, rate: float, burst: float) -> Tuple[bool, float]:
+        pass
+    
+    def clear(self) -> None:
+        pass
+
+
+class LocalBucketStore(BucketStore):
+    def __init__(self, max_keys: int = 100000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._arrivals: "OrderedDict[str, float]" = OrderedDict()
+    
+    def acquire(self, key: str, rate: float, burst: float) -> Tuple[bool, float]:
+        now = self.clock()
+        with self._lock:
+            new_tat, overflow = next_arrival(self._arrivals.get(key, now), now, rate, burst)
+            if overflow > 0:
+                return False, overflow
+            self._arrivals[key] = new_tat
+            self._arrivals.move_to_end(key)
+            if len(self._arrivals) > self.max_keys:
+                self._arrivals.popitem(last=False)
+        return True, 0.0
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._arrivals.clear()
+
+
+class SharedBucketStore(BucketStore):
+    blocking = True
+    
+    def __init__(self, collection: Collection, clock: Callable[[], float] = time.time):
+        self.collection = collection
+        self.clock = clock
+        self.collection.create_index("expires_at", expireAfterSeconds=0)
+    
+    def acquire(self, key: str, rate: float, burst: float) -> Tuple[bool, float]:
+        try:
+            for _ in range(MAX_UPDATE_ATTEMPTS):
+                now = self.clock()
+                bucket = self.collection.find_one({"_id": key}, {"tat": 1})
+                tat = bucket["tat"] if bucket else now
+                new_tat, overflow = next_arrival(tat, now, rate, burst)
+                if overflow > 0:
+                    return False, overflow
+                
+                fields = {"tat": new_tat, "expires_at": datetime.utcfromtimestamp(new_tat)}
+                if bucket is None:
+                    try:
+                        self.collection.insert_one({"_id": key, **fields})
+                    except DuplicateKeyError:
+                        continue
+                    return True, 0.0
+                result = self.collection.update_one({"_id": key, "tat": tat}, {"$set": fields})
+                if result.modified_count:
+                    return True, 0.0
+        except PyMongoError:
+            return True, 0.0
+        return False, 1.0 / rate
+    
+    def clear(self) -> None:
+        self.collection.delete_many({})
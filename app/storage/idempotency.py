@@ -0,0 +1,108 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+
+from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError
+
+
+STATUS_ACQUIRED = "acquired"
+STATUS_IN_PROGRESS = "in_progress"
+STATUS_COMPLETED = "completed"
+
+
+class IdempotencyStore:
+    def __init__(
+        self,
+        collection: Collection,
+        ttl_seconds: float = 86400.0,
+        lock_seconds: float = 60.0,
+        cache_size: int = 10000
+    ):
+        self.collection = collection
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.lock_ttl = timedelta(seconds=lock_seconds)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.collection.create_index("expires_at", expireAfterSeconds=0)
+    
+    def _cached(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._cache.get(key)
+            if record is None:
+                return None
+            if record["expires_at"] <= datetime.utcnow():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return record
+    
+    def _remember(self, key: str, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._cache[key] = record
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def begin(self, key: str, fingerprint: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        record = self._cached(key)
+        if record is not None:
+            return STATUS_COMPLETED, record
+        
+        now = datetime.utcnow()
+        lock = {
+            "_id": key,
+            "status": STATUS_IN_PROGRESS,
+            "fingerprint": fingerprint,
+            "created_at": now,
+            "expires_at": now + self.lock_ttl
+        }
+        for _ in range(2):
+            try:
+                self.collection.insert_one(dict(lock))
+                return STATUS_ACQUIRED, None
+            except DuplicateKeyError:
+                record = self.collection.find_one({"_id": key})
+            if record is None:
+                continue
+            
+            if record["expires_at"] <= now:
+                result = self.collection.replace_one(
+                    {"_id": key, "expires_at": record["expires_at"]},
+                    dict(lock)
+                )
+                if result.modified_count:
+                    return STATUS_ACQUIRED, None
+                record = self.collection.find_one({"_id": key})
+                if record is None:
+                    continue
+            
+            if record["status"] == STATUS_COMPLETED:
+                self._remember(key, record)
+            return record["status"], record
+        return STATUS_IN_PROGRESS, None
+    
+    def complete(self, key: str, fingerprint: str, status: int, headers: List[List[str]], body: bytes) -> None:
+        now = datetime.utcnow()
+        record = {
+            "_id": key,
+            "status": STATUS_COMPLETED,
+            "fingerprint": fingerprint,
+            "response_status": status,
+            "response_headers": headers,
+            "response_body": body,
+            "created_at": now,
+            "expires_at": now + self.ttl
+        }
+        self.collection.replace_one({"_id": key}, record, upsert=True)
+        self._remember(key, record)
+    
+    def abandon(self, key: str) -> None:
+        self.collection.delete_one({"_id": key, "status": STATUS_IN_PROGRESS})
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+        self.collection.delete_many({})
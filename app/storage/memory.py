@@ -0,0 +1,989 @@
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
+
+import bson
+from bson import ObjectId
+from pymongo import DeleteMany, DeleteOne, InsertOne, ReplaceOne, ReturnDocument, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError, CollectionInvalid, DuplicateKeyError, OperationFailure
+from pymongo.results import BulkWriteResult, DeleteResult, InsertManyResult, InsertOneResult, UpdateResult
+
+from app.storage.base import StorageBackend
+
+
+_MISSING = object()
+
+_TYPE_ORDER = (
+    (type(None), 1),
+    (bool, 8),
+    (int, 2),
+    (float, 2),
+    (str, 3),
+    (dict, 4),
+    (list, 5),
+    (ObjectId, 7),
+    (datetime, 9)
+)
+
+TTL_PURGE_INTERVAL_SECONDS = 1.0
+STORAGE_PAGE_SIZE = 4096
+INDEX_ENTRY_OVERHEAD = 16
+
+SortSpec = Union[str, List[Tuple[str, int]]]
+
+
+def _clone(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _clone(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone(item) for item in value]
+    return value
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _get_path(doc: Any, path: str) -> Any:
+    current = doc
+    for part in path.split("."):
+        if isinstance(current, dict):
+            if part not in current:
+                return _MISSING
+            current = current[part]
+        elif isinstance(current, list) and part.isdigit():
+            index = int(part)
+            if index >= len(current):
+                return _MISSING
+            current = current[index]
+        else:
+            return _MISSING
+    return current
+
+
+def _set_path(doc: Dict[str, Any], path: str, value: Any) -> None:
+    parts = path.split(".")
+    current = doc
+    for part in parts[:-1]:
+        child = current.get(part)
+        if not isinstance(child, dict):
+            child = current[part] = {}
+        current = child
+    current[parts[-1]] = value
+
+
+def _unset_path(doc: Dict[str, Any], path: str) -> None:
+    parts = path.split(".")
+    current = doc
+    for part in parts[:-1]:
+        current = current.get(part)
+        if not isinstance(current, dict):
+            return
+    current.pop(parts[-1], None)
+
+
+def _type_rank(value: Any) -> int:
+    if value is _MISSING:
+        return 0
+    for value_type, rank in _TYPE_ORDER:
+        if isinstance(value, value_type):
+            return rank
+    return 6
+
+
+def _sort_key(value: Any) -> Tuple[int, Any]:
+    rank = _type_rank(value)
+    if rank in (0, 1):
+        return (rank, 0)
+    if rank in (4, 5):
+        return (rank, repr(value))
+    if rank == 7:
+        return (rank, str(value))
+    return (rank, value)
+
+
+def _equals(value: Any, expected: Any) -> bool:
+    if isinstance(expected, re.Pattern):
+        if isinstance(value, list):
+            return any(_equals(item, expected) for item in value)
+        return isinstance(value, str) and expected.search(value) is not None
+    if value is _MISSING:
+        return expected is None
+    if isinstance(value, list) and not isinstance(expected, list):
+        return any(item == expected for item in value)
+    return value == expected
+
+
+def _compare(value: Any, operand: Any, op: str) -> bool:
+    if value is _MISSING or value is None:
+        return False
+    if isinstance(value, list):
+        return any(_compare(item, operand, op) for item in value)
+    if _type_rank(value) != _type_rank(operand):
+        return False
+    try:
+        if op == "$gt":
+            return value > operand
+        if op == "$gte":
+            return value >= operand
+        if op == "$lt":
+            return value < operand
+        return value <= operand
+    except TypeError:
+        return False
+
+
+def _apply_operator(value: Any, op: str, operand: Any, condition: Mapping[str, Any]) -> bool:
+    if op == "$eq":
+        return _equals(value, operand)
+    if op == "$ne":
+        return not _equals(value, operand)
+    if op in ("$gt", "$gte", "$lt", "$lte"):
+        return _compare(value, operand, op)
+    if op == "$in":
+        return any(_equals(value, item) for item in operand)
+    if op == "$nin":
+        return not any(_equals(value, item) for item in operand)
+    if op == "$exists":
+        return (value is not _MISSING) == bool(operand)
+    if op == "$regex":
+        flags = 0
+        for option in condition.get("$options", ""):
+            flags |= {"i": re.IGNORECASE, "m": re.MULTILINE, "s": re.DOTALL, "x": re.VERBOSE}.get(option, 0)
+        pattern = operand if isinstance(operand, re.Pattern) else re.compile(operand, flags)
+        return _equals(value, pattern)
+    if op == "$options":
+        return True
+    if op == "$not":
+        return not _match_value(value, operand)
+    if op == "$size":
+        return isinstance(value, list) and len(value) == operand
+    if op == "$elemMatch":
+        return isinstance(value, list) and any(
+            _match(item, operand) if isinstance(item, dict) else _match_value(item, operand)
+            for item in value
+        )
+    raise OperationFailure(f"unknown operator: {op}")
+
+
+def _is_operator_condition(condition: Any) -> bool:
+    return isinstance(condition, dict) and bool(condition) and all(
+        isinstance(key, str) and key.startswith("$") for key in condition
+    )
+
+
+def _match_value(value: Any, condition: Any) -> bool:
+    if _is_operator_condition(condition):
+        return all(_apply_operator(value, op, operand, condition) for op, operand in condition.items())
+    return _equals(value, condition)
+
+
+def _match(doc: Mapping[str, Any], query: Optional[Mapping[str, Any]]) -> bool:
+    if not query:
+        return True
+    for key, condition in query.items():
+        if key == "$and":
+            if not all(_match(doc, sub) for sub in condition):
+                return False
+        elif key == "$or":
+            if not any(_match(doc, sub) for sub in condition):
+                return False
+        elif key == "$nor":
+            if any(_match(doc, sub) for sub in condition):
+                return False
+        elif key.startswith("$"):
+            raise OperationFailure(f"unknown top level operator: {key}")
+        elif not _match_value(_get_path(doc, key), condition):
+            return False
+    return True
+
+
+def _project(doc: Dict[str, Any], projection: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+    if not projection:
+        return doc
+    if isinstance(projection, (list, tuple)):
+        projection = {field: 1 for field in projection}
+    include_id = bool(projection.get("_id", True))
+    fields = {key: value for key, value in projection.items() if key != "_id"}
+    if fields and all(bool(value) for value in fields.values()):
+        result: Dict[str, Any] = {}
+        for field in fields:
+            value = _get_path(doc, field)
+            if value is not _MISSING:
+                _set_path(result, field, value)
+        if include_id and "_id" in doc:
+            result["_id"] = doc["_id"]
+        return result
+    result = dict(doc)
+    for field in fields:
+        _unset_path(result, field)
+    if not include_id:
+        result.pop("_id", None)
+    return result
+
+
+def _normalize_sort(key_or_list: SortSpec, direction: Optional[int] = None) -> List[Tuple[str, int]]:
+    if isinstance(key_or_list, str):
+        return [(key_or_list, direction if direction is not None else 1)]
+    if isinstance(key_or_list, dict):
+        return list(key_or_list.items())
+    return [(key, value) for key, value in key_or_list]
+
+
+def _sort_documents(docs: List[Dict[str, Any]], spec: List[Tuple[str, int]]) -> List[Dict[str, Any]]:
+    for field, direction in reversed(spec):
+        docs.sort(key=lambda doc: _sort_key(_get_path(doc, field)), reverse=direction < 0)
+    return docs
+
+
+def _apply_update(doc: Dict[str, Any], update: Mapping[str, Any], is_insert: bool = False) -> None:
+    if not any(key.startswith("$") for key in update):
+        doc_id = doc.get("_id")
+        doc.clear()
+        doc.update(_clone(dict(update)))
+        if doc_id is not None:
+            doc["_id"] = doc_id
+        return
+    
+    for op, fields in update.items():
+        if op == "$set" or (op == "$setOnInsert" and is_insert):
+            for path, value in fields.items():
+                _set_path(doc, path, _clone(value))
+        elif op == "$setOnInsert":
+            continue
+        elif op == "$unset":
+            for path in fields:
+                _unset_path(doc, path)
+        elif op == "$inc":
+            for path, amount in fields.items():
+                current = _get_path(doc, path)
+                _set_path(doc, path, (0 if current is _MISSING else current) + amount)
+        elif op in ("$max", "$min"):
+            for path, value in fields.items():
+                current = _get_path(doc, path)
+                if current is _MISSING or (value > current if op == "$max" else value < current):
+                    _set_path(doc, path, _clone(value))
+        elif op == "$currentDate":
+            for path in fields:
+                _set_path(doc, path, datetime.utcnow())
+        elif op in ("$push", "$addToSet"):
+            for path, value in fields.items():
+                current = _get_path(doc, path)
+                items = current if isinstance(current, list) else []
+                values = value["$each"] if isinstance(value, dict) and "$each" in value else [value]
+                for item in values:
+                    if op == "$push" or item not in items:
+                        items.append(_clone(item))
+                if isinstance(value, dict) and "$slice" in value:
+                    limit = value["$slice"]
+                    items[:] = items[limit:] if limit < 0 else items[:limit]
+                _set_path(doc, path, items)
+        elif op == "$pull":
+            for path, condition in fields.items():
+                current = _get_path(doc, path)
+                if isinstance(current, list):
+                    _set_path(doc, path, [
+                        item for item in current
+                        if not (_match(item, condition) if isinstance(item, dict) and isinstance(condition, dict) and not _is_operator_condition(condition) else _match_value(item, condition))
+                    ])
+        else:
+            raise OperationFailure(f"Unknown modifier: {op}")
+
+
+def _upsert_seed(query: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+    seed: Dict[str, Any] = {}
+    for key, condition in (query or {}).items():
+        if key.startswith("$"):
+            continue
+        if _is_operator_condition(condition):
+            if "$eq" in condition:
+                _set_path(seed, key, _clone(condition["$eq"]))
+            continue
+        _set_path(seed, key, _clone(condition))
+    return seed
+
+
+class _Index:
+    def __init__(
+        self,
+        name: str,
+        fields: List[Tuple[str, int]],
+        unique: bool = False,
+        sparse: bool = False,
+        expire_after_seconds: Optional[float] = None
+    ):
+        self.name = name
+        self.fields = fields
+        self.field_names = [field for field, _ in fields]
+        self.unique = unique
+        self.sparse = sparse
+        self.expire_after_seconds = expire_after_seconds
+        self.multikey = False
+        self.entries: Dict[Any, Set[Any]] = {}
+    
+    def key_for(self, doc: Mapping[str, Any]) -> Optional[Tuple]:
+        values = [_get_path(doc, field) for field in self.field_names]
+        if self.sparse and all(value is _MISSING for value in values):
+            return None
+        if any(isinstance(value, list) for value in values):
+            self.multikey = True
+        return tuple(None if value is _MISSING else _freeze(value) for value in values)
+    
+    def check(self, doc: Mapping[str, Any], doc_id: Any) -> None:
+        if not self.unique:
+            return
+        key = self.key_for(doc)
+        if key is None:
+            return
+        holders = self.entries.get(key)
+        if holders and any(holder != doc_id for holder in holders):
+            raise DuplicateKeyError(
+                f"E11000 duplicate key error index: {self.name} dup key: {dict(zip(self.field_names, key))}",
+                11000
+            )
+    
+    def add(self, doc: Mapping[str, Any], doc_id: Any) -> None:
+        key = self.key_for(doc)
+        if key is not None:
+            self.entries.setdefault(key, set()).add(doc_id)
+    
+    def remove(self, doc: Mapping[str, Any], doc_id: Any) -> None:
+        key = self.key_for(doc)
+        if key is None:
+            return
+        holders = self.entries.get(key)
+        if holders is not None:
+            holders.discard(doc_id)
+            if not holders:
+                del self.entries[key]
+    
+    def candidates(self, query: Mapping[str, Any]) -> Optional[Set[Any]]:
+        if self.multikey:
+            return None
+        keys: List[List[Any]] = []
+        for field in self.field_names:
+            if field not in query:
+                return None
+            condition = query[field]
+            if _is_operator_condition(condition):
+                if set(condition) == {"$eq"}:
+                    keys.append([condition["$eq"]])
+                elif set(condition) == {"$in"}:
+                    keys.append(list(condition["$in"]))
+                else:
+                    return None
+            elif isinstance(condition, (dict, list, re.Pattern)):
+                return None
+            else:
+                keys.append([condition])
+        
+        ids: Set[Any] = set()
+        combos: List[Tuple] = [()]
+        for options in keys:
+            combos = [combo + (_freeze(option),) for combo in combos for option in options]
+        for combo in combos:
+            ids.update(self.entries.get(combo, ()))
+        return ids
+    
+    def size(self, docs: Iterable[Mapping[str, Any]]) -> int:
+        total = 0
+        for doc in docs:
+            values = [_get_path(doc, field) for field in self.field_names]
+            if self.sparse and all(value is _MISSING for value in values):
+                continue
+            key = [None if value is _MISSING else value for value in values]
+            total += len(bson.encode({"k": key})) + INDEX_ENTRY_OVERHEAD
+        return total
+    
+    def info(self) -> Dict[str, Any]:
+        info: Dict[str, Any] = {"key": list(self.fields), "v": 2}
+        if self.unique:
+            info["unique"] = True
+        if self.sparse:
+            info["sparse"] = True
+        if self.expire_after_seconds is not None:
+            info["expireAfterSeconds"] = self.expire_after_seconds
+        return info
+
+
+class MemoryCursor:
+    def __init__(
+        self,
+        collection: "MemoryCollection",
+        query: Optional[Mapping[str, Any]],
+        projection: Optional[Mapping[str, Any]] = None,
+        sort: Optional[SortSpec] = None,
+        skip: int = 0,
+        limit: int = 0
+    ):
+        self.collection = collection
+        self.query = query
+        self.projection = projection
+        self._sort = _normalize_sort(sort) if sort else None
+        self._skip = skip
+        self._limit = limit
+        self._results: Optional[Iterator[Dict[str, Any]]] = None
+    
+    def sort(self, key_or_list: SortSpec, direction: Optional[int] = None) -> "MemoryCursor":
+        self._sort = _normalize_sort(key_or_list, direction)
+        return self
+    
+    def skip(self, count: int) -> "MemoryCursor":
+        self._skip = count
+        return self
+    
+    def limit(self, count: int) -> "MemoryCursor":
+        self._limit = count
+        return self
+    
+    def batch_size(self, size: int) -> "MemoryCursor":
+        return self
+    
+    def hint(self, index: Any) -> "MemoryCursor":
+        return self
+    
+    def _execute(self) -> Iterator[Dict[str, Any]]:
+        docs = self.collection._select(self.query, self._sort, self._skip, self._limit)
+        return iter([_project(doc, self.projection) for doc in docs])
+    
+    def __iter__(self) -> "MemoryCursor":
+        return self
+    
+    def __next__(self) -> Dict[str, Any]:
+        if self._results is None:
+            self._results = self._execute()
+        return next(self._results)
+    
+    def close(self) -> None:
+        self._results = iter(())
+
+
+class MemoryCollection:
+    def __init__(self, database: "MemoryDatabase", name: str):
+        self.database = database
+        self.name = name
+        self.full_name = f"{database.name}.{name}"
+        self.exists = False
+        self.options: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._docs: Dict[Any, Dict[str, Any]] = {}
+        self._indexes: Dict[str, _Index] = {"_id_": _Index("_id_", [("_id", 1)], unique=True)}
+        self._last_purge = 0.0
+    
+    def with_options(self, **kwargs: Any) -> "MemoryCollection":
+        return self
+    
+    def _ensure_exists(self) -> None:
+        if not self.exists:
+            self.exists = True
+            self.database._touch(self.name)
+    
+    def _purge_expired(self) -> None:
+        ttl_indexes = [index for index in self._indexes.values() if index.expire_after_seconds is not None]
+        if not ttl_indexes:
+            return
+        now = time.monotonic()
+        if now - self._last_purge < TTL_PURGE_INTERVAL_SECONDS:
+            return
+        self._last_purge = now
+        wall_clock = datetime.utcnow()
+        expired = []
+        for doc_id, doc in self._docs.items():
+            for index in ttl_indexes:
+                value = _get_path(doc, index.field_names[0])
+                if isinstance(value, datetime) and value + timedelta(seconds=index.expire_after_seconds) <= wall_clock:
+                    expired.append(doc_id)
+                    break
+        for doc_id in expired:
+            self._remove(doc_id)
+    
+    def _candidate_ids(self, query: Optional[Mapping[str, Any]]) -> Iterable[Any]:
+        if query:
+            best: Optional[Set[Any]] = None
+            for index in self._indexes.values():
+                ids = index.candidates(query)
+                if ids is not None and (best is None or len(ids) < len(best)):
+                    best = ids
+                    if len(best) <= 1:
+                        break
+            if best is not None:
+                return list(best)
+        return list(self._docs)
+    
+    def _matching(self, query: Optional[Mapping[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for doc_id in self._candidate_ids(query):
+            doc = self._docs.get(doc_id)
+            if doc is not None and _match(doc, query):
+                yield doc
+    
+    def _select(
+        self,
+        query: Optional[Mapping[str, Any]],
+        sort: Optional[List[Tuple[str, int]]] = None,
+        skip: int = 0,
+        limit: int = 0
+    ) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._purge_expired()
+            if sort:
+                docs = _sort_documents(list(self._matching(query)), sort)
+                docs = docs[skip:skip + limit] if limit else docs[skip:]
+            else:
+                docs = []
+                skipped = 0
+                for doc in self._matching(query):
+                    if skipped < skip:
+                        skipped += 1
+                        continue
+                    docs.append(doc)
+                    if limit and len(docs) >= limit:
+                        break
+            return [_clone(doc) for doc in docs]
+    
+    def _insert(self, doc: Dict[str, Any]) -> Any:
+        if "_id" not in doc:
+            doc["_id"] = ObjectId()
+        stored = _clone(doc)
+        doc_id = stored["_id"]
+        if doc_id in self._docs:
+            raise DuplicateKeyError(f"E11000 duplicate key error index: _id_ dup key: {{'_id': {doc_id!r}}}", 11000)
+        for index in self._indexes.values():
+            index.check(stored, doc_id)
+        for index in self._indexes.values():
+            index.add(stored, doc_id)
+        self._docs[doc_id] = stored
+        self._ensure_exists()
+        return doc_id
+    
+    def _remove(self, doc_id: Any) -> None:
+        doc = self._docs.pop(doc_id, None)
+        if doc is not None:
+            for index in self._indexes.values():
+                index.remove(doc, doc_id)
+    
+    def _replace_stored(self, doc_id: Any, old: Dict[str, Any], new: Dict[str, Any]) -> None:
+        if new.get("_id", doc_id) != doc_id:
+            raise OperationFailure("Performing an update on the path '_id' would modify the immutable field '_id'")
+        new["_id"] = doc_id
+        for index in self._indexes.values():
+            index.check(new, doc_id)
+        for index in self._indexes.values():
+            index.remove(old, doc_id)
+            index.add(new, doc_id)
+        self._docs[doc_id] = new
+    
+    def _update(
+        self,
+        query: Optional[Mapping[str, Any]],
+        update: Mapping[str, Any],
+        upsert: bool,
+        many: bool
+    ) -> Tuple[int, int, Any, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        matched = modified = 0
+        before = after = None
+        for doc in list(self._matching(query)):
+            doc_id = doc["_id"]
+            new = _clone(doc)
+            _apply_update(new, update)
+            matched += 1
+            if new != doc:
+                self._replace_stored(doc_id, doc, new)
+                modified += 1
+            if before is None:
+                before, after = doc, self._docs[doc_id]
+            if not many:
+                break
+        
+        upserted_id = None
+        if matched == 0 and upsert:
+            new = _upsert_seed(query)
+            _apply_update(new, update, is_insert=True)
+            upserted_id = self._insert(new)
+            after = self._docs[upserted_id]
+        return matched, modified, upserted_id, before, after
+    
+    def insert_one(self, document: Dict[str, Any], **kwargs: Any) -> InsertOneResult:
+        with self._lock:
+            return InsertOneResult(self._insert(document), True)
+    
+    def insert_many(self, documents: Iterable[Dict[str, Any]], ordered: bool = True, **kwargs: Any) -> InsertManyResult:
+        inserted_ids = []
+        errors: List[Dict[str, Any]] = []
+        with self._lock:
+            for index, document in enumerate(documents):
+                try:
+                    inserted_ids.append(self._insert(document))
+                except DuplicateKeyError as e:
+                    errors.append({"index": index, "code": 11000, "errmsg": str(e), "op": document})
+                    if ordered:
+                        break
+        if errors:
+            raise BulkWriteError({
+                "nInserted": len(inserted_ids),
+                "nUpserted": 0,
+                "nMatched": 0,
+                "nModified": 0,
+                "nRemoved": 0,
+                "upserted": [],
+                "writeErrors": errors,
+                "writeConcernErrors": []
+            })
+        return InsertManyResult(inserted_ids, True)
+    
+    def find(
+        self,
+        filter: Optional[Mapping[str, Any]] = None,
+        projection: Optional[Mapping[str, Any]] = None,
+        skip: int = 0,
+        limit: int = 0,
+        sort: Optional[SortSpec] = None,
+        **kwargs: Any
+    ) -> MemoryCursor:
+        return MemoryCursor(self, filter, projection, sort, skip, limit)
+    
+    def find_one(
+        self,
+        filter: Optional[Any] = None,
+        projection: Optional[Mapping[str, Any]] = None,
+        sort: Optional[SortSpec] = None,
+        **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        if filter is not None and not isinstance(filter, Mapping):
+            filter = {"_id": filter}
+        docs = self._select(filter, _normalize_sort(sort) if sort else None, 0, 1)
+        return _project(docs[0], projection) if docs else None
+    
+    def count_documents(self, filter: Mapping[str, Any], skip: int = 0, limit: int = 0, **kwargs: Any) -> int:
+        with self._lock:
+            self._purge_expired()
+            count = sum(1 for _ in self._matching(filter)) - skip
+            count = max(count, 0)
+            return min(count, limit) if limit else count
+    
+    def estimated_document_count(self, **kwargs: Any) -> int:
+        with self._lock:
+            return len(self._docs)
+    
+    def distinct(self, key: str, filter: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> List[Any]:
+        values: List[Any] = []
+        for doc in self._select(filter):
+            value = _get_path(doc, key)
+            for item in (value if isinstance(value, list) else [value]):
+                if item is not _MISSING and item not in values:
+                    values.append(item)
+        return values
+    
+    def update_one(self, filter: Mapping[str, Any], update: Mapping[str, Any], upsert: bool = False, **kwargs: Any) -> UpdateResult:
+        with self._lock:
+            self._purge_expired()
+            matched, modified, upserted_id, _, _ = self._update(filter, update, upsert, many=False)
+        raw = {"n": matched or (1 if upserted_id is not None else 0), "nModified": modified, "updatedExisting": matched > 0}
+        if upserted_id is not None:
+            raw["upserted"] = upserted_id
+        return UpdateResult(raw, True)
+    
+    def update_many(self, filter: Mapping[str, Any], update: Mapping[str, Any], upsert: bool = False, **kwargs: Any) -> UpdateResult:
+        with self._lock:
+            self._purge_expired()
+            matched, modified, upserted_id, _, _ = self._update(filter, update, upsert, many=True)
+        raw = {"n": matched or (1 if upserted_id is not None else 0), "nModified": modified, "updatedExisting": matched > 0}
+        if upserted_id is not None:
+            raw["upserted"] = upserted_id
+        return UpdateResult(raw, True)
+    
+    def replace_one(self, filter: Mapping[str, Any], replacement: Mapping[str, Any], upsert: bool = False, **kwargs: Any) -> UpdateResult:
+        if any(key.startswith("$") for key in replacement):
+            raise ValueError("replacement can not include $ operators")
+        return self.update_one(filter, replacement, upsert=upsert)
+    
+    def find_one_and_update(
+        self,
+        filter: Mapping[str, Any],
+        update: Mapping[str, Any],
+        projection: Optional[Mapping[str, Any]] = None,
+        sort: Optional[SortSpec] = None,
+        upsert: bool = False,
+        return_document: bool = ReturnDocument.BEFORE,
+        **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._purge_expired()
+            query = filter
+            if sort:
+                docs = _sort_documents(list(self._matching(filter)), _normalize_sort(sort))
+                if docs:
+                    query = {"_id": docs[0]["_id"]}
+            _, _, upserted_id, before, after = self._update(query, update, upsert, many=False)
+            result = after if return_document == ReturnDocument.AFTER else before
+            if upserted_id is not None and return_document != ReturnDocument.AFTER:
+                result = None
+            return _project(_clone(result), projection) if result is not None else None
+    
+    def find_one_and_replace(self, filter: Mapping[str, Any], replacement: Mapping[str, Any], **kwargs: Any) -> Optional[Dict[str, Any]]:
+        return self.find_one_and_update(filter, replacement, **kwargs)
+    
+    def find_one_and_delete(
+        self,
+        filter: Mapping[str, Any],
+        projection: Optional[Mapping[str, Any]] = None,
+        sort: Optional[SortSpec] = None,
+        **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._purge_expired()
+            docs = list(self._matching(filter))
+            if sort:
+                docs = _sort_documents(docs, _normalize_sort(sort))
+            if not docs:
+                return None
+            self._remove(docs[0]["_id"])
+            return _project(docs[0], projection)
+    
+    def delete_one(self, filter: Mapping[str, Any], **kwargs: Any) -> DeleteResult:
+        with self._lock:
+            for doc in self._matching(filter):
+                self._remove(doc["_id"])
+                return DeleteResult({"n": 1}, True)
+        return DeleteResult({"n": 0}, True)
+    
+    def delete_many(self, filter: Mapping[str, Any], **kwargs: Any) -> DeleteResult:
+        with self._lock:
+            doc_ids = [doc["_id"] for doc in self._matching(filter)]
+            for doc_id in doc_ids:
+                self._remove(doc_id)
+        return DeleteResult({"n": len(doc_ids)}, True)
+    
+    def bulk_write(self, requests: Iterable[Any], ordered: bool = True, **kwargs: Any) -> BulkWriteResult:
+        raw: Dict[str, Any] = {
+            "nInserted": 0,
+            "nUpserted": 0,
+            "nMatched": 0,
+            "nModified": 0,
+            "nRemoved": 0,
+            "upserted": [],
+            "writeErrors": [],
+            "writeConcernErrors": []
+        }
+        with self._lock:
+            self._purge_expired()
+            for index, request in enumerate(requests):
+                try:
+                    if isinstance(request, InsertOne):
+                        self._insert(request._doc)
+                        raw["nInserted"] += 1
+                    elif isinstance(request, (UpdateOne, UpdateMany, ReplaceOne)):
+                        matched, modified, upserted_id, _, _ = self._update(
+                            request._filter,
+                            request._doc,
+                            request._upsert,
+                            many=isinstance(request, UpdateMany)
+                        )
+                        raw["nMatched"] += matched
+                        raw["nModified"] += modified
+                        if upserted_id is not None:
+                            raw["nUpserted"] += 1
+                            raw["upserted"].append({"index": index, "_id": upserted_id})
+                    elif isinstance(request, (DeleteOne, DeleteMany)):
+                        doc_ids = [doc["_id"] for doc in self._matching(request._filter)]
+                        if isinstance(request, DeleteOne):
+                            doc_ids = doc_ids[:1]
+                        for doc_id in doc_ids:
+                            self._remove(doc_id)
+                        raw["nRemoved"] += len(doc_ids)
+                    else:
+                        raise TypeError(f"{request!r} is not a valid request")
+                except DuplicateKeyError as e:
+                    raw["writeErrors"].append({"index": index, "code": 11000, "errmsg": str(e), "op": request})
+                    if ordered:
+                        break
+        if raw["writeErrors"]:
+            raise BulkWriteError(raw)
+        return BulkWriteResult(raw, True)
+    
+    def create_index(self, keys: SortSpec, **kwargs: Any) -> str:
+        fields = _normalize_sort(keys, 1)
+        name = kwargs.get("name") or "_".join(f"{field}_{direction}" for field, direction in fields)
+        with self._lock:
+            if name in self._indexes:
+                return name
+            index = _Index(
+                name,
+                fields,
+                unique=bool(kwargs.get("unique", False)),
+                sparse=bool(kwargs.get("sparse", False)),
+                expire_after_seconds=kwargs.get("expireAfterSeconds")
+            )
+            for doc_id, doc in self._docs.items():
+                index.check(doc, doc_id)
+                index.add(doc, doc_id)
+            self._indexes[name] = index
+            self._ensure_exists()
+        return name
+    
+    def index_information(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: index.info() for name, index in self._indexes.items()}
+    
+    def drop_index(self, name: str, **kwargs: Any) -> None:
+        with self._lock:
+            if name == "_id_" or name not in self._indexes:
+                raise OperationFailure(f"index not found with name [{name}]")
+            del self._indexes[name]
+    
+    def drop_indexes(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._indexes = {"_id_": self._indexes["_id_"]}
+    
+    def drop(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._docs.clear()
+            self._indexes = {"_id_": _Index("_id_", [("_id", 1)], unique=True)}
+            self.options = {}
+            if self.exists:
+                self.exists = False
+                self.database._forget(self.name)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count = len(self._docs)
+            size = sum(len(bson.encode(doc)) for doc in self._docs.values())
+            index_sizes = {name: index.size(self._docs.values()) for name, index in self._indexes.items()}
+            return {
+                "ns": self.full_name,
+                "count": count,
+                "size": size,
+                "avgObjSize": size // count if count else 0,
+                "storageSize": -(-size // STORAGE_PAGE_SIZE) * STORAGE_PAGE_SIZE,
+                "nindexes": len(self._indexes),
+                "totalIndexSize": sum(index_sizes.values()),
+                "indexSizes": index_sizes
+            }
+
+
+class MemoryDatabase:
+    def __init__(self, backend: "MemoryBackend", name: str):
+        self.backend = backend
+        self.name = name
+        self._lock = threading.RLock()
+        self._collections: Dict[str, MemoryCollection] = {}
+        self._existing: Set[str] = set()
+    
+    def __getitem__(self, name: str) -> MemoryCollection:
+        collection = self._collections.get(name)
+        if collection is None:
+            with self._lock:
+                collection = self._collections.get(name)
+                if collection is None:
+                    collection = self._collections[name] = MemoryCollection(self, name)
+        return collection
+    
+    def get_collection(self, name: str, **kwargs: Any) -> MemoryCollection:
+        return self[name]
+    
+    def with_options(self, **kwargs: Any) -> "MemoryDatabase":
+        return self
+    
+    def _touch(self, name: str) -> None:
+        with self._lock:
+            self._existing.add(name)
+    
+    def _forget(self, name: str) -> None:
+        with self._lock:
+            self._existing.discard(name)
+    
+    def list_collection_names(self, filter: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> List[str]:
+        if filter and list(filter) == ["name"] and isinstance(filter["name"], str):
+            with self._lock:
+                return [filter["name"]] if filter["name"] in self._existing else []
+        with self._lock:
+            names = sorted(self._existing)
+        if filter:
+            names = [name for name in names if _match({"name": name}, filter)]
+        return names
+    
+    def list_collections(self, filter: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> Iterator[Dict[str, Any]]:
+        for name in self.list_collection_names(filter):
+            yield {"name": name, "type": "collection", "options": _clone(self[name].options)}
+    
+    def create_collection(self, name: str, **options: Any) -> MemoryCollection:
+        collection = self[name]
+        with collection._lock:
+            if collection.exists:
+                raise CollectionInvalid(f"collection {name} already exists")
+            collection.options = {key: value for key, value in options.items() if key not in ("session", "check_exists")}
+            collection._ensure_exists()
+        return collection
+    
+    def drop_collection(self, name: str, **kwargs: Any) -> Dict[str, Any]:
+        self[name].drop()
+        return {"ok": 1.0}
+    
+    def command(self, command: Union[str, Mapping[str, Any]], value: Any = 1, **kwargs: Any) -> Dict[str, Any]:
+        if isinstance(command, Mapping):
+            spec = dict(command)
+            name = next(iter(spec))
+            value = spec.pop(name)
+            kwargs = {**spec, **kwargs}
+        else:
+            name = command
+        
+        if name in ("ping", "hello", "isMaster", "ismaster"):
+            return {"ok": 1.0}
+        if name == "collMod":
+            collection = self[value]
+            if not collection.exists:
+                raise OperationFailure(f"ns does not exist: {self.name}.{value}", 26)
+            with collection._lock:
+                collection.options.update({
+                    key: option for key, option in kwargs.items()
+                    if key in ("validator", "validationLevel", "validationAction")
+                })
+            return {"ok": 1.0}
+        if name == "collStats":
+            return {**self[value].stats(), "ok": 1.0}
+        if name == "dbStats":
+            names = self.list_collection_names()
+            return {
+                "db": self.name,
+                "collections": len(names),
+                "objects": sum(self[collection].estimated_document_count() for collection in names),
+                "ok": 1.0
+            }
+        raise OperationFailure(f"no such command: '{name}'", 59)
+
+
+class MemoryBackend(StorageBackend):
+    name = "memory"
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._databases: Dict[str, MemoryDatabase] = {}
+    
+    def get_database(self, name: str) -> MemoryDatabase:
+        database = self._databases.get(name)
+        if database is None:
+            with self._lock:
+                database = self._databases.get(name)
+                if database is None:
+                    database = self._databases[name] = MemoryDatabase(self, name)
+        return database
+    
+    def list_database_names(self) -> List[str]:
+        with self._lock:
+            return sorted(
+                name for name, database in self._databases.items()
+                if database.list_collection_names()
+            )
+    
+    def drop_database(self, name: str) -> None:
+        with self._lock:
+            database = self._databases.pop(name, None)
+        if database is not None:
+            for collection in database.list_collection_names():
+                database[collection].drop()
@@ -0,0 +1,52 @@
+from typing import List, Optional
+
+from pymongo import MongoClient
+from pymongo.client_session import ClientSession
+from pymongo.database import Database
+from pymongo.monitoring import _EventListener
+from pymongo.server_api import ServerApi
+
+from app.storage.base import StorageBackend
+
+
+_event_listeners: List[_EventListener] = []
+
+
+def register_event_listener(listener: _EventListener) -> None:
+    if listener not in _event_listeners:
+        _event_listeners.append(listener)
+
+
+class MongoBackend(StorageBackend):
+    name = "mongo"
+    
+    def __init__(self, url: str, client: Optional[MongoClient] = None):
+        self.url = url
+        self._client = client
+    
+    @property
+    def client(self) -> MongoClient:
+        if self._client is None:
+            self._client = MongoClient(
+                self.url,
+                server_api=ServerApi('1'),
+                event_listeners=list(_event_listeners)
+            )
+        return self._client
+    
+    def get_database(self, name: str) -> Database:
+        return self.client[name]
+    
+    def start_session(self, causal_consistency: bool = True) -> Optional[ClientSession]:
+        try:
+            return self.client.start_session(causal_consistency=causal_consistency)
+        except NotImplementedError:
+            return None
+    
+    def drop_database(self, name: str) -> None:
+        self.client.drop_database(name)
+    
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
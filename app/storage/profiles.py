@@ -0,0 +1,58 @@
+from typing import Dict, Any
+
+from pymongo import WriteConcern
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import Nearest, Primary, PrimaryPreferred, Secondary, SecondaryPreferred
+
+from app.config import settings
+
+
+READ_PREFERENCES = {
+    "primary": Primary,
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest
+}
+
+_options_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def build_profile_options(spec: Dict[str, Any]) -> Dict[str, Any]:
+    options: Dict[str, Any] = {}
+    
+    mode = spec.get("read_preference")
+    if mode is not None:
+        if mode not in READ_PREFERENCES:
+            raise ValueError(f"Unknown read preference '{mode}'. Expected one of {', '.join(READ_PREFERENCES)}")
+        if mode == "primary":
+            options["read_preference"] = Primary()
+        else:
+            options["read_preference"] = READ_PREFERENCES[mode](
+                max_staleness=spec.get("max_staleness_seconds", -1)
+            )
+    
+    if spec.get("read_concern") is not None:
+        options["read_concern"] = ReadConcern(spec["read_concern"])
+    
+    if spec.get("write_concern") is not None:
+        options["write_concern"] = WriteConcern(
+            w=spec["write_concern"],
+            j=spec.get("journal"),
+            wtimeout=spec.get("wtimeout_ms")
+        )
+    return options
+
+
+def profile_options(name: str) -> Dict[str, Any]:
+    options = _options_cache.get(name)
+    if options is None:
+        spec = settings.OPERATION_PROFILES.get(name)
+        if spec is None:
+            raise ValueError(f"Unknown operation profile '{name}'")
+        options = _options_cache[name] = build_profile_options(spec)
+    return options
+
+
+def clear_profile_cache() -> None:
+    _options_cache.clear()
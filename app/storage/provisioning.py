@@ -0,0 +1,141 @@
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.collection import Collection
+
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+
+class ProvisioningJobStore:
+    def __init__(
+        self,
+        collection: Collection,
+        lease_seconds: float = 60.0,
+        job_ttl_seconds: float = 604800.0
+    ):
+        self.collection = collection
+        self.lease = timedelta(seconds=lease_seconds)
+        self.job_ttl = timedelta(seconds=job_ttl_seconds)
+        self.collection.create_index([("status", 1), ("next_attempt_at", 1)])
+        self.collection.create_index("organization_name")
+        self.collection.create_index("expires_at", expireAfterSeconds=0)
+    
+    def enqueue(
+        self,
+        organization_name: str,
+        collection_name: str,
+        cluster: str,
+        database_name: str,
+        owner: str,
+        max_attempts: int
+    ) -> str:
+        now = datetime.utcnow()
+        result = self.collection.insert_one({
+            "organization_name": organization_name,
+            "collection_name": collection_name,
+            "cluster": cluster,
+            "database_name": database_name,
+            "status": JOB_QUEUED,
+            "owner": owner,
+            "worker": None,
+            "attempts": 0,
+            "max_attempts": max_attempts,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+            "next_attempt_at": now,
+            "locked_until": None,
+            "finished_at": None
+        })
+        return str(result.inserted_id)
+    
+    def claim(self, worker: str, owner: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        now = datetime.utcnow()
+        queued: Dict[str, Any] = {"status": JOB_QUEUED, "next_attempt_at": {"$lte": now}}
+        if owner is not None:
+            queued["$or"] = [{"owner": owner}, {"created_at": {"$lte": now - self.lease}}]
+        return self.collection.find_one_and_update(
+            {"$or": [queued, {"status": JOB_RUNNING, "locked_until": {"$lte": now}}]},
+            {
+                "$set": {
+                    "status": JOB_RUNNING,
+                    "worker": worker,
+                    "locked_until": now + self.lease,
+                    "updated_at": now
+                },
+                "$inc": {"attempts": 1}
+            },
+            sort=[("next_attempt_at", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+    
+    def _finish(self, job_id: Any, worker: Optional[str], status: str, error: Optional[str]) -> bool:
+        now = datetime.utcnow()
+        query: Dict[str, Any] = {"_id": ObjectId(job_id)}
+        if worker is not None:
+            query.update({"status": JOB_RUNNING, "worker": worker})
+        result = self.collection.update_one(query, {
+            "$set": {
+                "status": status,
+                "error": error,
+                "locked_until": None,
+                "updated_at": now,
+                "finished_at": now,
+                "expires_at": now + self.job_ttl
+            }
+        })
+        return bool(result.modified_count)
+    
+    def succeed(self, job_id: Any, worker: str) -> bool:
+        return self._finish(job_id, worker, JOB_SUCCEEDED, None)
+    
+    def fail(self, job_id: Any, worker: str, error: str) -> bool:
+        return self._finish(job_id, worker, JOB_FAILED, error)
+    
+    def cancel(self, job_id: Any, reason: str, worker: Optional[str] = None) -> bool:
+        return self._finish(job_id, worker, JOB_CANCELLED, reason)
+    
+    def retry(self, job_id: Any, worker: str, error: str, delay_seconds: float) -> bool:
+        now = datetime.utcnow()
+        result = self.collection.update_one(
+            {"_id": ObjectId(job_id), "status": JOB_RUNNING, "worker": worker},
+            {
+                "$set": {
+                    "status": JOB_QUEUED,
+                    "error": error,
+                    "locked_until": None,
+                    "updated_at": now,
+                    "next_attempt_at": now + timedelta(seconds=delay_seconds)
+                }
+            }
+        )
+        return bool(result.modified_count)
+    
+    def cancel_pending(self, organization_name: str, reason: str) -> int:
+        now = datetime.utcnow()
+        result = self.collection.update_many(
+            {"organization_name": organization_name, "status": {"$in": [JOB_QUEUED, JOB_RUNNING]}},
+            {
+                "$set": {
+                    "status": JOB_CANCELLED,
+                    "error": reason,
+                    "locked_until": None,
+                    "updated_at": now,
+                    "finished_at": now,
+                    "expires_at": now + self.job_ttl
+                }
+            }
+        )
+        return result.modified_count
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        if not ObjectId.is_valid(job_id):
+            return None
+        return self.collection.find_one({"_id": ObjectId(job_id)})
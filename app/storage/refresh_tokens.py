@@ -0,0 +1,74 @@
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Tuple
+
+from pymongo import ReturnDocument
+from pymongo.collection import Collection
+
+
+STATUS_ROTATED = "rotated"
+STATUS_REUSED = "reused"
+STATUS_INVALID = "invalid"
+
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class RefreshTokenStore:
+    def __init__(self, collection: Collection, ttl_seconds: float):
+        self.collection = collection
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.collection.create_index("expires_at", expireAfterSeconds=0)
+        self.collection.create_index("family")
+        self.collection.create_index("admin_id")
+    
+    def issue(self, admin_id: str, family: Optional[str] = None) -> Tuple[str, str]:
+        token = secrets.token_urlsafe(32)
+        family = family or uuid.uuid4().hex
+        now = datetime.utcnow()
+        self.collection.insert_one({
+            "_id": token_digest(token),
+            "family": family,
+            "admin_id": admin_id,
+            "issued_at": now,
+            "used_at": None,
+            "revoked_at": None,
+            "expires_at": now + self.ttl
+        })
+        return token, family
+    
+    def rotate(self, token: str) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+        digest = token_digest(token)
+        now = datetime.utcnow()
+        record = self.collection.find_one_and_update(
+            {"_id": digest, "used_at": None, "revoked_at": None, "expires_at": {"$gt": now}},
+            {"$set": {"used_at": now}},
+            return_document=ReturnDocument.AFTER
+        )
+        if record is None:
+            existing = self.collection.find_one({"_id": digest})
+            if existing is not None and existing.get("used_at") is not None and existing.get("revoked_at") is None:
+                self.revoke_family(existing["family"])
+                return STATUS_REUSED, existing, None
+            return STATUS_INVALID, existing, None
+        
+        new_token, _ = self.issue(record["admin_id"], record["family"])
+        self.collection.update_one({"_id": digest}, {"$set": {"replaced_by": token_digest(new_token)}})
+        return STATUS_ROTATED, record, new_token
+    
+    def revoke_family(self, family: str) -> int:
+        result = self.collection.update_many(
+            {"family": family, "revoked_at": None},
+            {"$set": {"revoked_at": datetime.utcnow()}}
+        )
+        return result.modified_count
+    
+    def revoke_admin(self, admin_id: str) -> int:
+        result = self.collection.update_many(
+            {"admin_id": admin_id, "revoked_at": None},
+            {"$set": {"revoked_at": datetime.utcnow()}}
+        )
+        return result.modified_count
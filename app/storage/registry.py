@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import Dict, Any, Callable, Iterable, List, Optional, Set
+
+
+class CollectionRegistry:
+    def __init__(self, loader: Callable[[], Iterable[str]], max_age_seconds: float = 30.0):
+        self.loader = loader
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._names: Optional[Set[str]] = None
+        self._pending: Optional[Dict[str, bool]] = None
+        self._generation = 0
+        self._loaded_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+    
+    def is_stale(self) -> bool:
+        if self._names is None:
+            return True
+        return self.max_age_seconds > 0 and time.monotonic() - self._loaded_at > self.max_age_seconds
+    
+    def refresh(self) -> Set[str]:
+        with self._refresh_lock:
+            return self._load()
+    
+    def _load(self) -> Set[str]:
+        with self._lock:
+            self._pending = {}
+            generation = self._generation
+        try:
+            names = {name for name in self.loader() if name}
+            with self._lock:
+                for name, present in self._pending.items():
+                    if present:
+                        names.add(name)
+                    else:
+                        names.discard(name)
+                if generation == self._generation:
+                    self._names = names
+                    self._loaded_at = time.monotonic()
+                    self.refreshes += 1
+        finally:
+            with self._lock:
+                self._pending = None
+        return names
+    
+    def _refresh_in_background(self) -> None:
+        try:
+            self._load()
+        except Exception:
+            pass
+        finally:
+            self._refresh_lock.release()
+    
+    def _current(self) -> Set[str]:
+        names = self._names
+        if names is not None:
+            if self.is_stale() and self._refresh_lock.acquire(blocking=False):
+                threading.Thread(target=self._refresh_in_background, daemon=True).start()
+            return names
+        
+        with self._refresh_lock:
+            names = self._names
+            if names is None:
+                names = self._load()
+        return names
+    
+    def __contains__(self, name: str) -> bool:
+        found = name in self._current()
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return found
+    
+    def __len__(self) -> int:
+        return len(self._current())
+    
+    def names(self, prefix: str = "") -> List[str]:
+        names = self._current()
+        with self._lock:
+            return sorted(name for name in names if name.startswith(prefix))
+    
+    def add(self, name: str) -> None:
+        with self._lock:
+            if self._names is not None:
+                self._names.add(name)
+            if self._pending is not None:
+                self._pending[name] = True
+    
+    def discard(self, name: str) -> None:
+        with self._lock:
+            if self._names is not None:
+                self._names.discard(name)
+            if self._pending is not None:
+                self._pending[name] = False
+    
+    def invalidate(self) -> None:
+        with self._lock:
+            self._names = None
+            self._generation += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._names) if self._names is not None else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "age_seconds": round(time.monotonic() - self._loaded_at, 3) if self._names is not None else None
+        }
@@ -0,0 +1,183 @@
+import hashlib
+import math
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+
+from pymongo.collection import Collection
+
+
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (first + i * second) % self.size
+    
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class RevocationStore:
+    def __init__(
+        self,
+        collection: Collection,
+        token_ttl_seconds: float,
+        capacity: int = 100000,
+        error_rate: float = 0.001
+    ):
+        self.collection = collection
+        self.token_ttl = timedelta(seconds=token_ttl_seconds)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._filter = BloomFilter(capacity, error_rate)
+        self._admin_cutoffs: Dict[str, float] = {}
+        self._session_cutoffs: Dict[str, float] = {}
+        self._synced_through: Optional[datetime] = None
+        self._rebuilt_at: Optional[datetime] = None
+        self.collection.create_index("expires_at", expireAfterSeconds=0)
+        self.collection.create_index("revoked_at")
+    
+    def _apply(self, record: Dict[str, Any]) -> None:
+        if record["kind"] == "admin":
+            cutoff = record["cutoff"]
+            if cutoff > self._admin_cutoffs.get(record["admin_id"], 0.0):
+                self._admin_cutoffs[record["admin_id"]] = cutoff
+        elif record["kind"] == "session":
+            cutoff = record["cutoff"]
+            if cutoff > self._session_cutoffs.get(record["sid"], 0.0):
+                self._session_cutoffs[record["sid"]] = cutoff
+        else:
+            self._filter.add(record["_id"])
+    
+    def revoke_token(self, jti: str, admin_id: Optional[str], expires_at: datetime) -> None:
+        now = datetime.utcnow()
+        record = {
+            "_id": f"jti:{jti}",
+            "kind": "jti",
+            "admin_id": admin_id,
+            "revoked_at": now,
+            "expires_at": expires_at
+        }
+        self.collection.replace_one({"_id": record["_id"]}, record, upsert=True)
+        with self._lock:
+            self._apply(record)
+    
+    def revoke_admin(self, admin_id: str, cutoff: float) -> None:
+        now = datetime.utcnow()
+        record = {
+            "_id": f"admin:{admin_id}",
+            "kind": "admin",
+            "admin_id": admin_id,
+            "cutoff": cutoff,
+            "revoked_at": now,
+            "expires_at": now + self.token_ttl
+        }
+        self.collection.replace_one({"_id": record["_id"]}, record, upsert=True)
+        with self._lock:
+            self._apply(record)
+    
+    def revoke_session(self, sid: str, admin_id: Optional[str], cutoff: float) -> None:
+        now = datetime.utcnow()
+        record = {
+            "_id": f"sid:{sid}",
+            "kind": "session",
+            "sid": sid,
+            "admin_id": admin_id,
+            "cutoff": cutoff,
+            "revoked_at": now,
+            "expires_at": now + self.token_ttl
+        }
+        self.collection.replace_one({"_id": record["_id"]}, record, upsert=True)
+        with self._lock:
+            self._apply(record)
+    
+    def check(self, payload: Dict[str, Any]) -> str:
+        issued_at = payload.get("iat")
+        for cutoff in (
+            self._admin_cutoffs.get(str(payload.get("sub"))),
+            self._session_cutoffs.get(str(payload.get("sid")))
+        ):
+            if cutoff is not None and (issued_at is None or issued_at <= cutoff):
+                return "revoked"
+        
+        jti = payload.get("jti")
+        if not jti or f"jti:{jti}" not in self._filter:
+            return "clear"
+        if self.collection.find_one({"_id": f"jti:{jti}"}, {"_id": 1}) is None:
+            return "filter_hit"
+        return "revoked"
+    
+    def is_revoked(self, payload: Dict[str, Any]) -> bool:
+        return self.check(payload) == "revoked"
+    
+    def sync(self) -> int:
+        now = datetime.utcnow()
+        if (
+            self._rebuilt_at is None
+            or now - self._rebuilt_at > self.token_ttl
+            or self._filter.count > self._filter.capacity
+        ):
+            return self.rebuild()
+        
+        query = {"revoked_at": {"$gte": self._synced_through - SYNC_OVERLAP}}
+        records = list(self.collection.find(query))
+        with self._lock:
+            for record in records:
+                self._apply(record)
+            self._synced_through = now
+        return len(records)
+    
+    def rebuild(self) -> int:
+        now = datetime.utcnow()
+        records = list(self.collection.find({"expires_at": {"$gt": now}}))
+        capacity = self.capacity
+        while capacity < len(records) * 2:
+            capacity *= 2
+        revocations = BloomFilter(capacity, self.error_rate)
+        cutoffs: Dict[str, float] = {}
+        session_cutoffs: Dict[str, float] = {}
+        for record in records:
+            if record["kind"] == "admin":
+                cutoffs[record["admin_id"]] = max(record["cutoff"], cutoffs.get(record["admin_id"], 0.0))
+            elif record["kind"] == "session":
+                session_cutoffs[record["sid"]] = max(record["cutoff"], session_cutoffs.get(record["sid"], 0.0))
+            else:
+                revocations.add(record["_id"])
+        with self._lock:
+            self._filter = revocations
+            self._admin_cutoffs = cutoffs
+            self._session_cutoffs = session_cutoffs
+            self._synced_through = now
+            self._rebuilt_at = now
+        return len(records)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "filter_entries": self._filter.count,
+            "filter_capacity": self._filter.capacity,
+            "filter_bytes": len(self._filter._bits),
+            "filter_hashes": self._filter.hashes,
+            "admin_cutoffs": len(self._admin_cutoffs),
+            "session_cutoffs": len(self._session_cutoffs),
+            "synced_through": self._synced_through,
+            "rebuilt_at": self._rebuilt_at
+        }
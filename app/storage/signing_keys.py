@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+from typing import Dict, Any, List
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import jwk
+from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError
+
+
+EC_CURVES = {"ES256": ec.SECP256R1, "ES384": ec.SECP384R1, "ES512": ec.SECP521R1}
+RSA_ALGORITHMS = ("RS256", "RS384", "RS512")
+SUPPORTED_ALGORITHMS = (*EC_CURVES, *RSA_ALGORITHMS)
+
+
+def generate_signing_key(algorithm: str, kid: str, not_before: datetime, not_after: datetime) -> Dict[str, Any]:
+    if algorithm in EC_CURVES:
+        private_key = ec.generate_private_key(EC_CURVES[algorithm]())
+    elif algorithm in RSA_ALGORITHMS:
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        raise ValueError(f"Unsupported signing algorithm '{algorithm}'. Expected one of {', '.join(SUPPORTED_ALGORITHMS)}")
+    
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ).decode()
+    public_jwk = jwk.construct(private_pem, algorithm).public_key().to_dict()
+    public_jwk.update(kid=kid, alg=algorithm, use="sig")
+    return {
+        "_id": kid,
+        "algorithm": algorithm,
+        "private_key": private_pem,
+        "public_jwk": public_jwk,
+        "not_before": not_before,
+        "not_after": not_after
+    }
+
+
+class SigningKeyStore:
+    def __init__(
+        self,
+        collection: Collection,
+        algorithm: str,
+        rotation_seconds: float,
+        token_ttl_seconds: float
+    ):
+        if algorithm not in SUPPORTED_ALGORITHMS:
+            raise ValueError(f"Unsupported signing algorithm '{algorithm}'. Expected one of {', '.join(SUPPORTED_ALGORITHMS)}")
+        self.collection = collection
+        self.algorithm = algorithm
+        self.rotation = timedelta(seconds=rotation_seconds)
+        self.token_ttl = timedelta(seconds=token_ttl_seconds)
+        self.collection.create_index("expires_at", expireAfterSeconds=0)
+    
+    def epoch(self, moment: datetime) -> int:
+        return int((moment - datetime(1970, 1, 1)) / self.rotation)
+    
+    def ensure(self, epoch: int) -> None:
+        kid = f"{self.algorithm.lower()}-{epoch}"
+        if self.collection.find_one({"_id": kid}, {"_id": 1}) is not None:
+            return
+        not_before = datetime(1970, 1, 1) + self.rotation * epoch
+        key = generate_signing_key(self.algorithm, kid, not_before, not_before + self.rotation)
+        key["expires_at"] = key["not_after"] + self.token_ttl
+        try:
+            self.collection.insert_one(key)
+        except DuplicateKeyError:
+            pass
+    
+    def load(self) -> List[Dict[str, Any]]:
+        now = datetime.utcnow()
+        current = self.epoch(now)
+        self.ensure(current)
+        self.ensure(current + 1)
+        return list(
+            self.collection.find({"algorithm": self.algorithm, "expires_at": {"$gt": now}})
+            .sort("not_before", 1)
+        )
@@ -0,0 +1,3 @@
+from app.usage.accounting import QUOTA_FIELDS, UsageAccountant, usage_accountant
+
+__all__ = ["QUOTA_FIELDS", "UsageAccountant", "usage_accountant"]
@@ -0,0 +1,292 @@
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Tuple
+
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure, PyMongoError
+
+from app.config import settings
+from app.database import DatabaseManager, db_manager
+from app.monitoring.metrics import tenant_usage_samples_total
+
+
+QUOTA_FIELDS = ("max_documents", "max_bytes", "max_requests_per_minute")
+REQUEST_COUNT_TTL = timedelta(hours=1)
+
+
+def current_minute(now: Optional[float] = None) -> int:
+    return int((now if now is not None else time.time()) // 60)
+
+
+class UsageAccountant:
+    def __init__(
+        self,
+        db: DatabaseManager,
+        collection_name: str = settings.USAGE_COLLECTION,
+        requests_collection_name: str = settings.USAGE_REQUESTS_COLLECTION,
+        sample_interval: float = settings.USAGE_SAMPLE_INTERVAL_SECONDS,
+        tick: float = settings.USAGE_SAMPLER_TICK_SECONDS,
+        batch_size: int = settings.USAGE_SAMPLE_BATCH_SIZE,
+        flush_interval: float = settings.USAGE_FLUSH_INTERVAL_SECONDS,
+        cache_seconds: float = settings.USAGE_CACHE_SECONDS,
+        enabled: bool = settings.USAGE_ENABLED
+    ):
+        self.db = db
+        self.collection_name = collection_name
+        self.requests_collection_name = requests_collection_name
+        self.sample_interval = sample_interval
+        self.tick = tick
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.cache_seconds = cache_seconds
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, int], int] = {}
+        self._shared: Dict[Tuple[str, int], Tuple[float, int]] = {}
+        self._usage: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._collections: Optional[Tuple[Collection, Collection]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._seeded_at = 0.0
+        self._flushed_at = 0.0
+    
+    def _ensure_collections(self) -> Tuple[Collection, Collection]:
+        if self._collections is None:
+            master = self.db.get_master_db()
+            usage = master[self.collection_name]
+            usage.create_index("next_sample_at")
+            requests = master[self.requests_collection_name]
+            requests.create_index("expires_at", expireAfterSeconds=0)
+            self._collections = (usage, requests)
+        return self._collections
+    
+    @property
+    def collection(self) -> Collection:
+        return self._ensure_collections()[0]
+    
+    @property
+    def requests_collection(self) -> Collection:
+        return self._ensure_collections()[1]
+    
+    async def start(self) -> None:
+        if self.enabled and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.enabled:
+            try:
+                await asyncio.to_thread(self.flush_requests)
+            except PyMongoError:
+                pass
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception:
+                pass
+            await asyncio.sleep(self.tick)
+    
+    def run_once(self) -> int:
+        now = time.monotonic()
+        if now - self._seeded_at >= self.sample_interval:
+            self.seed()
+            self._seeded_at = now
+        if now - self._flushed_at >= self.flush_interval:
+            self.flush_requests()
+            self._flushed_at = now
+        return self.sample_due()
+    
+    def seed(self) -> int:
+        organizations = self.db.get_master_collection("organizations", "fast_read")
+        tenants = {
+            org["organization_name"]: org
+            for org in organizations.find({}, {"organization_name": 1, "collection_name": 1, "cluster": 1, "database_name": 1})
+        }
+        known = set(self.collection.distinct("_id"))
+        now = datetime.utcnow()
+        requests = [
+            UpdateOne(
+                {"_id": name},
+                {"$setOnInsert": {
+                    "collection_name": org["collection_name"],
+                    "cluster": org.get("cluster"),
+                    "database_name": org.get("database_name"),
+                    "next_sample_at": now + timedelta(seconds=random.uniform(0, self.sample_interval))
+                }},
+                upsert=True
+            )
+            for name, org in tenants.items() if name not in known
+        ]
+        if requests:
+            self.collection.bulk_write(requests, ordered=False)
+        stale = known - set(tenants)
+        if stale:
+            self.collection.delete_many({"_id": {"$in": list(stale)}})
+        return len(requests)
+    
+    def sample_due(self) -> int:
+        sampled = 0
+        while sampled < self.batch_size:
+            now = datetime.utcnow()
+            entry = self.collection.find_one_and_update(
+                {"next_sample_at": {"$lte": now}},
+                {"$set": {"next_sample_at": now + timedelta(seconds=self.sample_interval)}},
+                sort=[("next_sample_at", 1)],
+                return_document=ReturnDocument.AFTER
+            )
+            if entry is None:
+                break
+            self.sample(entry)
+            sampled += 1
+        return sampled
+    
+    def sample(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        database = self.db.get_tenant_db(entry.get("cluster"), entry.get("database_name"))
+        try:
+            stats = database.command("collStats", entry["collection_name"])
+        except OperationFailure:
+            stats = {}
+        except PyMongoError:
+            tenant_usage_samples_total.inc(outcome="failed")
+            raise
+        usage = {
+            "documents": stats.get("count", 0),
+            "size_bytes": stats.get("size", 0),
+            "storage_bytes": stats.get("storageSize", 0),
+            "index_bytes": stats.get("totalIndexSize", 0),
+            "sampled_at": datetime.utcnow()
+        }
+        self.collection.update_one({"_id": entry["_id"]}, {"$set": usage})
+        with self._lock:
+            self._usage[entry["_id"]] = (time.monotonic(), usage)
+        tenant_usage_samples_total.inc(outcome="sampled")
+        return usage
+    
+    def record_request(self, organization_name: str) -> None:
+        key = (organization_name, current_minute())
+        with self._lock:
+            self._pending[key] = self._pending.get(key, 0) + 1
+    
+    def flush_requests(self) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        
+        requests = []
+        for (name, minute), count in pending.items():
+            requests.append(UpdateOne(
+                {"_id": f"{name}|{minute}"},
+                {
+                    "$inc": {"count": count},
+                    "$setOnInsert": {
+                        "organization_name": name,
+                        "minute": minute,
+                        "expires_at": datetime.utcfromtimestamp(minute * 60) + REQUEST_COUNT_TTL
+                    }
+                },
+                upsert=True
+            ))
+        try:
+            self.requests_collection.bulk_write(requests, ordered=False)
+        except PyMongoError:
+            with self._lock:
+                for key, count in pending.items():
+                    self._pending[key] = self._pending.get(key, 0) + count
+            raise
+        
+        with self._lock:
+            for key, count in pending.items():
+                fetched_at, shared = self._shared.get(key, (time.monotonic(), 0))
+                self._shared[key] = (fetched_at, shared + count)
+        return sum(pending.values())
+    
+    def needs_refresh(self, organization_name: str) -> bool:
+        cached = self._shared.get((organization_name, current_minute()))
+        return cached is None or time.monotonic() - cached[0] >= self.flush_interval
+    
+    def requests_this_minute(self, organization_name: str) -> int:
+        minute = current_minute()
+        key = (organization_name, minute)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._shared.get(key)
+            local = self._pending.get(key, 0)
+        if cached is None or now - cached[0] >= self.flush_interval:
+            try:
+                doc = self.requests_collection.find_one({"_id": f"{organization_name}|{minute}"}, {"count": 1})
+            except PyMongoError:
+                doc = None
+            cached = (now, doc.get("count", 0) if doc else 0)
+            with self._lock:
+                self._shared = {k: v for k, v in self._shared.items() if k[1] >= minute}
+                self._shared[key] = cached
+        return cached[1] + local
+    
+    def usage(self, organization_name: str) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._usage.get(organization_name)
+        if cached is not None and now - cached[0] < self.cache_seconds:
+            return cached[1]
+        try:
+            doc = self.collection.find_one({"_id": organization_name}) or {}
+        except PyMongoError:
+            return cached[1] if cached is not None else {}
+        usage = {
+            "documents": doc.get("documents", 0),
+            "size_bytes": doc.get("size_bytes", 0),
+            "storage_bytes": doc.get("storage_bytes", 0),
+            "index_bytes": doc.get("index_bytes", 0),
+            "sampled_at": doc.get("sampled_at")
+        }
+        with self._lock:
+            self._usage[organization_name] = (now, usage)
+        return usage
+    
+    def quotas(self, organization_name: str) -> Dict[str, int]:
+        quotas = {
+            "max_documents": settings.QUOTA_MAX_DOCUMENTS,
+            "max_bytes": settings.QUOTA_MAX_BYTES,
+            "max_requests_per_minute": settings.QUOTA_MAX_REQUESTS_PER_MINUTE
+        }
+        quotas.update({
+            name: value for name, value in settings.QUOTA_OVERRIDES.get(organization_name, {}).items()
+            if name in QUOTA_FIELDS
+        })
+        return quotas
+    
+    def storage_quota_exceeded(self, organization_name: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        quotas = self.quotas(organization_name)
+        if not quotas["max_documents"] and not quotas["max_bytes"]:
+            return None
+        usage = self.usage(organization_name)
+        if quotas["max_documents"] and usage["documents"] >= quotas["max_documents"]:
+            return "documents"
+        if quotas["max_bytes"] and usage["size_bytes"] + usage["index_bytes"] >= quotas["max_bytes"]:
+            return "bytes"
+        return None
+    
+    def report(self, organization_name: str) -> Dict[str, Any]:
+        return {
+            "organization_name": organization_name,
+            **self.usage(organization_name),
+            "requests_this_minute": self.requests_this_minute(organization_name),
+            "quotas": self.quotas(organization_name)
+        }
+
+
+usage_accountant = UsageAccountant(db_manager)
@@ -1,7 +1,12 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Dict, Any
-from app.utils.security import decode_access_token
+from typing import Dict, Any, Optional
+from app.config import settings
+from app.utils.security import request_claims
+from app.services.revocation_service import revocation_service
+from app.usage import usage_accountant
+from app.monitoring.metrics import quota_rejections_total
+from app.monitoring.timing import timed_phase
 from app.database import get_db, DatabaseManager
 
 
@@ -9,11 +14,12 @@ security = HTTPBearer()
 
 
 async def get_current_admin(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: DatabaseManager = Depends(get_db)
 ) -> Dict[str, Any]:
-    token = credentials.credentials
-    payload = decode_access_token(token)
+    with timed_phase("jwt"):
+        payload = request_claims(request.scope)
     
     if payload is None:
         raise HTTPException(
@@ -22,6 +28,13 @@ async def get_current_admin(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    if revocation_service.is_revoked(payload):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
     admin_id = payload.get("sub")
     organization_id = payload.get("organization_id")
     organization_name = payload.get("organization_name")
@@ -34,11 +47,8 @@ async def get_current_admin(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    master_db = db.get_master_db()
-    admin_collection = master_db["admins"]
-    
     from bson import ObjectId
-    admin = admin_collection.find_one({"_id": ObjectId(admin_id)})
+    admin = db.get_master_collection("admins", "consistent_read").find_one({"_id": ObjectId(admin_id)})
     
     if not admin or not admin.get("is_active", True):
         raise HTTPException(
@@ -51,5 +61,37 @@ async def get_current_admin(
         "admin_id": admin_id,
         "organization_id": organization_id,
         "organization_name": organization_name,
-        "email": email
+        "email": email,
+        "jti": payload.get("jti"),
+        "exp": payload.get("exp"),
+        "sid": payload.get("sid")
     }
+
+
+def require_operator(current_admin: Dict[str, Any] = Depends(get_current_admin)) -> Dict[str, Any]:
+    if current_admin["admin_id"] not in settings.DIAGNOSTICS_OPERATOR_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Diagnostics are restricted to operators"
+        )
+    return current_admin
+
+
+def request_actor(request: Request, admin: Optional[Dict[str, Any]] = None, email: Optional[str] = None) -> Dict[str, Any]:
+    actor: Dict[str, Any] = {"ip": request.client.host if request.client else None}
+    if admin is not None:
+        actor["admin_id"] = admin.get("admin_id")
+        actor["email"] = admin.get("email")
+    if email is not None:
+        actor["email"] = email
+    return actor
+
+
+def enforce_storage_quota(current_admin: Dict[str, Any] = Depends(get_current_admin)) -> None:
+    exceeded = usage_accountant.storage_quota_exceeded(current_admin["organization_name"])
+    if exceeded:
+        quota_rejections_total.inc(quota=exceeded)
+        raise HTTPException(
+            status_code=status.HTTP_507_INSUFFICIENT_STORAGE,
+            detail=f"Organization {exceeded} quota exceeded"
+        )
@@ -0,0 +1,74 @@
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+from jose import jwk
+from jose.backends.base import Key
+
+
+UNKNOWN_KID_REFRESH_SECONDS = 1.0
+
+
+class KeySet:
+    def __init__(self, loader: Callable[[], List[Dict[str, Any]]], refresh_seconds: float = 60.0):
+        self.loader = loader
+        self.refresh_seconds = refresh_seconds
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._loaded_at = 0.0
+    
+    def refresh(self, force: bool = False) -> None:
+        if not force and time.monotonic() - self._loaded_at < self.refresh_seconds:
+            return
+        with self._lock:
+            if time.monotonic() - self._loaded_at < (UNKNOWN_KID_REFRESH_SECONDS if force else self.refresh_seconds):
+                return
+            keys: Dict[str, Dict[str, Any]] = {}
+            for doc in self.loader():
+                cached = self._keys.get(doc["_id"])
+                if cached is None:
+                    signing = jwk.construct(doc["private_key"], doc["algorithm"])
+                    cached = {
+                        "kid": doc["_id"],
+                        "algorithm": doc["algorithm"],
+                        "signing": signing,
+                        "verification": signing.public_key(),
+                        "public_jwk": doc["public_jwk"],
+                        "not_before": doc["not_before"],
+                        "not_after": doc["not_after"]
+                    }
+                keys[doc["_id"]] = cached
+            self._keys = keys
+            self._loaded_at = time.monotonic()
+    
+    def _current(self) -> Optional[Dict[str, Any]]:
+        now = datetime.utcnow()
+        active = [key for key in self._keys.values() if key["not_before"] <= now < key["not_after"]]
+        return max(active, key=lambda key: key["not_before"], default=None)
+    
+    def signing_key(self) -> Tuple[str, Key]:
+        self.refresh()
+        key = self._current()
+        if key is None:
+            self.refresh(force=True)
+            key = self._current()
+        if key is None:
+            raise RuntimeError("No active signing key is available")
+        return key["kid"], key["signing"]
+    
+    def verification_key(self, kid: Optional[str]) -> Optional[Tuple[str, Key]]:
+        if not kid:
+            return None
+        self.refresh()
+        key = self._keys.get(kid)
+        if key is None:
+            self.refresh(force=True)
+            key = self._keys.get(kid)
+        if key is None:
+            return None
+        return key["algorithm"], key["verification"]
+    
+    def jwks(self) -> Dict[str, Any]:
+        self.refresh()
+        return {"keys": [key["public_jwk"] for key in sorted(self._keys.values(), key=lambda key: key["not_before"])]}
@@ -1,21 +1,52 @@
+import time
+import uuid
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, MutableMapping
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 from app.config import settings
+from app.monitoring.metrics import bcrypt_duration_seconds
+from app.monitoring.timing import timed_phase
+from app.utils.keys import KeySet
+from app.utils.token_cache import ClaimsCache
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+key_set: Optional[KeySet] = None
+claims_cache: Optional[ClaimsCache] = ClaimsCache(settings.TOKEN_CACHE_SIZE) if settings.TOKEN_CACHE_ENABLED else None
+
+CLAIMS_STATE_KEY = "token_claims"
 
 
 def hash_password(password: str) -> str:
     if len(password.encode('utf-8')) > 72:
         password = password[:72]
-    return pwd_context.hash(password)
+    with timed_phase("bcrypt"), bcrypt_duration_seconds.time(operation="hash"):
+        return pwd_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    with timed_phase("bcrypt"), bcrypt_duration_seconds.time(operation="verify"):
+        return pwd_context.verify(plain_password, hashed_password)
+
+
+def uses_key_set() -> bool:
+    return not settings.ALGORITHM.startswith("HS")
+
+
+def get_key_set() -> KeySet:
+    global key_set
+    if key_set is None:
+        from app.database import db_manager
+        from app.storage.signing_keys import SigningKeyStore
+        store = SigningKeyStore(
+            db_manager.get_master_db()["signing_keys"],
+            algorithm=settings.ALGORITHM,
+            rotation_seconds=settings.SIGNING_KEY_ROTATION_SECONDS,
+            token_ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        )
+        key_set = KeySet(store.load, refresh_seconds=settings.SIGNING_KEY_CACHE_SECONDS)
+    return key_set
 
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -26,15 +57,54 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    to_encode.update({"exp": expire, "iat": time.time(), "jti": uuid.uuid4().hex})
+    if uses_key_set():
+        kid, key = get_key_set().signing_key()
+        encoded_jwt = jwt.encode(to_encode, key, algorithm=settings.ALGORITHM, headers={"kid": kid})
+    else:
+        encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     
     return encoded_jwt
 
 
-def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
+def verify_access_token(token: str) -> Optional[Dict[str, Any]]:
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
+        if not uses_key_set():
+            return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        
+        verification = get_key_set().verification_key(jwt.get_unverified_header(token).get("kid"))
+        if verification is None:
+            return None
+        algorithm, key = verification
+        return jwt.decode(token, key, algorithms=[algorithm])
     except JWTError:
         return None
+
+
+def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
+    cache = claims_cache
+    if cache is None:
+        return verify_access_token(token)
+    
+    payload = cache.get(token)
+    if payload is None:
+        payload = verify_access_token(token)
+        if payload is not None:
+            cache.put(token, payload)
+    return payload
+
+
+def request_claims(scope: MutableMapping[str, Any]) -> Optional[Dict[str, Any]]:
+    state = scope.setdefault("state", {})
+    if CLAIMS_STATE_KEY in state:
+        return state[CLAIMS_STATE_KEY]
+    
+    payload = None
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            authorization = value.decode("latin-1")
+            if authorization[:7].lower() == "bearer ":
+                payload = decode_access_token(authorization[7:].strip())
+            break
+    state[CLAIMS_STATE_KEY] = payload
+    return payload
@@ -0,0 +1,55 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from app.monitoring.metrics import token_cache_entries, token_cache_requests_total
+
+
+class ClaimsCache:
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+    
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        key = self.key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.time():
+                del self._entries[key]
+                entry = None
+                result = "expired"
+            elif entry is not None:
+                self._entries.move_to_end(key)
+                result = "hit"
+            else:
+                result = "miss"
+            size = len(self._entries)
+        token_cache_requests_total.inc(result=result)
+        if result == "expired":
+            token_cache_entries.set(size)
+        return dict(entry[1]) if entry is not None else None
+    
+    def put(self, token: str, claims: Dict[str, Any]) -> None:
+        expires_at = claims.get("exp")
+        if not isinstance(expires_at, (int, float)) or expires_at <= time.time():
+            return
+        key = self.key(token)
+        with self._lock:
+            self._entries[key] = (float(expires_at), dict(claims))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            size = len(self._entries)
+        token_cache_entries.set(size)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        token_cache_entries.set(0)
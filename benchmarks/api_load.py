@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.common import (
+    compare_results,
+    load_results,
+    print_table,
+    run_metadata,
+    summarize,
+    write_results
+)
+
+
+OPERATIONS = ["create", "login", "get", "update", "delete"]
+PASSWORD = "BenchPass123!"
+UPDATED_PASSWORD = "BenchPass456!"
+
+
+def use_backend(name: str) -> None:
+    from app.config import settings
+    from app.database import db_manager
+    from app.storage import MemoryBackend, MongoBackend
+
+    if name == "memory":
+        db_manager.set_backend(MemoryBackend())
+    elif name == "mongomock":
+        import mongomock
+        db_manager.set_backend(MongoBackend(settings.MONGODB_URL, client=mongomock.MongoClient()))
+    else:
+        db_manager.set_backend(MongoBackend(settings.MONGODB_URL))
+
+
+def set_rate_limiting(enabled: bool) -> None:
+    from app.config import settings
+    settings.RATE_LIMIT_ENABLED = enabled
+
+
+def set_bcrypt_rounds(rounds: int) -> None:
+    from app.utils.security import pwd_context
+    pwd_context.update(bcrypt__rounds=rounds)
+
+
+@asynccontextmanager
+async def in_process_lifespan():
+    from app.main import app
+    async with app.router.lifespan_context(app):
+        yield
+
+
+@asynccontextmanager
+async def in_process_client(concurrency: int):
+    from app.main import app
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        yield client
+
+
+@asynccontextmanager
+async def http_client(base_url: str, concurrency: int):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        yield client
+
+
+class Tenant:
+    def __init__(self, run_id: str, index: int):
+        self.name = f"Bench {run_id} {index}"
+        self.email = f"bench_{run_id}_{index}@example.com"
+        self.password = PASSWORD
+        self.token: Optional[str] = None
+
+
+def build_requests(tenant: Tenant) -> Dict[str, Tuple[str, str, Dict[str, Any], Tuple[int, ...]]]:
+    auth = {"Authorization": f"Bearer {tenant.token}"} if tenant.token else {}
+    return {
+        "create": ("POST", "/org/create", {"json": {
+            "organization_name": tenant.name,
+            "email": tenant.email,
+            "password": tenant.password
+        }}, (201, 202)),
+        "login": ("POST", "/admin/login", {"json": {
+            "email": tenant.email,
+            "password": tenant.password
+        }}, (200,)),
+        "get": ("GET", "/org/get", {"params": {"organization_name": tenant.name}}, (200,)),
+        "update": ("PUT", "/org/update", {"json": {
+            "organization_name": tenant.name,
+            "email": tenant.email,
+            "password": UPDATED_PASSWORD
+        }, "headers": auth}, (200,)),
+        "delete": ("DELETE", "/org/delete", {
+            "params": {"organization_name": tenant.name},
+            "headers": auth
+        }, (200,))
+    }
+
+
+async def run_phase(
+    client: httpx.AsyncClient,
+    operation: str,
+    tenants: List[Tenant],
+    concurrency: int,
+    on_success: Optional[Callable[[Tenant, httpx.Response], None]] = None
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors: List[str] = []
+    queue: asyncio.Queue = asyncio.Queue()
+    for tenant in tenants:
+        queue.put_nowait(tenant)
+
+    async def worker() -> None:
+        while True:
+            try:
+                tenant = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            method, path, kwargs, expected = build_requests(tenant)[operation]
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, **kwargs)
+            except httpx.HTTPError as e:
+                errors.append(f"{operation}: {e!r}")
+                continue
+            latencies.append(time.perf_counter() - started)
+            if response.status_code not in expected:
+                errors.append(f"{operation} {tenant.name}: {response.status_code} {response.text[:200]}")
+            elif on_success is not None:
+                on_success(tenant, response)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(tenants)))))
+    duration = time.perf_counter() - started
+
+    result = summarize(latencies, duration, errors=len(errors))
+    result["sample_errors"] = errors[:5]
+    return result
+
+
+def store_token(tenant: Tenant, response: httpx.Response) -> None:
+    tenant.token = response.json()["access_token"]
+
+
+def store_password(tenant: Tenant, response: httpx.Response) -> None:
+    tenant.password = UPDATED_PASSWORD
+
+
+async def run_level(
+    client_factory: Callable[[int], Awaitable],
+    concurrency: int,
+    orgs: int,
+    operations: List[str]
+) -> List[Dict[str, Any]]:
+    run_id = uuid.uuid4().hex[:8]
+    tenants = [Tenant(run_id, i) for i in range(orgs)]
+    callbacks = {"login": store_token, "update": store_password}
+    results = []
+
+    async with client_factory(concurrency) as client:
+        for operation in OPERATIONS:
+            if operation not in operations and operation not in ("create", "login", "delete"):
+                continue
+            result = await run_phase(client, operation, tenants, concurrency, callbacks.get(operation))
+            if operation in operations:
+                results.append({"concurrency": concurrency, "orgs": orgs, "operation": operation, **result})
+            for error in result["sample_errors"]:
+                print(f"  ! {error}")
+
+    return results
+
+
+async def run_all(
+    client_factory: Callable[[int], Awaitable],
+    lifespan: Callable[[], Awaitable],
+    levels: List[int],
+    orgs: int,
+    operations: List[str]
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    async with lifespan():
+        for concurrency in levels:
+            print(f"Running {orgs} orgs at concurrency {concurrency}...")
+            results.extend(await run_level(client_factory, concurrency, orgs, operations))
+    return results
+
+
+@asynccontextmanager
+async def no_lifespan():
+    yield
+
+
+def parse_int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the organization API and record latency percentiles")
+    parser.add_argument("--mode", choices=["inprocess", "http"], default="inprocess", help="Drive the ASGI app in-process or a running server over HTTP")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Server URL for --mode http")
+    parser.add_argument("--backend", choices=["memory", "mongomock", "mongo"], default="memory", help="Storage used for --mode inprocess")
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated concurrency levels")
+    parser.add_argument("--orgs", type=int, default=50, help="Organizations created per concurrency level")
+    parser.add_argument("--operations", default=",".join(OPERATIONS), help="Comma-separated operations to report")
+    parser.add_argument("--bcrypt-rounds", type=int, default=None, help="Override the bcrypt cost for new hashes (in-process only)")
+    parser.add_argument("--rate-limit", action="store_true", help="Keep the rate limiting middleware enabled (in-process only)")
+    parser.add_argument("--output", default=None, help="Write machine-readable results to this JSON file")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file to compare against")
+    parser.add_argument("--fail-threshold", type=float, default=None, help="Exit non-zero when p99 or throughput regresses by more than this percent")
+    args = parser.parse_args()
+
+    operations = [op for op in args.operations.split(",") if op]
+    unknown = set(operations) - set(OPERATIONS)
+    if unknown:
+        parser.error(f"Unknown operations: {', '.join(sorted(unknown))}")
+
+    if args.mode == "inprocess":
+        use_backend(args.backend)
+        set_rate_limiting(args.rate_limit)
+        if args.bcrypt_rounds is not None:
+            set_bcrypt_rounds(args.bcrypt_rounds)
+        client_factory = in_process_client
+        lifespan = in_process_lifespan
+    else:
+        client_factory = lambda concurrency: http_client(args.base_url, concurrency)
+        lifespan = no_lifespan
+
+    print(f"Mode: {args.mode}  Backend: {args.backend if args.mode == 'inprocess' else args.base_url}")
+    results = asyncio.run(run_all(
+        client_factory,
+        lifespan,
+        parse_int_list(args.concurrency),
+        args.orgs,
+        operations
+    ))
+
+    key_fields = ("concurrency", "orgs", "operation")
+    print_table(results, key_fields)
+
+    meta = run_metadata(
+        benchmark="api_load",
+        mode=args.mode,
+        backend=args.backend if args.mode == "inprocess" else args.base_url,
+        orgs=args.orgs,
+        bcrypt_rounds=args.bcrypt_rounds
+    )
+    if args.output:
+        write_results(args.output, meta, results)
+
+    failed = any(result["errors"] for result in results)
+    if args.compare:
+        if compare_results(load_results(args.compare), results, key_fields, args.fail_threshold):
+            print("Regression beyond threshold detected")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
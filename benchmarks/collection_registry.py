@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Any, Callable, List
+
+from app.config import settings
+from app.database import db_manager
+from benchmarks.api_load import use_backend
+from benchmarks.common import (
+    compare_results,
+    load_results,
+    print_table,
+    run_metadata,
+    summarize,
+    write_results
+)
+
+
+def provision(collections: int, run_id: str) -> List[str]:
+    organizations = db_manager.get_master_db()["organizations"]
+    names = []
+    batch = []
+    for index in range(collections):
+        organization_name = f"Bench {run_id} {index}"
+        collection_name = db_manager.create_organization_collection(organization_name)
+        names.append(collection_name)
+        batch.append({
+            "organization_name": organization_name,
+            "collection_name": collection_name,
+            "cluster": settings.DEFAULT_CLUSTER,
+            "database_name": db_manager.tenant_database_name(collection_name),
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+            "is_active": True
+        })
+        if len(batch) >= 1000:
+            organizations.insert_many(batch)
+            batch = []
+        if (index + 1) % 10000 == 0:
+            print(f"  {index + 1} collections")
+    if batch:
+        organizations.insert_many(batch)
+    return names
+
+
+def catalog_scan_exists(collection_name: str) -> bool:
+    return collection_name in db_manager.get_master_db().list_collection_names()
+
+
+def measure(check: Callable[[str], bool], names: List[str], iterations: int, expected: bool) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    started = time.perf_counter()
+    for name in random.choices(names, k=iterations):
+        check_started = time.perf_counter()
+        if check(name) != expected:
+            errors += 1
+        latencies.append(time.perf_counter() - check_started)
+    duration = time.perf_counter() - started
+    return summarize(latencies, duration, errors=errors)
+
+
+def cleanup(run_id: str) -> None:
+    organizations = db_manager.get_master_db()["organizations"]
+    query = {"organization_name": {"$regex": f"^Bench {run_id} "}}
+    for org in organizations.find(query, {"collection_name": 1, "cluster": 1, "database_name": 1}):
+        db_manager.delete_organization_collection(
+            org["collection_name"],
+            org.get("cluster"),
+            org.get("database_name")
+        )
+    organizations.delete_many(query)
+    db_manager.registry.invalidate()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare catalog scans with the collection registry for existence checks")
+    parser.add_argument("--backend", choices=["memory", "mongomock", "mongo"], default="memory", help="Storage to provision collections in")
+    parser.add_argument("--collections", type=int, default=50000, help="Tenant collections to provision")
+    parser.add_argument("--iterations", type=int, default=10000, help="Existence checks per registry case")
+    parser.add_argument("--scan-iterations", type=int, default=200, help="Existence checks for the catalog scan baseline")
+    parser.add_argument("--output", default=None, help="Write machine-readable results to this JSON file")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file to compare against")
+    parser.add_argument("--fail-threshold", type=float, default=None, help="Exit non-zero when p99 or throughput regresses by more than this percent")
+    args = parser.parse_args()
+
+    use_backend(args.backend)
+    run_id = uuid.uuid4().hex[:8]
+    print(f"Provisioning {args.collections} collections...")
+    names = provision(args.collections, run_id)
+    missing = [f"org_missing_{run_id}_{index}" for index in range(1000)]
+
+    try:
+        db_manager.registry.invalidate()
+        started = time.perf_counter()
+        db_manager.registry.refresh()
+        refresh = summarize([time.perf_counter() - started], time.perf_counter() - started)
+
+        cases = [
+            ("catalog_scan", catalog_scan_exists, names, args.scan_iterations, True),
+            ("registry_hit", db_manager.collection_exists, names, args.iterations, True),
+            ("registry_miss", db_manager.collection_exists, missing, args.iterations, False)
+        ]
+        results = [{"collections": args.collections, "check": "registry_refresh", **refresh}]
+        for check_name, check, candidates, iterations, expected in cases:
+            print(f"Running {check_name}...")
+            results.append({
+                "collections": args.collections,
+                "check": check_name,
+                **measure(check, candidates, iterations, expected)
+            })
+        registry_stats = db_manager.registry.stats()
+    finally:
+        cleanup(run_id)
+
+    key_fields = ("collections", "check")
+    print_table(results, key_fields)
+    print(f"\nRegistry: {registry_stats}")
+
+    if args.output:
+        meta = run_metadata(benchmark="collection_registry", backend=args.backend)
+        write_results(args.output, meta, results)
+
+    failed = any(result["errors"] for result in results)
+    if args.compare:
+        if compare_results(load_results(args.compare), results, key_fields, args.fail_threshold):
+            print("Regression beyond threshold detected")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import json
+import math
+import os
+import platform
+import sys
+from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(latencies: Iterable[float], duration: float, errors: int = 0) -> Dict[str, Any]:
+    values = sorted(latencies)
+    count = len(values)
+    return {
+        "requests": count,
+        "errors": errors,
+        "duration_s": round(duration, 4),
+        "throughput_rps": round(count / duration, 2) if duration > 0 else 0.0,
+        "latency_ms": {
+            "mean": round(sum(values) / count * 1000, 3) if count else 0.0,
+            "p50": round(percentile(values, 50) * 1000, 3),
+            "p95": round(percentile(values, 95) * 1000, 3),
+            "p99": round(percentile(values, 99) * 1000, 3),
+            "max": round(values[-1] * 1000, 3) if count else 0.0
+        }
+    }
+
+
+def run_metadata(**extra: Any) -> Dict[str, Any]:
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        **extra
+    }
+
+
+def write_results(path: str, meta: Dict[str, Any], results: List[Dict[str, Any]]) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+    print(f"Results written to {path}")
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def _result_key(result: Dict[str, Any], key_fields: Sequence[str]) -> Tuple:
+    return tuple(result.get(field) for field in key_fields)
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    results: List[Dict[str, Any]],
+    key_fields: Sequence[str],
+    threshold_pct: Optional[float] = None
+) -> bool:
+    previous = {_result_key(r, key_fields): r for r in baseline.get("results", [])}
+    regressed = False
+
+    print(f"\nComparison against baseline from {baseline.get('meta', {}).get('timestamp', 'unknown')}")
+    print(f"{'case':<40} {'p50 Δ%':>9} {'p99 Δ%':>9} {'rps Δ%':>9}")
+    for result in results:
+        key = _result_key(result, key_fields)
+        old = previous.get(key)
+        if old is None:
+            continue
+        deltas = []
+        for new_value, old_value in (
+            (result["latency_ms"]["p50"], old["latency_ms"]["p50"]),
+            (result["latency_ms"]["p99"], old["latency_ms"]["p99"]),
+            (result["throughput_rps"], old["throughput_rps"])
+        ):
+            deltas.append((new_value - old_value) / old_value * 100 if old_value else 0.0)
+        label = "/".join(str(part) for part in key)
+        print(f"{label:<40} {deltas[0]:>+9.1f} {deltas[1]:>+9.1f} {deltas[2]:>+9.1f}")
+        if threshold_pct is not None and (deltas[1] > threshold_pct or -deltas[2] > threshold_pct):
+            regressed = True
+
+    return regressed
+
+
+def print_table(results: List[Dict[str, Any]], key_fields: Sequence[str]) -> None:
+    widths = [max([14, *(len(str(result.get(field))) for result in results)]) for field in key_fields]
+    header = " ".join(f"{field:<{width}}" for field, width in zip(key_fields, widths))
+    print(f"\n{header} {'reqs':>7} {'errs':>5} {'rps':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for result in results:
+        key = " ".join(f"{str(result.get(field)):<{width}}" for field, width in zip(key_fields, widths))
+        latency = result["latency_ms"]
+        print(
+            f"{key} {result['requests']:>7} {result['errors']:>5} {result['throughput_rps']:>10.1f} "
+            f"{latency['p50']:>9.2f} {latency['p95']:>9.2f} {latency['p99']:>9.2f}"
+        )
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import gzip
+import itertools
+import json
+import re
+import time
+import uuid
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.api_load import (
+    PASSWORD,
+    Tenant,
+    http_client,
+    in_process_client,
+    in_process_lifespan,
+    no_lifespan,
+    set_bcrypt_rounds,
+    set_rate_limiting,
+    use_backend
+)
+from benchmarks.common import percentile, print_table, run_metadata, summarize, write_results
+
+
+SESSION_ROUTES = ("POST /admin/logout", "POST /admin/revoke-all")
+PATH_PARAMETER = re.compile(r"\{[^}]+\}")
+
+
+def load_capture(paths: List[str]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    headers: List[Dict[str, Any]] = []
+    records: List[Dict[str, Any]] = []
+    for path in paths:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt") as capture:
+            for line in capture:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if "v" in entry:
+                    headers.append(entry)
+                else:
+                    records.append(entry)
+    records.sort(key=lambda entry: entry["t"])
+    return headers, records
+
+
+class ReplayPlan:
+    def __init__(self, records: List[Dict[str, Any]], run_id: str):
+        self.records = records
+        self.run_id = run_id
+        self.counter = itertools.count()
+        self.tenants: Dict[str, Tenant] = {}
+        self.pool: List[Tenant] = []
+        self.sessions: Dict[int, Tenant] = {}
+        self.refresh_tokens: Dict[str, List[str]] = {}
+        for index, record in enumerate(records):
+            key = f"{record['m']} {record['r']}"
+            if key in SESSION_ROUTES:
+                self.sessions[index] = self.new_tenant()
+            elif record.get("o") and record["o"] not in self.tenants:
+                self.tenants[record["o"]] = self.new_tenant()
+        self.pool = list(self.tenants.values()) or [self.new_tenant()]
+        self.round_robin = itertools.cycle(self.pool)
+
+    def new_tenant(self) -> Tenant:
+        return Tenant(f"replay-{self.run_id}", next(self.counter))
+
+    def setup_tenants(self) -> List[Tenant]:
+        return [*self.pool, *self.sessions.values()]
+
+    def tenant_for(self, record: Dict[str, Any]) -> Tenant:
+        if record.get("o") in self.tenants:
+            return self.tenants[record["o"]]
+        return next(self.round_robin)
+
+    def build(self, index: int, record: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any], Optional[Callable]]:
+        method, route = record["m"], record["r"]
+        key = f"{method} {route}"
+        if route == "unmatched":
+            return method, "/replay/unmatched", {}, None
+
+        tenant = self.sessions.get(index) or self.tenant_for(record)
+        headers: Dict[str, str] = {}
+        if record.get("a"):
+            headers["Authorization"] = f"Bearer {tenant.token if record.get('o') or index in self.sessions else 'replay'}"
+        if record.get("k"):
+            headers["Idempotency-Key"] = f"{self.run_id}-{record['k']}"
+
+        if key == "POST /org/create":
+            fresh = self.new_tenant()
+            return method, route, {"headers": headers, "json": {
+                "organization_name": fresh.name,
+                "email": fresh.email,
+                "password": fresh.password
+            }}, None
+        if key == "POST /admin/login":
+            password = tenant.password if record.get("s", 200) < 400 else "wrong-password"
+            return method, route, {"headers": headers, "json": {"email": tenant.email, "password": password}}, None
+        if key == "POST /admin/refresh":
+            tokens = self.refresh_tokens.get(tenant.name) or []
+            token = tokens.pop() if tokens and record.get("s", 200) < 400 else "replay"
+
+            def keep(response: httpx.Response) -> None:
+                if response.status_code == 200:
+                    self.refresh_tokens.setdefault(tenant.name, []).append(response.json()["refresh_token"])
+
+            return method, route, {"headers": headers, "json": {"refresh_token": token}}, keep
+        if key == "PUT /org/update":
+            return method, route, {"headers": headers, "json": {
+                "organization_name": tenant.name,
+                "email": tenant.email,
+                "password": tenant.password
+            }}, None
+
+        params: Dict[str, Any] = {}
+        if route in ("/org/get", "/org/delete"):
+            params["organization_name"] = tenant.name if record.get("o") else f"Replay missing {index}"
+        return method, PATH_PARAMETER.sub("replay", route), {"headers": headers, "params": params}, None
+
+
+async def prepare(client: httpx.AsyncClient, plan: ReplayPlan, concurrency: int) -> List[str]:
+    errors: List[str] = []
+    queue: asyncio.Queue = asyncio.Queue()
+    for tenant in plan.setup_tenants():
+        queue.put_nowait(tenant)
+
+    async def worker() -> None:
+        while True:
+            try:
+                tenant = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            response = await client.post("/org/create", json={
+                "organization_name": tenant.name,
+                "email": tenant.email,
+                "password": PASSWORD
+            })
+            if response.status_code not in (201, 202):
+                errors.append(f"create {tenant.name}: {response.status_code} {response.text[:200]}")
+                continue
+            response = await client.post("/admin/login", json={"email": tenant.email, "password": PASSWORD})
+            if response.status_code != 200:
+                errors.append(f"login {tenant.name}: {response.status_code} {response.text[:200]}")
+                continue
+            tenant.token = response.json()["access_token"]
+            plan.refresh_tokens[tenant.name] = [response.json()["refresh_token"]]
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return errors
+
+
+async def replay_level(
+    client_factory: Callable[[int], Awaitable],
+    records: List[Dict[str, Any]],
+    speed: float,
+    max_in_flight: int
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    plan = ReplayPlan(records, uuid.uuid4().hex[:8])
+    span = (records[-1]["t"] - records[0]["t"]) / speed if len(records) > 1 else 0.0
+    latencies: Dict[str, List[float]] = {}
+    lags: List[float] = []
+    errors: Dict[str, int] = {}
+    mismatched: Dict[str, int] = {}
+    samples: List[str] = []
+
+    async with client_factory(max_in_flight) as client:
+        samples.extend(await prepare(client, plan, min(32, max_in_flight)))
+        in_flight = asyncio.Semaphore(max_in_flight)
+
+        async def issue(index: int, record: Dict[str, Any], scheduled: float) -> None:
+            label = f"{record['m']} {record['r']}"
+            method, path, kwargs, callback = plan.build(index, record)
+            started = time.perf_counter()
+            lags.append(started - scheduled)
+            try:
+                response = await client.request(method, path, **kwargs)
+            except httpx.HTTPError as e:
+                errors[label] = errors.get(label, 0) + 1
+                samples.append(f"{label}: {e!r}")
+                return
+            finally:
+                in_flight.release()
+            latencies.setdefault(label, []).append(time.perf_counter() - started)
+            if response.status_code >= 500:
+                errors[label] = errors.get(label, 0) + 1
+                samples.append(f"{label}: {response.status_code} {response.text[:200]}")
+            if response.status_code // 100 != record.get("s", response.status_code) // 100:
+                mismatched[label] = mismatched.get(label, 0) + 1
+            if callback is not None:
+                callback(response)
+
+        tasks = []
+        origin = records[0]["t"]
+        started = time.perf_counter()
+        for index, record in enumerate(records):
+            scheduled = started + (record["t"] - origin) / speed
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await in_flight.acquire()
+            tasks.append(asyncio.create_task(issue(index, record, scheduled)))
+        await asyncio.gather(*tasks)
+        duration = time.perf_counter() - started
+
+    offered = round(len(records) / span, 2) if span > 0 else 0.0
+    lags.sort()
+    overall = summarize(itertools.chain.from_iterable(latencies.values()), duration, errors=sum(errors.values()))
+    results = [{
+        "speed": speed,
+        "route": "overall",
+        "offered_rps": offered,
+        "mismatched": sum(mismatched.values()),
+        "lag_p99_ms": round(percentile(lags, 99) * 1000, 3),
+        **overall
+    }]
+    for label in sorted(latencies):
+        results.append({
+            "speed": speed,
+            "route": label,
+            "mismatched": mismatched.get(label, 0),
+            **summarize(latencies[label], duration, errors=errors.get(label, 0))
+        })
+    return results, samples
+
+
+def saturation_point(
+    overall: List[Dict[str, Any]],
+    min_ratio: float,
+    slo_p99_ms: float
+) -> Optional[Dict[str, Any]]:
+    for result in overall:
+        throttled = result["offered_rps"] and result["throughput_rps"] < result["offered_rps"] * min_ratio
+        if throttled or result["latency_ms"]["p99"] > slo_p99_ms:
+            return result
+    return None
+
+
+async def run_all(
+    client_factory: Callable[[int], Awaitable],
+    lifespan: Callable[[], Awaitable],
+    records: List[Dict[str, Any]],
+    speeds: List[float],
+    max_in_flight: int
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    async with lifespan():
+        for speed in speeds:
+            print(f"Replaying {len(records)} requests at {speed}x...")
+            level, samples = await replay_level(client_factory, records, speed, max_in_flight)
+            results.extend(level)
+            for sample in samples[:5]:
+                print(f"  ! {sample}")
+    return results
+
+
+def parse_float_list(value: str) -> List[float]:
+    return [float(part) for part in value.split(",") if part.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a captured traffic log at increasing speeds and find the saturation point")
+    parser.add_argument("captures", nargs="+", help="Capture files written by CaptureMiddleware (.jsonl or .jsonl.gz)")
+    parser.add_argument("--speeds", default="1,2,4,8", help="Comma-separated replay speed multipliers")
+    parser.add_argument("--limit", type=int, default=None, help="Replay only the first N captured requests")
+    parser.add_argument("--max-in-flight", type=int, default=256, help="Cap on concurrent requests before dispatch starts lagging")
+    parser.add_argument("--slo-p99-ms", type=float, default=500.0, help="p99 latency above which a speed counts as saturated")
+    parser.add_argument("--min-throughput-ratio", type=float, default=0.9, help="Achieved/offered throughput below which a speed counts as saturated")
+    parser.add_argument("--mode", choices=["inprocess", "http"], default="inprocess", help="Drive the ASGI app in-process or a running server over HTTP")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Server URL for --mode http")
+    parser.add_argument("--backend", choices=["memory", "mongomock", "mongo"], default="memory", help="Storage used for --mode inprocess")
+    parser.add_argument("--bcrypt-rounds", type=int, default=None, help="Override the bcrypt cost for new hashes (in-process only)")
+    parser.add_argument("--rate-limit", action="store_true", help="Keep the rate limiting middleware enabled (in-process only)")
+    parser.add_argument("--output", default=None, help="Write machine-readable results to this JSON file")
+    args = parser.parse_args()
+
+    headers, records = load_capture(args.captures)
+    if args.limit is not None:
+        records = records[:args.limit]
+    if not records:
+        parser.error("No captured requests found")
+    sample_rates = sorted({header.get("sample_rate") for header in headers})
+    print(
+        f"Loaded {len(records)} requests over {records[-1]['t'] - records[0]['t']:.1f}s "
+        f"from {len(headers)} capture(s), sample rate {', '.join(str(rate) for rate in sample_rates) or 'unknown'}"
+    )
+
+    if args.mode == "inprocess":
+        use_backend(args.backend)
+        set_rate_limiting(args.rate_limit)
+        if args.bcrypt_rounds is not None:
+            set_bcrypt_rounds(args.bcrypt_rounds)
+        client_factory = in_process_client
+        lifespan = in_process_lifespan
+    else:
+        client_factory = lambda concurrency: http_client(args.base_url, concurrency)
+        lifespan = no_lifespan
+
+    results = asyncio.run(run_all(
+        client_factory,
+        lifespan,
+        records,
+        parse_float_list(args.speeds),
+        args.max_in_flight
+    ))
+
+    print_table(results, ("speed", "route"))
+    overall = [result for result in results if result["route"] == "overall"]
+    print(f"\n{'speed':<8} {'offered rps':>12} {'achieved rps':>13} {'lag p99 ms':>11} {'mismatched':>11}")
+    for result in overall:
+        print(
+            f"{result['speed']:<8} {result['offered_rps']:>12.1f} {result['throughput_rps']:>13.1f} "
+            f"{result['lag_p99_ms']:>11.2f} {result['mismatched']:>11}"
+        )
+    saturated = saturation_point(overall, args.min_throughput_ratio, args.slo_p99_ms)
+    if saturated is None:
+        print(f"\nNo saturation up to {overall[-1]['speed']}x ({overall[-1]['throughput_rps']:.1f} rps)")
+    else:
+        print(f"\nSaturated at {saturated['speed']}x: offered {saturated['offered_rps']:.1f} rps, "
+              f"achieved {saturated['throughput_rps']:.1f} rps, p99 {saturated['latency_ms']['p99']:.1f} ms")
+
+    meta = run_metadata(
+        benchmark="replay",
+        captures=args.captures,
+        sample_rates=sample_rates,
+        mode=args.mode,
+        backend=args.backend if args.mode == "inprocess" else args.base_url,
+        bcrypt_rounds=args.bcrypt_rounds,
+        slo_p99_ms=args.slo_p99_ms,
+        min_throughput_ratio=args.min_throughput_ratio,
+        saturation_speed=saturated["speed"] if saturated else None
+    )
+    if args.output:
+        write_results(args.output, meta, results)
+
+    sys.exit(1 if any(result["errors"] for result in overall) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+
+from jose.constants import ALGORITHMS
+
+from app.config import settings
+from app.storage.signing_keys import generate_signing_key
+from app.utils import security
+from app.utils.keys import KeySet
+from app.utils.token_cache import ClaimsCache
+from benchmarks.common import print_table, run_metadata, summarize, write_results
+
+
+PASSWORD = "BenchPass123!"
+BASE_CLAIMS = {
+    "sub": "507f1f77bcf86cd799439012",
+    "email": "admin@example.com",
+    "organization_id": "507f1f77bcf86cd799439011",
+    "organization_name": "Benchmark Organization"
+}
+
+HMAC_SECRET = settings.SECRET_KEY
+
+_key_sets: Dict[str, KeySet] = {}
+
+
+def key_set_for(algorithm: str) -> KeySet:
+    if algorithm not in _key_sets:
+        now = datetime.utcnow()
+        key = generate_signing_key(algorithm, f"bench-{algorithm.lower()}", now - timedelta(days=1), now + timedelta(days=1))
+        _key_sets[algorithm] = KeySet(lambda: [key], refresh_seconds=float("inf"))
+    return _key_sets[algorithm]
+
+
+def claims_with_padding(payload_bytes: int) -> Dict[str, Any]:
+    claims = dict(BASE_CLAIMS)
+    if payload_bytes:
+        claims["pad"] = "x" * payload_bytes
+    return claims
+
+
+def configure(case: Dict[str, Any]) -> None:
+    security.pwd_context.update(bcrypt__rounds=case["rounds"])
+    settings.ALGORITHM = case["algorithm"]
+    settings.SECRET_KEY = HMAC_SECRET
+    if security.uses_key_set():
+        security.key_set = key_set_for(case["algorithm"])
+    security.claims_cache = ClaimsCache() if case.get("operation") == "decode_cached" else None
+
+
+def run_case(case: Dict[str, Any]) -> List[float]:
+    operation = case["operation"]
+    iterations = case["iterations"]
+    claims = claims_with_padding(case["payload_bytes"])
+    expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    latencies: List[float] = []
+
+    configure(case)
+    hashed = security.hash_password(PASSWORD) if operation in ("verify", "login") else ""
+    token = security.create_access_token(claims, expires) if operation in ("decode", "decode_cached") else ""
+
+    for _ in range(iterations):
+        started = time.perf_counter()
+        if operation == "hash":
+            security.hash_password(PASSWORD)
+        elif operation == "verify":
+            security.verify_password(PASSWORD, hashed)
+        elif operation == "create":
+            security.create_access_token(claims, expires)
+        elif operation in ("decode", "decode_cached"):
+            if security.decode_access_token(token) is None:
+                raise RuntimeError(f"Token failed to verify with {case['algorithm']}")
+        elif operation == "login":
+            security.verify_password(PASSWORD, hashed)
+            security.create_access_token(claims, expires)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def run_parallel(case: Dict[str, Any], workers: int) -> Tuple[List[float], float]:
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(run_case, [{**case, "iterations": 1}] * workers))
+        started = time.perf_counter()
+        chunks = list(pool.map(run_case, [case] * workers))
+        duration = time.perf_counter() - started
+    return [latency for chunk in chunks for latency in chunk], duration
+
+
+def measure(case: Dict[str, Any], workers: int) -> Dict[str, Any]:
+    if workers <= 1:
+        started = time.perf_counter()
+        latencies = run_case(case)
+        duration = time.perf_counter() - started
+    else:
+        latencies, duration = run_parallel(case, workers)
+
+    result = summarize(latencies, duration)
+    mean = sum(latencies) / len(latencies) if latencies else 0.0
+    result["rate_per_core"] = round(1 / mean, 2) if mean else 0.0
+    return result
+
+
+def build_cases(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    cases = []
+    for rounds in args.rounds:
+        for operation in ("hash", "verify"):
+            cases.append({
+                "operation": operation,
+                "rounds": rounds,
+                "algorithm": args.algorithms[0],
+                "payload_bytes": 0,
+                "iterations": args.bcrypt_iterations
+            })
+    for algorithm in args.algorithms:
+        for payload_bytes in args.payload_sizes:
+            for operation in ("create", "decode", "decode_cached"):
+                cases.append({
+                    "operation": operation,
+                    "rounds": args.rounds[0],
+                    "algorithm": algorithm,
+                    "payload_bytes": payload_bytes,
+                    "iterations": args.jwt_iterations
+                })
+    for rounds in args.rounds:
+        for algorithm in args.algorithms:
+            cases.append({
+                "operation": "login",
+                "rounds": rounds,
+                "algorithm": algorithm,
+                "payload_bytes": 0,
+                "iterations": args.bcrypt_iterations
+            })
+    return cases
+
+
+def token_size(algorithm: str, payload_bytes: int) -> int:
+    configure({"rounds": 4, "algorithm": algorithm})
+    claims = claims_with_padding(payload_bytes)
+    return len(security.create_access_token(claims, timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)))
+
+
+def recommend(results: List[Dict[str, Any]], target_p99_ms: float, workers: int) -> Tuple[Optional[int], Optional[str]]:
+    logins = [r for r in results if r["operation"] == "login" and r["workers"] == workers]
+    decodes = [r for r in results if r["operation"] == "decode" and r["workers"] == workers and r["payload_bytes"] == 0]
+
+    rounds = None
+    within_target = [r for r in logins if r["latency_ms"]["p99"] <= target_p99_ms]
+    if within_target:
+        rounds = max(r["rounds"] for r in within_target)
+
+    algorithm = None
+    if decodes:
+        algorithm = min(decodes, key=lambda r: r["latency_ms"]["p99"])["algorithm"]
+    return rounds, algorithm
+
+
+def parse_list(value: str, cast=str) -> List[Any]:
+    return [cast(part.strip()) for part in value.split(",") if part.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark password hashing and JWT primitives and recommend settings")
+    parser.add_argument("--rounds", default="10,11,12,13", help="Comma-separated bcrypt cost factors")
+    parser.add_argument("--algorithms", default="HS256,HS512,ES256,ES384,RS256,EdDSA", help="Comma-separated JWT algorithms")
+    parser.add_argument("--payload-sizes", default="0,256,1024,4096", help="Comma-separated extra claim sizes in bytes")
+    parser.add_argument("--workers", default="1,4", help="Comma-separated worker process counts")
+    parser.add_argument("--bcrypt-iterations", type=int, default=20, help="Iterations per worker for bcrypt cases")
+    parser.add_argument("--jwt-iterations", type=int, default=2000, help="Iterations per worker for JWT cases")
+    parser.add_argument("--target-p99-ms", type=float, default=250.0, help="Login p99 budget used for the bcrypt recommendation")
+    parser.add_argument("--output", default=None, help="Write machine-readable results to this JSON file")
+    args = parser.parse_args()
+
+    args.rounds = parse_list(args.rounds, int)
+    args.payload_sizes = parse_list(args.payload_sizes, int)
+    workers_levels = parse_list(args.workers, int)
+    algorithms = parse_list(args.algorithms)
+    args.algorithms = [a for a in algorithms if a in ALGORITHMS.SUPPORTED]
+    for skipped in sorted(set(algorithms) - set(args.algorithms)):
+        print(f"Skipping {skipped}: not supported by the installed JWT library (python-jose)")
+    if not args.algorithms:
+        parser.error("No supported JWT algorithms selected")
+
+    sizes = {
+        (algorithm, payload_bytes): token_size(algorithm, payload_bytes)
+        for algorithm in args.algorithms
+        for payload_bytes in args.payload_sizes
+    }
+
+    results: List[Dict[str, Any]] = []
+    for workers in workers_levels:
+        for case in build_cases(args):
+            print(f"  {case['operation']:<13} rounds={case['rounds']:<3} alg={case['algorithm']:<6} payload={case['payload_bytes']:<5} workers={workers}")
+            result = measure(case, workers)
+            results.append({
+                "operation": case["operation"],
+                "rounds": case["rounds"],
+                "algorithm": case["algorithm"],
+                "payload_bytes": case["payload_bytes"],
+                "token_bytes": sizes.get((case["algorithm"], case["payload_bytes"])),
+                "workers": workers,
+                **result
+            })
+
+    key_fields = ("operation", "rounds", "algorithm", "payload_bytes", "workers")
+    print_table(results, key_fields)
+
+    print("\nMaximum login rate per core (verify_password + create_access_token):")
+    for r in results:
+        if r["operation"] == "login":
+            print(f"  rounds={r['rounds']:<3} alg={r['algorithm']:<6} workers={r['workers']:<3} {r['rate_per_core']:>9.1f} logins/s/core")
+
+    print("\nToken verification rate per core (decode: signature check, decode_cached: repeat token served from the claims cache):")
+    for r in results:
+        if r["operation"] in ("decode", "decode_cached") and r["payload_bytes"] == 0:
+            print(f"  {r['operation']:<13} alg={r['algorithm']:<6} workers={r['workers']:<3} {r['rate_per_core']:>11.1f} verifications/s/core")
+
+    check_workers = max(workers_levels)
+    rounds, algorithm = recommend(results, args.target_p99_ms, check_workers)
+    print(f"\nRecommendation for login p99 <= {args.target_p99_ms}ms at {check_workers} worker(s):")
+    if rounds is None:
+        print(f"  No tested bcrypt cost meets the target; lowest tested is {min(args.rounds)}")
+    else:
+        print(f"  BCRYPT_ROUNDS={rounds}")
+    if algorithm is not None:
+        print(f"  ALGORITHM={algorithm}")
+
+    if args.output:
+        meta = run_metadata(
+            benchmark="security",
+            target_p99_ms=args.target_p99_ms,
+            recommended_bcrypt_rounds=rounds,
+            recommended_algorithm=algorithm
+        )
+        write_results(args.output, meta, results)
+
+
+if __name__ == "__main__":
+    main()
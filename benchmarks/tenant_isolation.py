@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Any, List
+
+from app.config import settings
+from app.database import db_manager
+from benchmarks.api_load import use_backend
+from benchmarks.common import (
+    compare_results,
+    load_results,
+    print_table,
+    run_metadata,
+    summarize,
+    write_results
+)
+
+
+MODES = ["collection", "database"]
+
+
+def provision(tenants: int, run_id: str) -> Dict[str, Any]:
+    organizations = db_manager.get_master_db()["organizations"]
+    latencies: List[float] = []
+
+    started = time.perf_counter()
+    for index in range(tenants):
+        organization_name = f"Bench {run_id} {settings.TENANT_ISOLATION} {index}"
+        tenant_started = time.perf_counter()
+        collection_name = db_manager.create_organization_collection(organization_name)
+        organizations.insert_one({
+            "organization_name": organization_name,
+            "collection_name": collection_name,
+            "cluster": settings.DEFAULT_CLUSTER,
+            "database_name": db_manager.tenant_database_name(collection_name),
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+            "is_active": True
+        })
+        latencies.append(time.perf_counter() - tenant_started)
+    duration = time.perf_counter() - started
+    return summarize(latencies, duration)
+
+
+def lookup(collection_names: List[str], lookups: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for collection_name in random.choices(collection_names, k=lookups):
+        lookup_started = time.perf_counter()
+        db_manager.get_organization_db(collection_name)[collection_name].find_one({})
+        latencies.append(time.perf_counter() - lookup_started)
+    duration = time.perf_counter() - started
+    return summarize(latencies, duration)
+
+
+def list_master(repeat: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        list_started = time.perf_counter()
+        db_manager.get_master_db().list_collection_names()
+        latencies.append(time.perf_counter() - list_started)
+    duration = time.perf_counter() - started
+    return summarize(latencies, duration)
+
+
+def cleanup(run_id: str) -> None:
+    organizations = db_manager.get_master_db()["organizations"]
+    query = {"organization_name": {"$regex": f"^Bench {run_id} "}}
+    for org in organizations.find(query):
+        db_manager.delete_organization_collection(
+            org["collection_name"],
+            org.get("cluster"),
+            org.get("database_name")
+        )
+    organizations.delete_many(query)
+
+
+def run_mode(mode: str, tenants: int, lookups: int) -> List[Dict[str, Any]]:
+    settings.TENANT_ISOLATION = mode
+    run_id = uuid.uuid4().hex[:8]
+    print(f"Provisioning {tenants} tenants with {mode} isolation...")
+    results = [{"mode": mode, "tenants": tenants, "operation": "provision", **provision(tenants, run_id)}]
+
+    organizations = db_manager.get_master_db()["organizations"]
+    collection_names = [
+        org["collection_name"]
+        for org in organizations.find({"organization_name": {"$regex": f"^Bench {run_id} "}}, {"collection_name": 1})
+    ]
+    results.append({"mode": mode, "tenants": tenants, "operation": "lookup", **lookup(collection_names, lookups)})
+    results.append({"mode": mode, "tenants": tenants, "operation": "list_master", **list_master(20)})
+
+    cleanup(run_id)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare collection-per-tenant and database-per-tenant isolation")
+    parser.add_argument("--backend", choices=["memory", "mongomock", "mongo"], default="memory", help="Storage to provision tenants in")
+    parser.add_argument("--modes", default=",".join(MODES), help="Comma-separated isolation modes to compare")
+    parser.add_argument("--tenants", type=int, default=10000, help="Tenants provisioned per mode")
+    parser.add_argument("--lookups", type=int, default=5000, help="Random tenant lookups per mode")
+    parser.add_argument("--output", default=None, help="Write machine-readable results to this JSON file")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file to compare against")
+    parser.add_argument("--fail-threshold", type=float, default=None, help="Exit non-zero when p99 or throughput regresses by more than this percent")
+    args = parser.parse_args()
+
+    modes = [mode for mode in args.modes.split(",") if mode]
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        parser.error(f"Unknown modes: {', '.join(sorted(unknown))}")
+
+    use_backend(args.backend)
+    original_isolation = settings.TENANT_ISOLATION
+    results: List[Dict[str, Any]] = []
+    try:
+        for mode in modes:
+            results.extend(run_mode(mode, args.tenants, args.lookups))
+    finally:
+        settings.TENANT_ISOLATION = original_isolation
+
+    key_fields = ("mode", "tenants", "operation")
+    print_table(results, key_fields)
+
+    if args.output:
+        meta = run_metadata(benchmark="tenant_isolation", backend=args.backend, lookups=args.lookups)
+        write_results(args.output, meta, results)
+
+    failed = False
+    if args.compare:
+        if compare_results(load_results(args.compare), results, key_fields, args.fail_threshold):
+            print("Regression beyond threshold detected")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
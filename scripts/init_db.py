@@ -4,77 +4,26 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import argparse
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, List, Optional
 from pymongo import MongoClient
 from pymongo.server_api import ServerApi
-from pymongo.errors import OperationFailure
+from pymongo.errors import CollectionInvalid, OperationFailure, PyMongoError
 from app.config import settings
+from app.database import ORG_COLLECTION_INDEXES
+from app.schemas.validators import organizations_schema, admins_schema, org_collection_schema
 
 
-def organizations_schema():
-    return {
-        "$jsonSchema": {
-            "bsonType": "object",
-            "required": [
-                "organization_name",
-                "collection_name",
-                "admin_email",
-                "admin_id",
-                "created_at",
-                "updated_at",
-                "is_active"
-            ],
-            "properties": {
-                "organization_name": {"bsonType": "string", "minLength": 1},
-                "collection_name": {"bsonType": "string", "minLength": 1},
-                "admin_email": {"bsonType": "string"},
-                "admin_id": {"bsonType": ["string", "objectId"]},
-                "created_at": {"bsonType": "date"},
-                "updated_at": {"bsonType": "date"},
-                "is_active": {"bsonType": "bool"}
-            }
-        }
-    }
-
-
-def admins_schema():
-    return {
-        "$jsonSchema": {
-            "bsonType": "object",
-            "required": [
-                "email",
-                "hashed_password",
-                "organization_name",
-                "created_at",
-                "updated_at",
-                "is_active"
-            ],
-            "properties": {
-                "email": {"bsonType": "string"},
-                "hashed_password": {"bsonType": "string"},
-                "organization_name": {"bsonType": "string"},
-                "organization_id": {"bsonType": ["string", "objectId"]},
-                "created_at": {"bsonType": "date"},
-                "updated_at": {"bsonType": "date"},
-                "is_active": {"bsonType": "bool"}
-            }
-        }
-    }
-
-
-def org_collection_schema():
-    return {
-        "$jsonSchema": {
-            "bsonType": "object",
-            "required": ["_type"],
-            "properties": {
-                "_type": {"bsonType": "string"}
-            }
-        }
-    }
+VALIDATION_OPTIONS = {"validationLevel": "strict", "validationAction": "error"}
 
 
 def ensure_collection_with_validator(db, name, validator):
-    if name in db.list_collection_names():
+    if name in db.list_collection_names(filter={"name": name}):
         try:
             db.command("collMod", name, validator=validator, validationLevel="strict", validationAction="error")
             print(f"Updated validator on '{name}'")
@@ -89,18 +38,181 @@ def sanitize_org_name(org_name: str) -> str:
     return f"org_{org_name.lower().replace(' ', '_').replace('-', '_')}"
 
 
+def connect(uri: str) -> MongoClient:
+    if "mongodb+srv://" in uri:
+        return MongoClient(uri, server_api=ServerApi('1'))
+    return MongoClient(uri)
+
+
+def rollout_id(validator: Dict[str, Any]) -> str:
+    spec = {"validator": validator, "options": VALIDATION_OPTIONS, "indexes": ORG_COLLECTION_INDEXES}
+    return hashlib.sha256(json.dumps(spec, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def index_key(keys) -> tuple:
+    if isinstance(keys, str):
+        return ((keys, 1),)
+    return tuple(tuple(key) for key in keys)
+
+
+def apply_org_collection(db, name: str, validator: Dict[str, Any]) -> str:
+    info = next(iter(db.list_collections(filter={"name": name})), None)
+    outcome = "skipped"
+    if info is None:
+        try:
+            db.create_collection(name, validator=validator, **VALIDATION_OPTIONS)
+            outcome = "created"
+        except CollectionInvalid:
+            info = next(iter(db.list_collections(filter={"name": name})), None)
+    
+    if info is not None:
+        options = info.get("options", {})
+        current = {
+            "validator": options.get("validator"),
+            "validationLevel": options.get("validationLevel", "strict"),
+            "validationAction": options.get("validationAction", "error")
+        }
+        if current != {"validator": validator, **VALIDATION_OPTIONS}:
+            db.command({"collMod": name, "validator": validator, **VALIDATION_OPTIONS})
+            outcome = "updated"
+    
+    existing = {tuple(tuple(key) for key in index["key"]) for index in db[name].index_information().values()}
+    for keys, options in ORG_COLLECTION_INDEXES:
+        if index_key(keys) not in existing:
+            db[name].create_index(keys, **options)
+            if outcome == "skipped":
+                outcome = "updated"
+    return outcome
+
+
+class FleetRollout:
+    def __init__(
+        self,
+        master_db,
+        clients: Dict[str, MongoClient],
+        validator: Dict[str, Any],
+        workers: int = 16,
+        batch_size: int = 500,
+        progress_every: float = 5.0
+    ):
+        self.master_db = master_db
+        self.clients = clients
+        self.validator = validator
+        self.workers = workers
+        self.batch_size = batch_size
+        self.progress_every = progress_every
+        self.rollout_id = rollout_id(validator)
+        self.checkpoints = master_db["schema_rollouts"]
+        self.counts = {"created": 0, "updated": 0, "skipped": 0, "failed": 0}
+        self.failures: List[str] = []
+        self._lock = threading.Lock()
+    
+    def checkpoint(self) -> Optional[Dict[str, Any]]:
+        return self.checkpoints.find_one({"_id": self.rollout_id})
+    
+    def save_checkpoint(self, last_id: Any, done: bool) -> None:
+        self.checkpoints.update_one(
+            {"_id": self.rollout_id},
+            {
+                "$set": {
+                    "last_id": last_id,
+                    "done": done,
+                    "counts": dict(self.counts),
+                    "updated_at": datetime.utcnow()
+                },
+                "$setOnInsert": {"started_at": datetime.utcnow()}
+            },
+            upsert=True
+        )
+    
+    def apply(self, org: Dict[str, Any]) -> None:
+        name = org["collection_name"]
+        cluster = org.get("cluster") or settings.DEFAULT_CLUSTER
+        try:
+            client = self.clients.get(cluster)
+            if client is None:
+                raise ValueError(f"cluster '{cluster}' is not configured")
+            outcome = apply_org_collection(client[org.get("database_name") or self.master_db.name], name, self.validator)
+        except (PyMongoError, ValueError) as e:
+            outcome = "failed"
+            with self._lock:
+                self.failures.append(f"{name}: {e}")
+        with self._lock:
+            self.counts[outcome] += 1
+    
+    def report(self, processed: int, total: int, started: float) -> None:
+        elapsed = time.monotonic() - started
+        rate = processed / elapsed if elapsed else 0.0
+        remaining = (total - processed) / rate if rate else 0.0
+        print(
+            f"  {processed}/{total} collections  "
+            f"created={self.counts['created']} updated={self.counts['updated']} "
+            f"skipped={self.counts['skipped']} failed={self.counts['failed']}  "
+            f"{rate:.1f}/s  eta {remaining:.0f}s"
+        )
+    
+    def run(self, resume: bool = True) -> Dict[str, int]:
+        query: Dict[str, Any] = {"collection_name": {"$exists": True}}
+        checkpoint = self.checkpoint() if resume else None
+        if checkpoint is not None and checkpoint.get("done"):
+            print(f"Rollout {self.rollout_id} already completed; use --restart to apply it again")
+            return checkpoint.get("counts", self.counts)
+        if checkpoint is not None and checkpoint.get("last_id") is not None:
+            query["_id"] = {"$gt": checkpoint["last_id"]}
+            print(f"Resuming rollout {self.rollout_id} after {checkpoint['last_id']}")
+        
+        organizations = self.master_db["organizations"]
+        total = organizations.count_documents(query)
+        print(f"Applying org collection validator to {total} collections with {self.workers} workers (rollout {self.rollout_id})")
+        
+        started = time.monotonic()
+        last_report = started
+        processed = 0
+        cursor = organizations.find(
+            query,
+            {"collection_name": 1, "cluster": 1, "database_name": 1}
+        ).sort("_id", 1).batch_size(self.batch_size)
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            batch: List[Dict[str, Any]] = []
+            for org in cursor:
+                batch.append(org)
+                if len(batch) < self.batch_size:
+                    continue
+                list(pool.map(self.apply, batch))
+                processed += len(batch)
+                self.save_checkpoint(batch[-1]["_id"], False)
+                batch = []
+                if time.monotonic() - last_report >= self.progress_every:
+                    self.report(processed, total, started)
+                    last_report = time.monotonic()
+            if batch:
+                list(pool.map(self.apply, batch))
+                processed += len(batch)
+                self.save_checkpoint(batch[-1]["_id"], False)
+        
+        self.save_checkpoint(None, not self.failures)
+        self.report(processed, total, started)
+        for failure in self.failures[:20]:
+            print(f"  failed {failure}")
+        if len(self.failures) > 20:
+            print(f"  ... and {len(self.failures) - 20} more failures")
+        return dict(self.counts)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Initialize MongoDB JSON Schema validators")
     parser.add_argument("--uri", default=settings.MONGODB_URL, help="MongoDB URI")
     parser.add_argument("--db", default=settings.MASTER_DB_NAME, help="Database name")
     parser.add_argument("--org", default=None, help="Organization name to (re)apply per-org validator")
+    parser.add_argument("--all-orgs", action="store_true", help="Apply the per-org validator and indexes to every organization collection")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent collections for --all-orgs")
+    parser.add_argument("--batch-size", type=int, default=500, help="Organizations per checkpoint for --all-orgs")
+    parser.add_argument("--restart", action="store_true", help="Ignore the saved --all-orgs checkpoint and start from the first organization")
     args = parser.parse_args()
 
     print(f"Connecting to MongoDB: {args.uri.split('@')[1] if '@' in args.uri else args.uri}")
-    if "mongodb+srv://" in args.uri:
-        client = MongoClient(args.uri, server_api=ServerApi('1'))
-    else:
-        client = MongoClient(args.uri)
+    client = connect(args.uri)
     
     try:
         client.admin.command('ping')
@@ -120,6 +232,16 @@ def main():
         ensure_collection_with_validator(db, col_name, org_collection_schema())
         print(f"Per-org collection ensured: {col_name}")
 
+    if args.all_orgs:
+        clients = {settings.DEFAULT_CLUSTER: client}
+        for name, url in settings.TENANT_CLUSTERS.items():
+            clients[name] = connect(url)
+        rollout = FleetRollout(db, clients, org_collection_schema(), args.workers, args.batch_size)
+        rollout.run(resume=not args.restart)
+        for name, cluster_client in clients.items():
+            if cluster_client is not client:
+                cluster_client.close()
+
     print("MongoDB schema initialization complete.")
 
 
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+from typing import Dict, Any
+from app.database import db_manager
+from app.migrations import MIGRATIONS, TENANT_COLLECTIONS, MigrationRunner, current_version
+
+
+def print_progress(target: str, stats: Dict[str, Any]) -> None:
+    print(
+        f"  {target:<40} scanned={stats['scanned']} migrated={stats['migrated']} "
+        f"batch={stats['batch_size']} latency={stats['latency_ms']}ms"
+    )
+
+
+def print_status(runner: MigrationRunner) -> None:
+    for migration in sorted(MIGRATIONS, key=lambda m: (m.collection, m.version)):
+        print(f"  {migration.collection:<15} v{migration.version:<4} {migration.description}")
+    for kind, count in runner.pending().items():
+        print(f"  {kind:<15} current v{current_version(kind)}, {count} documents pending")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Upgrade stored documents to the current schema_version in throttled batches")
+    parser.add_argument("--status", action="store_true", help="List migrations and pending document counts without writing")
+    parser.add_argument("--only", action="append", choices=["organizations", "admins", TENANT_COLLECTIONS], help="Limit the run to these collections (repeatable)")
+    parser.add_argument("--dry-run", action="store_true", help="Scan and count documents that would change without writing")
+    parser.add_argument("--restart", action="store_true", help="Ignore saved checkpoints and rescan from the first document")
+    parser.add_argument("--batch-size", type=int, default=None, help="Initial batch size")
+    parser.add_argument("--target-latency-ms", type=float, default=None, help="Batch latency above which the runner backs off")
+    args = parser.parse_args()
+
+    options = {}
+    if args.batch_size is not None:
+        options["batch_size"] = args.batch_size
+    if args.target_latency_ms is not None:
+        options["target_latency_ms"] = args.target_latency_ms
+    runner = MigrationRunner(db_manager, progress=print_progress, **options)
+
+    if args.status:
+        print_status(runner)
+        return
+
+    results = runner.run(args.only, dry_run=args.dry_run, restart=args.restart)
+    for target, stats in results.items():
+        if stats.get("skipped"):
+            print(f"{target}: already migrated")
+        else:
+            print(
+                f"{target}: {stats['migrated']} of {stats['scanned']} documents "
+                f"{'would change' if args.dry_run else 'migrated'} in {stats['batches']} batches"
+            )
+    db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
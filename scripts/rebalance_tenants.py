@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
+from typing import Optional
+from app.config import settings
+from app.database import db_manager
+
+
+def print_placement():
+    counts = db_manager.placement_counts()
+    for name in db_manager.cluster_names():
+        print(f"  {name:<20} {counts.get(name, 0):>8} orgs")
+    for name in sorted(set(counts) - set(db_manager.cluster_names())):
+        print(f"  {name:<20} {counts[name]:>8} orgs (not configured)")
+
+
+def move(org_name: str, target: Optional[str], batch_size: int, isolation: Optional[str] = None) -> bool:
+    try:
+        copied = db_manager.move_organization(org_name, target, batch_size, isolation)
+    except ValueError as e:
+        print(f"Skipping '{org_name}': {e}")
+        return False
+    destination = f"cluster '{target}'" if target else f"{isolation} isolation"
+    print(f"Moved '{org_name}' to {destination} ({copied} documents)")
+    return True
+
+
+def drain(cluster: str, batch_size: int) -> int:
+    db_manager.set_cluster_weight(cluster, 0.0)
+    print(f"Stored weight 0 for '{cluster}'; waiting {settings.CLUSTER_WEIGHTS_MAX_AGE_SECONDS:g}s for API workers to reload weights")
+    time.sleep(settings.CLUSTER_WEIGHTS_MAX_AGE_SECONDS)
+    organizations = db_manager.get_master_db()["organizations"]
+    moved = 0
+    while True:
+        orgs = list(organizations.find({"cluster": cluster}, {"organization_name": 1}))
+        if not orgs:
+            break
+        moved_this_pass = 0
+        for org in orgs:
+            target = db_manager.choose_cluster()
+            if target == cluster:
+                print("No other cluster accepts new tenants")
+                return moved
+            if move(org["organization_name"], target, batch_size):
+                moved_this_pass += 1
+        if not moved_this_pass:
+            print(f"{len(orgs)} organizations could not be moved off '{cluster}'")
+            break
+        moved += moved_this_pass
+    return moved
+
+
+def apply_isolation(isolation: str, batch_size: int) -> int:
+    orgs = db_manager.get_master_db()["organizations"].find({}, {"organization_name": 1})
+    return sum(
+        1 for org in list(orgs)
+        if move(org["organization_name"], None, batch_size, isolation)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and rebalance tenant placement across clusters and isolation modes")
+    parser.add_argument("--org", default=None, help="Organization name to move")
+    parser.add_argument("--to", default=None, help="Target cluster for --org")
+    parser.add_argument("--isolation", choices=["collection", "database"], default=None, help="Convert --org, or every organization, to this isolation mode")
+    parser.add_argument("--drain", default=None, help="Store a weight of 0 for this cluster, then move every organization off it")
+    parser.add_argument("--clear-weight", default=None, help="Remove the stored weight for this cluster so the configured weight applies again")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Documents copied per insert batch")
+    args = parser.parse_args()
+
+    if args.org and not (args.to or args.isolation):
+        parser.error("--org requires --to or --isolation")
+
+    print("Placement before:")
+    print_placement()
+
+    if args.org:
+        if not move(args.org, args.to, args.batch_size, args.isolation):
+            sys.exit(1)
+    elif args.isolation:
+        print(f"Converted {apply_isolation(args.isolation, args.batch_size)} organizations to {args.isolation} isolation")
+    elif args.drain:
+        print(f"Moved {drain(args.drain, args.batch_size)} organizations off '{args.drain}'")
+    elif args.clear_weight:
+        if not db_manager.clear_cluster_weight(args.clear_weight):
+            print(f"No stored weight for '{args.clear_weight}'")
+        return
+    else:
+        return
+
+    print("Placement after:")
+    print_placement()
+
+
+if __name__ == "__main__":
+    main()